@@ -0,0 +1,24 @@
+"""
+Fixtures for the extractor benchmarks: synthetic pages written once per
+session at each benchmark size.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sf_frame_extract.synthetic import write_synthetic_pages  # noqa: E402
+
+# Moves per page: about a real character, and a stress case
+PAGE_SIZES = {'80-moves': 80, '1000-moves': 1000}
+
+
+@pytest.fixture(scope='session', params=sorted(PAGE_SIZES))
+def page(request, tmp_path_factory):
+    """(size label, path) of a synthetic page carrying every source."""
+    output_dir = tmp_path_factory.mktemp(f"pages-{request.param}")
+    path, = write_synthetic_pages(str(output_dir), ['bench'], moves=PAGE_SIZES[request.param])
+    return request.param, path
@@ -0,0 +1,114 @@
+"""
+End-to-end checks of the CLI's incremental builds on synthetic pages: which
+runs rebuild a character and which skip it.
+
+    cd benchmarks && python -m pytest -q test_cli.py
+"""
+
+import json
+import os
+
+import pytest
+
+from sf_frame_extract.binary import binary_filename, load_character_binary
+from sf_frame_extract.cli import main
+from sf_frame_extract.constants import OUTPUT_SUFFIX
+from sf_frame_extract.frontend import LOADER_FILENAME
+from sf_frame_extract.synthetic import write_synthetic_pages
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    """(input dir holding a synthetic ken.html, empty output dir)."""
+    input_dir = str(tmp_path / 'html')
+    write_synthetic_pages(input_dir, ['ken'], moves=12)
+    return input_dir, str(tmp_path / 'out')
+
+
+def run(dirs, capsys, *flags):
+    """Run the CLI for ken and return whether it skipped ken as up to date."""
+    input_dir, output_dir = dirs
+    main(['--input-dir', input_dir, '--output-dir', output_dir, '--characters', 'ken', '--jobs', '1', *flags])
+    return 'All characters are up to date.' in capsys.readouterr().out
+
+
+def output_json(dirs):
+    with open(os.path.join(dirs[1], f"ken{OUTPUT_SUFFIX}"), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def first_move(dirs):
+    return output_json(dirs)['moves'][0]
+
+
+def binary_json(dirs):
+    return load_character_binary(os.path.join(dirs[1], binary_filename('ken'))).to_json()
+
+
+def test_unchanged_run_is_skipped(dirs, capsys):
+    assert not run(dirs, capsys)
+    assert run(dirs, capsys)
+
+
+@pytest.mark.parametrize('flags', [
+    ['--profile', 'flat'],
+    ['--profile', 'ryu'],
+    ['--strategy', 'auto'],
+    ['--minify'],
+])
+def test_output_options_change_rebuilds(dirs, capsys, flags):
+    assert not run(dirs, capsys)
+    assert not run(dirs, capsys, *flags)
+    assert run(dirs, capsys, *flags)
+    # And back again
+    assert not run(dirs, capsys)
+
+
+def test_profile_switch_rewrites_output(dirs, capsys):
+    run(dirs, capsys)
+    assert 'properties' in first_move(dirs)
+    run(dirs, capsys, '--profile', 'flat')
+    move = first_move(dirs)
+    assert 'properties' not in move and 'damage' in move
+
+
+def test_binary_copy_follows_json_edited_without_binary(dirs, capsys):
+    run(dirs, capsys, '--binary')
+    # The page changes and a run without --binary rewrites only the JSON
+    write_synthetic_pages(dirs[0], ['ken'], moves=12, seed=1)
+    assert not run(dirs, capsys)
+    assert binary_json(dirs) == output_json(dirs)
+    assert run(dirs, capsys, '--binary')
+    assert binary_json(dirs) == output_json(dirs)
+
+
+def test_stale_binary_copy_rewritten_on_skipped_run(dirs, capsys):
+    run(dirs, capsys, '--binary')
+    binary_file = os.path.join(dirs[1], binary_filename('ken'))
+    with open(binary_file, 'wb') as f:
+        f.write(b'stale')
+    assert run(dirs, capsys, '--binary')
+    assert binary_json(dirs) == output_json(dirs)
+    os.remove(binary_file)
+    assert run(dirs, capsys)
+    assert not os.path.exists(binary_file)
+    assert run(dirs, capsys, '--binary')
+    assert binary_json(dirs) == output_json(dirs)
+
+
+def test_loader_only_written_into_a_frontend_data_dir(tmp_path, capsys):
+    input_dir = str(tmp_path / 'html')
+    write_synthetic_pages(input_dir, ['ken'], moves=12)
+    plain_dir = tmp_path / 'out'
+    run((input_dir, str(plain_dir)), capsys)
+    assert not (plain_dir / LOADER_FILENAME).exists()
+
+    # A frontend checkout: src/types/frameData.ts beside src/data
+    types_dir = tmp_path / 'app' / 'src' / 'types'
+    types_dir.mkdir(parents=True)
+    (types_dir / 'frameData.ts').write_text('export interface Character {}\n', encoding='utf-8')
+    data_dir = tmp_path / 'app' / 'src' / 'data'
+    run((input_dir, str(data_dir)), capsys)
+    loader = (data_dir / LOADER_FILENAME).read_text(encoding='utf-8')
+    assert "from '../types/frameData';" in loader
+    assert "ken: () => import('./ken_frame_data_structured.json')," in loader
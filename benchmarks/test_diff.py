@@ -0,0 +1,112 @@
+"""
+Move-level changelog and JSON Patch of sf_frame_extract.diff: the patch
+must turn the old file into exactly the new one, whatever changed.
+
+    cd benchmarks && python -m pytest -q test_diff.py
+"""
+
+import copy
+import json
+import os
+import random
+
+import pytest
+
+from sf_frame_extract.diff import apply_json_patch, diff_character, json_patch
+
+RYU_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'src', 'data', 'ryu_frame_data_structured.json')
+
+
+@pytest.fixture(scope='module')
+def ryu():
+    with open(RYU_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def renumber(data):
+    """Positional ids, as the extractor assigns them."""
+    for index, move in enumerate(data['moves'], 1):
+        move['id'] = index
+    return data
+
+
+def new_move(data, name):
+    move = copy.deepcopy(data['moves'][0])
+    move['name'] = {**move['name'], 'japanese': name, 'japanese_base': name}
+    return move
+
+
+def assert_round_trip(old, new):
+    patch = json_patch(old, new)
+    assert apply_json_patch(old, patch) == new
+    return patch
+
+
+def test_unchanged_gives_empty_patch(ryu):
+    assert json_patch(ryu, copy.deepcopy(ryu)) == []
+
+
+def test_field_edit(ryu):
+    new = copy.deepcopy(ryu)
+    new['moves'][10]['frames']['startup'] = 99
+    patch = assert_round_trip(ryu, new)
+    assert patch == [{'op': 'replace', 'path': '/moves/10/frames/startup', 'value': 99}]
+    changed, = diff_character(ryu, new)['changed']
+    assert changed['fields'] == {'frames.startup': [ryu['moves'][10]['frames']['startup'], 99]}
+
+
+def test_insert_at_top_replaces_every_later_id(ryu):
+    new = copy.deepcopy(ryu)
+    new['moves'].insert(0, new_move(new, '新技'))
+    renumber(new)
+    patch = assert_round_trip(ryu, new)
+    # One add, plus one replace per shifted id
+    assert [operation['op'] for operation in patch].count('add') == 1
+    assert len(patch) == 1 + len(ryu['moves'])
+    changelog = diff_character(ryu, new)
+    assert changelog['added'] == [{'name': '新技', 'category': ryu['moves'][0]['category']['japanese']}]
+    assert changelog['changed'] == [] and changelog['removed'] == []
+
+
+def test_remove_and_reorder(ryu):
+    new = copy.deepcopy(ryu)
+    del new['moves'][3]
+    new['moves'].insert(0, new['moves'].pop(20))
+    assert_round_trip(ryu, new)
+    assert len(diff_character(ryu, new)['removed']) == 1
+
+
+def test_repeated_names_and_top_level_fields(ryu):
+    new = copy.deepcopy(ryu)
+    new['moves'].insert(5, copy.deepcopy(new['moves'][5]))
+    new['health'] = 9999
+    del new['character_name']
+    assert_round_trip(ryu, new)
+    assert diff_character(ryu, new)['fields']['health'] == [ryu['health'], 9999]
+
+
+def test_raw_moves_replaced_whole():
+    old = {'character': 'raw', 'moves': [{'name': 'a'}]}
+    new = {'character': 'raw', 'moves': [{'name': 'b'}, 1]}
+    assert assert_round_trip(old, new) == [{'op': 'add', 'path': '/moves', 'value': new['moves']}]
+
+
+@pytest.mark.parametrize('seed', range(25))
+def test_random_edits_round_trip(ryu, seed):
+    rng = random.Random(seed)
+    new = copy.deepcopy(ryu)
+    for step in range(rng.randint(1, 8)):
+        action = rng.choice(['insert', 'remove', 'move', 'edit', 'drop_field'])
+        moves = new['moves']
+        if action == 'insert':
+            moves.insert(rng.randrange(len(moves) + 1), new_move(new, f"技{seed}-{step}"))
+        elif action == 'remove' and moves:
+            del moves[rng.randrange(len(moves))]
+        elif action == 'move' and moves:
+            moves.insert(rng.randrange(len(moves)), moves.pop(rng.randrange(len(moves))))
+        elif action == 'edit' and moves:
+            rng.choice(moves)['frames']['recovery'] = rng.randint(0, 60)
+        elif action == 'drop_field' and moves:
+            rng.choice(moves).pop('sa_gain', None)
+    assert_round_trip(ryu, renumber(new) if seed % 2 else new)
@@ -0,0 +1,207 @@
+"""
+Per-stage throughput benchmarks for each extraction strategy on synthetic
+pages (see sf_frame_extract.synthetic).
+
+Stages are timed separately on inputs prepared outside the timed call:
+
+  read            raw page bytes from disk
+  parse           bytes -> DOM (per parser backend), or -> JSON for next-data
+  discover        finding the frame rows / table rows in the DOM
+  extract         rows -> move dicts
+  classify        category assignment (and typed values) for the moves
+  serialise       character data -> JSON file
+  scan            embedded JSON search in a large script bundle (bundle_script),
+                  with the frame data at its very end
+
+Every benchmark is grouped as "<strategy>-<page size>" and tagged with its
+stage in extra_info, so a saved run reads as one table per strategy.
+
+    cd benchmarks && python -m pytest -q
+    pytest-benchmark compare 0001 0002 --group-by=group
+"""
+
+import copy
+import os
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from sf_frame_extract.classify import categorize_moves  # noqa: E402
+from sf_frame_extract.extract import save_character_data  # noqa: E402
+from sf_frame_extract.html_parsing import PARSER_BACKENDS, parse_html  # noqa: E402
+from sf_frame_extract.rows import extract_moves_from_rows, find_frame_rows  # noqa: E402
+from sf_frame_extract.strategies import (  # noqa: E402
+    build_character_data, convert_table_to_moves, extract_next_data_fast, extract_table_rows, scan_embedded_json,
+)
+from sf_frame_extract.streaming import iter_moves  # noqa: E402
+from sf_frame_extract.synthetic import bundle_script  # noqa: E402
+
+
+def available_parsers():
+    parsers = []
+    for parser in PARSER_BACKENDS:
+        try:
+            parse_html('<table></table>', parser)
+        except Exception:
+            continue
+        parsers.append(parser)
+    return parsers
+
+
+PARSERS = available_parsers()
+
+
+def stage(benchmark, strategy, size, name):
+    benchmark.group = f"{strategy}-{size}"
+    benchmark.extra_info['strategy'] = strategy
+    benchmark.extra_info['stage'] = name
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def classify(moves):
+    return build_character_data('bench', copy.deepcopy(moves))
+
+
+def bench_classify(benchmark, moves):
+    """build_character_data adds typed values to the moves, so each round gets a fresh copy."""
+    return benchmark.pedantic(build_character_data, setup=lambda: (('bench', copy.deepcopy(moves)), {}),
+                              rounds=20)
+
+
+@pytest.fixture(scope='module')
+def css_stages(page):
+    """Output of every css stage for the page, parsed with the default backend."""
+    size, path = page
+    html = read_bytes(path).decode('utf-8')
+    soup = parse_html(html)
+    frame_rows = find_frame_rows(soup)
+    moves = extract_moves_from_rows(frame_rows)
+    return size, path, html, soup, frame_rows, moves
+
+
+@pytest.fixture(scope='module')
+def table_stages(page):
+    size, path = page
+    html = read_bytes(path).decode('utf-8')
+    soup = parse_html(html)
+    table_data = extract_table_rows(soup)
+    moves = convert_table_to_moves(table_data, 'bench')
+    return size, path, html, soup, table_data, moves
+
+
+# --- shared ---------------------------------------------------------------
+
+def test_read(benchmark, page):
+    size, path = page
+    stage(benchmark, 'all', size, 'read')
+    assert benchmark(read_bytes, path)
+
+
+# --- css ------------------------------------------------------------------
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_css_parse(benchmark, css_stages, parser):
+    size, _, html, *_ = css_stages
+    stage(benchmark, 'css', size, f'parse[{parser}]')
+    assert benchmark(parse_html, html, parser) is not None
+
+
+def test_css_discover(benchmark, css_stages):
+    size, _, _, soup, *_ = css_stages
+    stage(benchmark, 'css', size, 'discover')
+    assert benchmark(find_frame_rows, soup)
+
+
+def test_css_extract(benchmark, css_stages):
+    size, _, _, _, frame_rows, _ = css_stages
+    stage(benchmark, 'css', size, 'extract')
+    assert benchmark(extract_moves_from_rows, frame_rows)
+
+
+def test_css_classify(benchmark, css_stages):
+    size, *_, moves = css_stages
+    stage(benchmark, 'css', size, 'classify')
+    assert benchmark(categorize_moves, moves)
+
+
+def test_css_classify_typed(benchmark, css_stages):
+    size, *_, moves = css_stages
+    stage(benchmark, 'css', size, 'classify+typed')
+    assert bench_classify(benchmark, moves)['moves']
+
+
+def test_css_serialise(benchmark, css_stages, tmp_path):
+    size, *_, moves = css_stages
+    stage(benchmark, 'css', size, 'serialise')
+    character_data = classify(moves)
+    assert os.path.exists(benchmark(save_character_data, character_data, str(tmp_path)))
+
+
+# --- table ----------------------------------------------------------------
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_table_parse(benchmark, table_stages, parser):
+    size, _, html, *_ = table_stages
+    stage(benchmark, 'table', size, f'parse[{parser}]')
+    assert benchmark(parse_html, html, parser) is not None
+
+
+def test_table_discover(benchmark, table_stages):
+    size, _, _, soup, *_ = table_stages
+    stage(benchmark, 'table', size, 'discover')
+    assert benchmark(extract_table_rows, soup)
+
+
+def test_table_extract(benchmark, table_stages):
+    size, _, _, _, table_data, _ = table_stages
+    stage(benchmark, 'table', size, 'extract')
+    assert benchmark(convert_table_to_moves, table_data, 'bench')
+
+
+def test_table_classify(benchmark, table_stages):
+    size, *_, moves = table_stages
+    stage(benchmark, 'table', size, 'classify+typed')
+    assert bench_classify(benchmark, moves)['moves']
+
+
+def test_table_serialise(benchmark, table_stages, tmp_path):
+    size, *_, moves = table_stages
+    stage(benchmark, 'table', size, 'serialise')
+    assert os.path.exists(benchmark(save_character_data, classify(moves), str(tmp_path)))
+
+
+# --- next-data ------------------------------------------------------------
+
+def test_next_data_parse(benchmark, page, capsys):
+    size, path = page
+    stage(benchmark, 'next-data', size, 'parse')
+    raw_html = read_bytes(path)
+    assert benchmark(extract_next_data_fast, raw_html)['moves']
+
+
+def test_next_data_serialise(benchmark, page, tmp_path, capsys):
+    size, path = page
+    stage(benchmark, 'next-data', size, 'serialise')
+    json_data = extract_next_data_fast(read_bytes(path))
+    assert os.path.exists(benchmark(save_character_data, json_data, str(tmp_path)))
+
+
+@pytest.mark.parametrize('depth', [4, 12])
+def test_embedded_json_end_of_bundle(benchmark, depth):
+    # 2.4 MB bundle with the frame data after every nested "data" anchor
+    content = bundle_script('bench', moves=80, depth=depth)
+    stage(benchmark, 'embedded-json', f'2.4MB-bundle-depth-{depth}', 'scan')
+    assert benchmark(scan_embedded_json, content)['character'] == 'bench'
+
+
+# --- streaming (read, discovery and extraction fused) ---------------------
+
+def test_streaming_extract(benchmark, page):
+    size, path = page
+    stage(benchmark, 'streaming', size, 'read+parse+discover+extract')
+    assert benchmark(lambda: list(iter_moves(path)))
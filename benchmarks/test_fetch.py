@@ -0,0 +1,142 @@
+"""
+The fetch stage against a local stand-in for the official site
+(http.server on 127.0.0.1): plain downloads, conditional GETs with ETag and
+Last-Modified, errors and redirects.
+
+    cd benchmarks && python -m pytest -q test_fetch.py
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sf_frame_extract.fetch import FETCH_STATE_FILENAME, fetch_pages, load_fetch_state
+
+ETAG = '"v1"'
+LAST_MODIFIED = 'Wed, 01 Oct 2025 00:00:00 GMT'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves /<character>.html by name:
+      etag      200 with an ETag, 304 when If-None-Match matches
+      modified  200 with Last-Modified, 304 when If-Modified-Since matches
+      moved     301 to /etag.html (relative Location)
+      missing   404
+      broken    a header line longer than the reader's limit
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, status, body=b'', **headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name.replace('_', '-'), value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        name = self.path.strip('/')[:-len('.html')]
+        body = f'<html><body>{name} {self.server.version}</body></html>'.encode('utf-8')
+        if name == 'etag':
+            if self.headers.get('If-None-Match') == ETAG:
+                self.send_body(304, ETag=ETAG)
+            else:
+                self.send_body(200, body, ETag=ETAG)
+        elif name == 'modified':
+            if self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+                self.send_body(304, Last_Modified=LAST_MODIFIED)
+            else:
+                self.send_body(200, body, Last_Modified=LAST_MODIFIED)
+        elif name == 'moved':
+            self.send_body(301, Location='/etag.html')
+        elif name == 'broken':
+            self.send_body(200, body, X_Padding='x' * 200000)
+        else:
+            self.send_body(404, b'not found')
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    httpd.requests = []
+    httpd.version = 1
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def fetch(server, input_dir, *characters):
+    base_url = f"http://127.0.0.1:{server.server_port}/{{character}}.html"
+    results = fetch_pages(characters, str(input_dir), base_url, concurrency=4, rate=0, timeout=5)
+    return {result.character: result for result in results}
+
+
+def read_page(input_dir, character):
+    with open(os.path.join(input_dir, f"{character}.html"), 'rb') as f:
+        return f.read()
+
+
+def test_200_saves_page_and_validators(server, tmp_path):
+    result = fetch(server, tmp_path, 'etag')['etag']
+    assert result.status == 'updated'
+    assert result.size == len(read_page(tmp_path, 'etag'))
+    assert read_page(tmp_path, 'etag') == b'<html><body>etag 1</body></html>'
+    assert load_fetch_state(str(tmp_path))['pages']['etag']['etag'] == ETAG
+    assert os.path.exists(tmp_path / FETCH_STATE_FILENAME)
+
+
+@pytest.mark.parametrize('character, header, value', [
+    ('etag', 'If-None-Match', ETAG),
+    ('modified', 'If-Modified-Since', LAST_MODIFIED),
+])
+def test_304_leaves_saved_page_alone(server, tmp_path, character, header, value):
+    fetch(server, tmp_path, character)
+    saved = os.stat(tmp_path / f"{character}.html")
+    server.version = 2
+    result = fetch(server, tmp_path, character)[character]
+    assert result.status == 'unchanged'
+    assert server.requests[-1][1].get(header) == value
+    assert os.stat(tmp_path / f"{character}.html").st_mtime_ns == saved.st_mtime_ns
+    assert read_page(tmp_path, character).endswith(b' 1</body></html>')
+
+
+def test_page_replaced_by_hand_is_downloaded_again(server, tmp_path):
+    fetch(server, tmp_path, 'etag')
+    (tmp_path / 'etag.html').write_bytes(b'edited by hand')
+    result = fetch(server, tmp_path, 'etag')['etag']
+    assert result.status == 'updated'
+    assert 'If-None-Match' not in server.requests[-1][1]
+    assert read_page(tmp_path, 'etag') == b'<html><body>etag 1</body></html>'
+
+
+def test_404_fails_without_writing(server, tmp_path):
+    result = fetch(server, tmp_path, 'missing')['missing']
+    assert (result.status, result.error) == ('failed', 'HTTP 404')
+    assert not os.path.exists(tmp_path / 'missing.html')
+    assert 'missing' not in load_fetch_state(str(tmp_path))['pages']
+
+
+def test_redirect_is_followed(server, tmp_path):
+    result = fetch(server, tmp_path, 'moved')['moved']
+    assert result.status == 'updated'
+    assert [path for path, _ in server.requests] == ['/moved.html', '/etag.html']
+    assert read_page(tmp_path, 'moved') == b'<html><body>etag 1</body></html>'
+
+
+def test_one_bad_response_does_not_abort_the_batch(server, tmp_path):
+    results = fetch(server, tmp_path, 'etag', 'broken', 'missing', 'modified')
+    assert {character: result.status for character, result in results.items()} == {
+        'etag': 'updated', 'broken': 'failed', 'missing': 'failed', 'modified': 'updated'}
+    assert results['broken'].error
+    assert list(results) == ['etag', 'broken', 'missing', 'modified']
+    assert sorted(load_fetch_state(str(tmp_path))['pages']) == ['etag', 'modified']
@@ -0,0 +1,44 @@
+"""
+sf_frame_extract.model on the output of each move profile.
+
+    cd benchmarks && python -m pytest -q test_model.py
+"""
+
+import json
+import os
+
+import pytest
+
+from sf_frame_extract.cli import main
+from sf_frame_extract.constants import OUTPUT_SUFFIX
+from sf_frame_extract.model import Character, load_roster
+from sf_frame_extract.synthetic import write_synthetic_pages
+
+
+@pytest.fixture(scope='module', params=['roster', 'ryu', 'flat'])
+def output(request, tmp_path_factory):
+    """(output dir, ken's JSON data) for one profile."""
+    root = tmp_path_factory.mktemp(f"model-{request.param}")
+    input_dir, output_dir = str(root / 'html'), str(root / 'out')
+    write_synthetic_pages(input_dir, ['ken'], moves=12)
+    main(['--input-dir', input_dir, '--output-dir', output_dir, '--characters', 'ken', '--jobs', '1',
+          '--profile', request.param])
+    with open(os.path.join(output_dir, f"ken{OUTPUT_SUFFIX}"), encoding='utf-8') as f:
+        return output_dir, json.load(f)
+
+
+def test_property_cells_load(output):
+    _, data = output
+    character = Character.from_json(data)
+    for move, raw in zip(character.moves, data['moves']):
+        properties = raw.get('properties', raw)
+        assert (move.damage, move.cancel, move.attribute) == (
+            properties['damage'], properties['cancel'], properties['attribute'])
+        assert move.startup == raw['frames']['startup']
+
+
+def test_load_roster(output):
+    output_dir, data = output
+    roster = load_roster(output_dir)
+    assert list(roster) == ['ken']
+    assert len(roster['ken'].moves) == len(data['moves'])
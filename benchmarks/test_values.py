@@ -0,0 +1,66 @@
+"""
+The cell grammar of sf_frame_extract.values: clean_frame_value and the typed
+reading of each cell shape seen in the real data.
+
+    cd benchmarks && python -m pytest -q test_values.py
+"""
+
+import pytest
+
+from sf_frame_extract.values import FrameValue, clean_frame_value, parse_typed_value
+
+
+@pytest.mark.parametrize('cell, expected', [
+    ('', None),
+    ('-', None),
+    (' 12 ', 12),
+    ('-4', -4),
+    ('d', 'D'),
+    ('4-6', '4-6'),
+    ('着地後3', '着地後3'),
+])
+def test_clean_frame_value(cell, expected):
+    assert clean_frame_value(cell) == expected
+
+
+@pytest.mark.parametrize('cell, expected', [
+    (None, None),
+    ('', None),
+    ('-', None),
+    ('―', None),
+    (5, FrameValue('int', 5, 5)),
+    ('+4', FrameValue('int', 4, 4)),
+    ('-13', FrameValue('int', -13, -13)),
+    ('※21', FrameValue('int', 21, 21, note=True)),
+    ('2200※1850', FrameValue('int', 2200, 2200, note=True)),
+    ('[※1] 14', FrameValue('int', 14, 14, note=True)),
+    ('4-6', FrameValue('interval', 4, 6)),
+    ('-7～1', FrameValue('interval', -7, 1)),
+    ('2-4, 8-9', FrameValue('interval', 2, 9)),
+    ('2-22, 24-30', FrameValue('interval', 2, 30)),
+    ('1-11, 13-15', FrameValue('interval', 1, 15)),
+    ('6-366-11, 13-18, 20-25, 34-36', FrameValue('interval', 6, 36)),
+    ('4-134-6, 10-13', FrameValue('interval', 4, 13)),
+    ('D', FrameValue('knockdown')),
+    ('D+30', FrameValue('knockdown', 30, 30)),
+    ('全体 45', FrameValue('total', total=45)),
+    ('全体45', FrameValue('total', total=45)),
+    ('着地後3', FrameValue('landing', landing=3)),
+    ('26+着地後4', FrameValue('landing', 26, 26, 4)),
+    ('13-着地まで', FrameValue('landing', 13, None)),
+    ('空中ガード不能', FrameValue('text')),
+])
+def test_parse_typed_value(cell, expected):
+    assert parse_typed_value(cell) == expected
+
+
+def test_total_stays_out_of_low_high():
+    value = parse_typed_value('全体 45')
+    assert not value.is_numeric
+    assert value.to_json() == {'kind': 'total', 'low': None, 'high': None, 'total': 45}
+
+
+def test_to_json_round_trips():
+    for cell in ('26+着地後4', '※21', '全体 45', '6-366-11, 13-18'):
+        value = parse_typed_value(cell)
+        assert FrameValue(**value.to_json()) == value
@@ -0,0 +1,30 @@
+"""
+Street Fighter 6 frame data extraction.
+
+Turns saved pages from the official frame data site into the
+<character>_frame_data_structured.json files under src/data. Run it with
+``python -m sf_frame_extract``; see sf_frame_extract.cli for the options.
+"""
+
+from .binary import PackedCharacter, load_character_binary, load_roster_binary, save_character_binary
+from .classify import categorize_moves, determine_category, determine_move_type, determine_ryu_move_type
+from .constants import CATEGORY_MAPPINGS, CHARACTER_NAMES
+from .diff import apply_json_patch, diff_character, json_patch
+from .extract import extract_character_data, extract_from_html_file, inspect_html_structure, save_character_data
+from .frontend import render_character_loader, write_character_loader
+from .html_parsing import DEFAULT_PARSER, PARSER_BACKENDS, parse_html
+from .model import Category, Character, Move, load_roster
+from .publish import hashed_filename, load_publish_manifest, write_publish_manifest
+from .punish import PunishIndex, build_punish_index, load_punish_index, write_punish_index
+from .rows import DEFAULT_PROFILE, MOVE_PROFILES, extract_move_data_from_row, index_row_cells
+from .strategies import (
+    AUTO_STRATEGY_ORDER,
+    DEFAULT_STRATEGY,
+    STRATEGIES,
+    build_character_data,
+    extract_json_from_html,
+    extract_next_data_fast,
+    extract_table_data,
+)
+from .streaming import iter_moves, stream_character_data
+from .values import clean_frame_value
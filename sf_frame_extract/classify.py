@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Move categorisation shared by every extractor.
+
+Two rule sets exist because the shipped data was produced by two generations
+of the extractor:
+
+- the roster rules (categorize_moves) used for most characters, which assign
+  category and type after extraction, and
+- the Ryu-structure rules (determine_category / determine_ryu_move_type) used
+  for Ken and Chun-Li, which assign them per move at extraction time.
+
+Rules are plain data: for each decision ("category", "type") an ordered list
+of (label, keywords), where the first label with a keyword in the move name
+wins. Each rule set is compiled once at import into a single Aho-Corasick
+automaton, so a move name is scanned once no matter how many keywords the
+rules hold. Character-specific keywords are added with
+KeywordClassifier.extended().
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .constants import CATEGORY_MAPPINGS
+
+# Roster rules, checked in this order
+NORMAL_KEYWORDS = ('立ち', 'しゃがみ', 'ジャンプ')
+SUPER_ART_KEYWORDS = ('SA1', 'SA2', 'SA3', 'CA')
+THROW_KEYWORDS = ('投げ', 'スルー')
+SPECIAL_MOVE_KEYWORDS = ('弱', '中', '強', 'OD', '拳', '脚')
+
+# Ryu-structure rules, checked in this order
+RYU_SUPER_KEYWORDS = ('SA', 'CA', 'スーパーアーツ', 'クリティカルアーツ')
+RYU_THROW_KEYWORDS = ('投げ', '投', 'スルー', '掴み', '地獄車', '虎襲', '太極', '龍星')
+RYU_SYSTEM_KEYWORDS = ('ドライブ', 'パリィ', 'インパクト', 'ラッシュ', 'リバーサル', 'ジャスト')
+RYU_SPECIAL_KEYWORDS = ('昇龍', '波動', 'スピニング', '百裂', '竜巻', '鷹爪', '気功', '迅雷', '龍尾')
+RYU_UNIQUE_KEYWORDS = ('天空', '虎襲', '追突', '鶴脚', '追蹴', '天仰', '旋風', '千裂', '順体', '発勁', '水蓮', '翼旋', '垂直')
+RYU_SPECIAL_TYPE_KEYWORDS = ('昇龍', '波動', 'スピニング', '百裂', '竜巻', '鷹爪', '気功', '霞駆け')
+
+# A rule table: (label, keywords) in priority order, plus the label used when
+# nothing matches
+Rules = Sequence[Tuple[str, Sequence[str]]]
+
+ROSTER_CATEGORY_RULES = [
+    ('通常技', NORMAL_KEYWORDS),
+    ('スーパーアーツ', SUPER_ART_KEYWORDS),
+    ('通常投げ', THROW_KEYWORDS),
+    ('必殺技', SPECIAL_MOVE_KEYWORDS),
+]
+ROSTER_CATEGORY_DEFAULT = '特殊技'
+
+ROSTER_TYPE_RULES = [
+    ('standing_normal', ('立ち',)),
+    ('crouching_normal', ('しゃがみ',)),
+    ('jumping_normal', ('ジャンプ',)),
+    ('throw', ('投げ',)),
+]
+ROSTER_TYPE_DEFAULT = 'special_normal'
+
+# Move type for each roster category other than normals
+ROSTER_CATEGORY_TYPES = {
+    'スーパーアーツ': 'super_art',
+    '通常投げ': 'throw',
+    '必殺技': 'special_move',
+    '特殊技': 'special_normal',
+}
+
+RYU_CATEGORY_RULES = [
+    ('スーパーアーツ', RYU_SUPER_KEYWORDS),
+    ('通常投げ', RYU_THROW_KEYWORDS),
+    ('共通システム', RYU_SYSTEM_KEYWORDS),
+    ('必殺技', RYU_SPECIAL_KEYWORDS),
+    ('特殊技', RYU_UNIQUE_KEYWORDS),
+]
+RYU_CATEGORY_DEFAULT = '通常技'
+
+RYU_TYPE_RULES = [
+    ('drive_system', ('ドライブ', 'Drive', 'パリィ')),
+    ('super', ('SA', 'CA', 'スーパーアーツ')),
+    ('throw', ('投げ', '投', '掴み')),
+    ('special', RYU_SPECIAL_TYPE_KEYWORDS),
+    ('standing_normal', ('立ち', 'Stand')),
+    ('crouching_normal', ('しゃがみ', 'Crouch')),
+    ('jumping_normal', ('ジャンプ', 'Jump')),
+]
+RYU_TYPE_DEFAULT = 'unique'
+
+
+class KeywordClassifier:
+    """
+    Several prioritised keyword rule tables compiled into one Aho-Corasick
+    automaton. classify() walks the name once, collecting a bitmask of every
+    rule with a matching keyword, then picks the highest-priority label per
+    table.
+    """
+
+    __slots__ = ('tables', 'goto', 'output', 'rule_labels', 'table_masks')
+
+    def __init__(self, tables: Dict[str, Tuple[Rules, str]]):
+        # tables: name -> (rules, default label)
+        self.tables = {name: (list(rules), default) for name, (rules, default) in tables.items()}
+        self.rule_labels: List[str] = []
+        self.table_masks: Dict[str, Tuple[int, str]] = {}
+
+        keyword_rules: Dict[str, int] = {}
+        for name, (rules, default) in self.tables.items():
+            table_mask = 0
+            for label, keywords in rules:
+                bit = 1 << len(self.rule_labels)
+                self.rule_labels.append(label)
+                table_mask |= bit
+                for keyword in keywords:
+                    keyword_rules[keyword] = keyword_rules.get(keyword, 0) | bit
+            self.table_masks[name] = (table_mask, default)
+
+        self.goto, self.output = self._compile(keyword_rules)
+
+    @staticmethod
+    def _compile(keyword_rules: Dict[str, int]) -> Tuple[List[Dict[str, int]], List[int]]:
+        """Build the trie, then fold failure links into a full transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        output = [0]
+        for keyword, rule_bits in keyword_rules.items():
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(0)
+                state = next_state
+            output[state] |= rule_bits
+
+        # Breadth-first so every failure target is finished before it is used
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        trie_edges = [dict(edges) for edges in goto]
+        while queue:
+            state = queue.popleft()
+            output[state] |= output[fail[state]]
+            for char, next_state in trie_edges[state].items():
+                fail[next_state] = goto[fail[state]].get(char, 0)
+                queue.append(next_state)
+            # Missing transitions follow the failure link (already complete)
+            for char, fallback in goto[fail[state]].items():
+                goto[state].setdefault(char, fallback)
+        return goto, output
+
+    def matched_rules(self, move_name: str) -> int:
+        """Bitmask of every rule with at least one keyword in move_name."""
+        goto, output = self.goto, self.output
+        state = 0
+        matched = 0
+        for char in move_name:
+            state = goto[state].get(char, 0)
+            matched |= output[state]
+        return matched
+
+    def resolve(self, matched: int, table: str) -> str:
+        """Highest-priority label of table among the matched rules."""
+        table_mask, default = self.table_masks[table]
+        hits = matched & table_mask
+        if not hits:
+            return default
+        return self.rule_labels[(hits & -hits).bit_length() - 1]
+
+    def classify(self, move_name: str) -> Dict[str, str]:
+        """Label per table for move_name, from a single scan."""
+        matched = self.matched_rules(move_name)
+        return {table: self.resolve(matched, table) for table in self.table_masks}
+
+    def extended(self, table: str, label: str, keywords: Iterable[str]) -> 'KeywordClassifier':
+        """
+        A new classifier with extra keywords for one label, e.g. a character's
+        own special move names. Adding a label the table does not have yet
+        gives it the lowest priority.
+        """
+        keywords = tuple(keywords)
+        rules, default = self.tables[table]
+        if any(existing == label for existing, _ in rules):
+            rules = [(existing, tuple(existing_keywords) + keywords if existing == label else existing_keywords)
+                     for existing, existing_keywords in rules]
+        else:
+            rules = rules + [(label, keywords)]
+        tables = dict(self.tables)
+        tables[table] = (rules, default)
+        return KeywordClassifier(tables)
+
+
+ROSTER_CLASSIFIER = KeywordClassifier({
+    'category': (ROSTER_CATEGORY_RULES, ROSTER_CATEGORY_DEFAULT),
+    'type': (ROSTER_TYPE_RULES, ROSTER_TYPE_DEFAULT),
+})
+
+RYU_CLASSIFIER = KeywordClassifier({
+    'category': (RYU_CATEGORY_RULES, RYU_CATEGORY_DEFAULT),
+    'type': (RYU_TYPE_RULES, RYU_TYPE_DEFAULT),
+})
+
+
+def empty_categories() -> Dict[str, List[int]]:
+    return {category: [] for category in CATEGORY_MAPPINGS}
+
+
+def determine_move_type(move_name: str) -> str:
+    """Determine the move type based on the move name."""
+    return ROSTER_CLASSIFIER.resolve(ROSTER_CLASSIFIER.matched_rules(move_name), 'type')
+
+
+def categorize_moves(moves: List[Dict], classifier: Optional[KeywordClassifier] = None) -> Dict[str, List[int]]:
+    """Categorize moves and update their category information."""
+    classifier = classifier or ROSTER_CLASSIFIER
+    categories = empty_categories()
+
+    for move in moves:
+        labels = classifier.classify(move["name"]["japanese"])
+        category = labels['category']
+
+        categories[category].append(move["id"])
+        move["category"] = CATEGORY_MAPPINGS[category]
+        # Normals take their stance from the name; everything else from the category
+        move["type"] = labels['type'] if category == '通常技' else ROSTER_CATEGORY_TYPES[category]
+
+    return categories
+
+
+def classify_ryu_move(move_name: str, classifier: Optional[KeywordClassifier] = None) -> Tuple[Dict[str, str], str]:
+    """Category and type of a move (Ryu-structure rules) from a single scan."""
+    labels = (classifier or RYU_CLASSIFIER).classify(move_name)
+    return CATEGORY_MAPPINGS[labels['category']], labels['type']
+
+
+def determine_category(move_name: str) -> Dict[str, str]:
+    """Determine the category of a move based on its name (Ryu-structure rules)."""
+    return classify_ryu_move(move_name)[0]
+
+
+def determine_ryu_move_type(move_name: str) -> str:
+    """Determine the type of a move based on its name (Ryu-structure rules)."""
+    return classify_ryu_move(move_name)[1]
+
+
+def group_moves_by_category(moves: List[Dict]) -> Dict[str, List[int]]:
+    """Group move ids by the category already assigned to each move."""
+    categories = empty_categories()
+
+    for move in moves:
+        cat_japanese = move['category']['japanese']
+        if cat_japanese in categories:
+            categories[cat_japanese].append(move['id'])
+
+    return categories
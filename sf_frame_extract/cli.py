@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Command line entry point: python -m sf_frame_extract [options]
+
+Examples:
+  python -m sf_frame_extract --characters ken chunli --profile ryu
+  python -m sf_frame_extract --all --remaining --jobs 8
+  python -m sf_frame_extract --all --strategy auto --inspect
+  python -m sf_frame_extract --all --force --timing timing.json --cprofile profiles/
+  python -m sf_frame_extract --all --force --memory --max-rss 512
+  python -m sf_frame_extract --all --fetch --concurrency 8 --rate 4
+  python -m sf_frame_extract --all --watch --jobs 1
+  python -m sf_frame_extract --all --sqlite frames.sqlite
+"""
+
+import argparse
+import contextlib
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .binary import pack_json_directory, refresh_binary_copies
+from .constants import CHARACTER_NAMES, DEFAULT_INPUT_DIR, DEFAULT_OUTPUT_DIR, OUTPUT_SUFFIX
+from .extract import process_character
+from .fetch import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE,
+    DEFAULT_TIMEOUT,
+    fetch_pages,
+    print_fetch_results,
+)
+from .frontend import LOADER_FILENAME, has_frontend_types, write_character_loader
+from .html_parsing import DEFAULT_PARSER, PARSER_BACKENDS
+from .inspection import inspect_pages, print_inspection, write_inspection_report
+from .manifest import extractor_version, load_manifest, rebuild_reason, record_build, save_manifest
+from .publish import PUBLISH_MANIFEST_FILENAME, load_publish_manifest, write_publish_manifest
+from .punish import PUNISH_INDEX_FILENAME, write_punish_index
+from .rows import DEFAULT_PROFILE, MOVE_PROFILES
+from .strategies import DEFAULT_STRATEGY, STRATEGIES
+from .timing import build_timing_report, format_bytes, print_memory_summary, print_timing_summary, write_timing_report
+from .watch import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, watch_directory
+
+# Every module of the package feeds the extractor version in the build manifest
+EXTRACTOR_SOURCES = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py')))
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='sf_frame_extract',
+                                     description='Extract Street Fighter 6 frame data from saved HTML pages')
+    parser.add_argument('--input-dir', default=DEFAULT_INPUT_DIR,
+                        help='Directory containing HTML files')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR,
+                        help='Directory to save JSON files')
+    parser.add_argument('--characters', nargs='+', default=['ken', 'chunli'],
+                        help='Characters to process (default: ken, chunli)')
+    parser.add_argument('--all', action='store_true',
+                        help='Process every HTML file in the input directory')
+    parser.add_argument('--remaining', action='store_true',
+                        help='Like --all, but leave alone outputs that exist without a build manifest entry')
+    parser.add_argument('--fetch', action='store_true',
+                        help='Download the pages into the input directory first (conditional GETs; '
+                             '--all fetches the whole roster)')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL,
+                        help='Page URL template for --fetch, with a {character} placeholder '
+                             f'(default: {DEFAULT_BASE_URL})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Requests in flight with --fetch (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'Requests started per second with --fetch, 0 for no limit (default: {DEFAULT_RATE:g})')
+    parser.add_argument('--fetch-timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Seconds allowed per request with --fetch (default: {DEFAULT_TIMEOUT:g})')
+    parser.add_argument('--inspect', action='store_true',
+                        help='Inspect HTML structure without processing')
+    parser.add_argument('--inspect-report', metavar='FILE',
+                        help='With --inspect, also write one row per page to FILE (CSV, or TSV for .tsv)')
+    parser.add_argument('--strategy', choices=['auto'] + list(STRATEGIES), default=DEFAULT_STRATEGY,
+                        help=f'Extraction strategy; auto tries each in turn (default: {DEFAULT_STRATEGY})')
+    parser.add_argument('--profile', choices=list(MOVE_PROFILES), default=DEFAULT_PROFILE,
+                        help=f'Output structure for CSS-class rows (default: {DEFAULT_PROFILE})')
+    parser.add_argument('--streaming', action='store_true',
+                        help='Stream pages through html.parser without building a DOM (css strategy only)')
+    parser.add_argument('--binary', action='store_true',
+                        help='Also write a packed binary copy of each JSON file (see sf_frame_extract.binary); '
+                             'copies already written are kept in step with the JSON without it')
+    parser.add_argument('--pack-json', action='store_true',
+                        help='Write packed binary copies of the JSON files already in the output directory and exit')
+    parser.add_argument('--check-binary', action='store_true',
+                        help='Check the packed binary copies in the output directory against their JSON and exit')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=DEFAULT_PARSER,
+                        help=f'HTML parser backend (default: {DEFAULT_PARSER})')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: number of CPU cores)')
+    parser.add_argument('--minify', action='store_true',
+                        help='Write the JSON without indentation')
+    parser.add_argument('--precompress', action='store_true',
+                        help='Also write .gz and .br (needs brotli) copies of every output file for static hosting')
+    parser.add_argument('--sqlite', metavar='FILE',
+                        help='Also export the whole roster to the SQLite database FILE after each run')
+    parser.add_argument('--diff-dir', metavar='DIR',
+                        help='Write a move-level changelog and JSON Patch to DIR for every character whose output changed')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-extract every character, ignoring the build manifest')
+    # --profile already picks the output structure, so the timing report has its own flag
+    parser.add_argument('--timing', metavar='REPORT',
+                        help='Record wall/CPU time per character and stage and write a JSON report to REPORT')
+    parser.add_argument('--cprofile', metavar='DIR',
+                        help='Run each character under cProfile and write DIR/<character>.prof and .collapsed')
+    parser.add_argument('--memory', action='store_true',
+                        help='Trace allocations per character and stage with tracemalloc (slow); '
+                             'included in the --timing report')
+    parser.add_argument('--max-rss', type=int, metavar='MB',
+                        help='Fail characters whose worker peak RSS exceeds MB on a fresh worker, '
+                             'and replace workers that grow past it')
+    parser.add_argument('--watch', action='store_true',
+                        help='After the run, keep watching the input directory and re-extract pages as they change')
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                        help=f'With --watch, seconds of quiet before a burst of changes is processed '
+                             f'(default: {DEFAULT_DEBOUNCE:g})')
+    parser.add_argument('--poll', action='store_true',
+                        help='With --watch, poll the input directory instead of using inotify')
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f'Seconds between directory scans when polling (default: {DEFAULT_POLL_INTERVAL:g})')
+    return parser
+
+
+def list_html_characters(input_dir: str) -> List[str]:
+    return sorted(file.replace('.html', '') for file in os.listdir(input_dir) if file.endswith('.html'))
+
+
+def run_batch(characters: Sequence[str], jobs: int, task_args: Tuple,
+              max_rss: Optional[int] = None) -> Iterator[Tuple]:
+    """
+    Yield process_character(character, *task_args) results in input order,
+    in-process for one job and in a worker pool otherwise. With max_rss
+    (bytes) the work always runs in a pool: a character that takes a fresh
+    worker over the limit fails before its output is written, and once a
+    worker reports a peak RSS over the limit the pool is replaced by a fresh
+    one for every character not started yet. Characters that finished on the
+    recycled worker keep their results.
+    """
+    if max_rss is None:
+        with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext() as executor:
+            # map() yields in submission order, so logs and the summary stay deterministic
+            run = executor.map if executor else map
+            yield from run(process_character, characters, *(repeat(arg) for arg in task_args))
+        return
+
+    pending = list(characters)
+    while pending:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [(character, executor.submit(process_character, character, *task_args, max_rss=max_rss))
+                       for character in pending]
+            pending = []
+            peak_rss = None
+            for character, future in futures:
+                if future.cancelled():
+                    continue
+                result = future.result()
+                rss = result[3]['max_rss']
+                if peak_rss is None and rss is not None and rss > max_rss:
+                    # Everything not yet handed to a worker goes to the next pool
+                    peak_rss = rss
+                    pending = [queued for queued, queued_future in futures if queued_future.cancel()]
+                yield result
+            if pending:
+                print(f"\nWorker peak RSS {format_bytes(peak_rss)} is over --max-rss; "
+                      f"starting fresh workers for {len(pending)} character(s)")
+
+
+def output_options(args: argparse.Namespace) -> str:
+    """The flags that change what an output file contains, as recorded in the build manifest."""
+    options = [f"strategy={args.strategy}", f"profile={args.profile}"]
+    if args.minify:
+        options.append('minify')
+    return ','.join(options)
+
+
+def select_stale_characters(characters: List[str], input_dir: str, output_dir: str, manifest: dict,
+                            version: str, force: bool, keep_unmanaged: bool, options: str = '') -> List[str]:
+    """
+    Characters that need extracting: anything new, plus anything in the build
+    manifest whose input, extractor, output options or output hash no longer
+    matches. With
+    keep_unmanaged, outputs that exist without a manifest entry came from
+    another extractor and are left alone.
+    """
+    stale = []
+    up_to_date = []
+    for character in characters:
+        html_file = os.path.join(input_dir, f"{character}.html")
+        if force or not os.path.exists(html_file):
+            # Missing inputs are reported by the worker
+            stale.append(character)
+            continue
+        if (keep_unmanaged and character not in manifest['characters']
+                and os.path.exists(os.path.join(output_dir, f"{character}{OUTPUT_SUFFIX}"))):
+            continue
+        reason = rebuild_reason(manifest, character, html_file, output_dir, version, options)
+        if reason:
+            print(f"  {character}: {reason}")
+            stale.append(character)
+        else:
+            up_to_date.append(character)
+
+    if up_to_date:
+        print(f"Up to date, skipping {len(up_to_date)} character(s): {', '.join(up_to_date)}")
+    return stale
+
+
+def write_indexes(args: argparse.Namespace) -> None:
+    """
+    Rebuild the punish index, then the data manifest (and compressed copies)
+    covering it, then the frontend loader from the manifest, and with
+    --sqlite the SQLite export.
+    """
+    print(f"Punish index written to: {write_punish_index(args.output_dir)}")
+    manifest_file = write_publish_manifest(args.output_dir, args.precompress)
+    print(f"Data manifest written to: {manifest_file}")
+    loader_file = write_character_loader(args.output_dir, load_publish_manifest(args.output_dir))
+    if loader_file:
+        print(f"Frontend loader written to: {loader_file}")
+    if args.sqlite:
+        # Imported here so sqlite3 is only loaded for --sqlite runs
+        from .database import write_database
+        print(f"SQLite export written to: {write_database(args.output_dir, args.sqlite)}")
+
+
+def extract_characters(characters: Sequence[str], jobs: int, task_args: Tuple, max_rss: Optional[int],
+                       manifest: dict, version: str, args: argparse.Namespace) -> Tuple[List[str], Dict[str, Dict]]:
+    """
+    Extract characters with run_batch, printing each log in input order and
+    recording every success in the build manifest.
+    Returns (failed characters, stats per character).
+    """
+    failed_characters = []
+    character_stats = {}
+    results = run_batch(characters, jobs, task_args, max_rss)
+    for index, (character, output_file, log, stats) in enumerate(results, 1):
+        print(f"\n{'='*50}")
+        print(f"Processing {character} ({index}/{len(characters)})")
+        print(f"{'='*50}")
+        print(log, end='')
+        character_stats[character] = stats
+        if output_file:
+            record_build(manifest, character, os.path.join(args.input_dir, f"{character}.html"),
+                         output_file, version, output_options(args))
+            save_manifest(manifest, args.output_dir)
+        else:
+            failed_characters.append(character)
+    return failed_characters, character_stats
+
+
+def watch_input_dir(args: argparse.Namespace, watched: Optional[Sequence[str]], manifest: dict, version: str,
+                    task_args: Tuple) -> None:
+    """
+    Re-extract pages of the input directory as they change (only the watched
+    characters, or every page when watched is None). Extraction runs in this
+    process, so the manifest, extractor version and parser stay loaded.
+    """
+    def on_change(changed: List[str]) -> None:
+        if watched is not None:
+            changed = [character for character in changed if character in watched]
+        if not changed:
+            return
+        print(f"\nChanged: {', '.join(changed)}")
+        # Pages rewritten with the same content still match the manifest
+        stale = select_stale_characters(changed, args.input_dir, args.output_dir, manifest, version,
+                                        False, args.remaining, output_options(args))
+        if not stale:
+            return
+        failed_characters, _ = extract_characters(stale, 1, task_args, None, manifest, version, args)
+        if len(failed_characters) < len(stale):
+            write_indexes(args)
+        if failed_characters:
+            print(f"Failed characters: {', '.join(failed_characters)}")
+
+    watch_directory(args.input_dir, on_change, args.debounce, args.poll, args.poll_interval)
+
+
+def main(argv: Optional[List[str]] = None):
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+
+    if args.streaming and args.strategy != 'css':
+        arg_parser.error('--streaming only supports the css strategy')
+
+    if args.pack_json or args.check_binary:
+        if pack_json_directory(args.output_dir, check_only=args.check_binary):
+            raise SystemExit(1)
+        return
+
+    if args.fetch:
+        fetch_characters = sorted(CHARACTER_NAMES) if args.all or args.remaining else args.characters
+        print(f"Fetching {len(fetch_characters)} page(s) from {args.base_url}")
+        started = time.perf_counter()
+        fetch_results = fetch_pages(fetch_characters, args.input_dir, args.base_url, args.concurrency,
+                                    args.rate, args.fetch_timeout)
+        # Pages that came back 304 are untouched, so the build manifest skips them below
+        print_fetch_results(fetch_results, time.perf_counter() - started)
+
+    if not os.path.exists(args.input_dir):
+        print(f"Error: Input directory {args.input_dir} does not exist")
+        return
+
+    # Get list of characters to process
+    if args.all or args.remaining:
+        characters = list_html_characters(args.input_dir)
+    else:
+        characters = args.characters
+
+    # If inspection mode, just inspect the files
+    if args.inspect:
+        print(f"Inspecting {len(characters)} character(s): {', '.join(characters)}")
+        html_files = []
+        for character in characters:
+            html_file = os.path.join(args.input_dir, f"{character}.html")
+            if not os.path.exists(html_file):
+                print(f"Warning: {html_file} not found")
+                continue
+            html_files.append(html_file)
+        inspections = inspect_pages(html_files, args.jobs)
+        for inspection in inspections:
+            print_inspection(inspection)
+        if args.inspect_report:
+            print(f"\nInspection report written to: {write_inspection_report(inspections, args.inspect_report)}")
+        return
+
+    if not os.path.exists(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    manifest = load_manifest(args.output_dir)
+    version = extractor_version(*EXTRACTOR_SOURCES)
+    task_args = (args.input_dir, args.output_dir, args.parser, args.strategy, args.profile, args.streaming,
+                 args.binary, bool(args.timing), args.cprofile, args.memory, args.diff_dir, args.minify)
+    watched = None if args.all or args.remaining else characters
+
+    requested = characters
+    characters = select_stale_characters(requested, args.input_dir, args.output_dir, manifest,
+                                         version, args.force, args.remaining, output_options(args))
+    # Skipped characters keep their JSON, but a packed copy can lag behind it or be missing
+    skipped = [character for character in requested if character not in characters]
+    for binary_file in refresh_binary_copies(skipped, args.output_dir, create=args.binary):
+        print(f"Binary copy rewritten from its JSON: {os.path.basename(binary_file)}")
+    if not characters:
+        print("All characters are up to date.")
+        generated = [PUNISH_INDEX_FILENAME, PUBLISH_MANIFEST_FILENAME]
+        if has_frontend_types(args.output_dir):
+            generated.append(LOADER_FILENAME)
+        if (args.precompress or (args.sqlite and not os.path.exists(args.sqlite))
+                or not all(os.path.exists(os.path.join(args.output_dir, filename)) for filename in generated)):
+            write_indexes(args)
+        if args.watch:
+            watch_input_dir(args, watched, manifest, version, task_args)
+        return
+
+    print(f"Processing {len(characters)} character(s): {', '.join(characters)}")
+
+    jobs = max(1, min(args.jobs, len(characters)))
+    if jobs > 1:
+        print(f"Using {jobs} worker processes")
+
+    max_rss = args.max_rss * 1024 * 1024 if args.max_rss else None
+
+    started = time.perf_counter()
+    failed_characters, character_stats = extract_characters(characters, jobs, task_args, max_rss, manifest,
+                                                            version, args)
+    success_count = len(characters) - len(failed_characters)
+
+    print(f"\nCompleted processing. Successfully extracted {success_count}/{len(characters)} characters.")
+    if failed_characters:
+        print(f"Failed characters: {', '.join(failed_characters)}")
+
+    if success_count:
+        write_indexes(args)
+
+    if args.memory:
+        print_memory_summary(character_stats)
+    if args.timing:
+        report = build_timing_report(character_stats, time.perf_counter() - started, strategy=args.strategy,
+                                     parser=args.parser, profile=args.profile, streaming=args.streaming, jobs=jobs,
+                                     memory=args.memory, max_rss_mb=args.max_rss)
+        print_timing_summary(report)
+        print(f"Timing report written to: {write_timing_report(report, args.timing)}")
+    if args.cprofile:
+        print(f"cProfile output written to: {args.cprofile}")
+
+    print(f"\nAll character JSON files are now in: {args.output_dir}")
+
+    if args.watch:
+        watch_input_dir(args, watched, manifest, version, task_args)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Columnar frame store: every move of the roster in typed NumPy columns, so
+roster-wide questions run as one vectorised pass instead of nested loops
+over characters and moves.
+
+Each numeric column (startup, active, recovery, on_hit, on_block, damage)
+is read from the typed cell values (see values.parse_typed_value) into two
+int32 arrays, the low and high reading, with a boolean "numeric" mask.
+Ranges such as "4-6" or "-7～1" therefore take part in queries; comparisons
+use the low reading unless asked for the high one. Cells without a number
+("D", "着地後3", None, ...) are False in the mask and never match.
+
+    python -m sf_frame_extract.columnar src/data --where "on_block<=-6"
+    python -m sf_frame_extract.columnar src/data --where "startup<=4" --character ryu ken
+
+Requires NumPy.
+"""
+
+import argparse
+import glob
+import json
+import operator
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .constants import OUTPUT_SUFFIX
+from .model import is_structured
+from .values import move_numbers
+
+FRAME_COLUMNS = ('startup', 'active', 'recovery', 'on_hit', 'on_block')
+NUMERIC_COLUMNS = FRAME_COLUMNS + ('damage',)
+
+COMPARISONS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# "on_block<=-6", "startup < 5", ...
+CONDITION_PATTERN = re.compile(r'^\s*(\w+)\s*(<=|>=|==|!=|<|>)\s*(-?\d+)\s*$')
+
+Condition = Tuple[str, str, int]
+
+
+def parse_condition(text: str) -> Condition:
+    """Parse "column<op>value" into a (column, op, value) condition."""
+    match = CONDITION_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid condition '{text}' (expected e.g. on_block<=-6)")
+    column, op, value = match.groups()
+    if column not in NUMERIC_COLUMNS:
+        raise ValueError(f"Unknown column '{column}' (expected one of {', '.join(NUMERIC_COLUMNS)})")
+    return column, op, int(value)
+
+
+class FrameStore:
+    """All moves of a set of characters as parallel NumPy columns."""
+
+    def __init__(self, characters: List[str], character_index: np.ndarray, move_id: np.ndarray,
+                 names: List[str], columns: Dict[str, np.ndarray], upper: Dict[str, np.ndarray],
+                 numeric: Dict[str, np.ndarray]):
+        self.characters = characters
+        self.character_index = character_index
+        self.move_id = move_id
+        self.names = names
+        self.columns = columns
+        self.upper = upper
+        self.numeric = numeric
+
+    @classmethod
+    def from_character_data(cls, roster: Iterable[Dict]) -> 'FrameStore':
+        """Build the store from already loaded character data; unstructured files are left out."""
+        characters = []
+        character_index = []
+        move_ids = []
+        names = []
+        values = {column: [] for column in NUMERIC_COLUMNS}
+
+        for index, character_data in enumerate(filter(is_structured, roster)):
+            characters.append(character_data['character'])
+            for move in character_data['moves']:
+                character_index.append(index)
+                move_ids.append(move['id'])
+                names.append(move['name']['japanese'])
+                for column, value in move_numbers(move).items():
+                    values[column].append(value)
+
+        columns = {}
+        upper = {}
+        numeric = {}
+        for column, column_values in values.items():
+            count = len(column_values)
+            lows = [value.low if value and value.is_numeric else 0 for value in column_values]
+            # Open-ended readings ("8-着地まで") have no high end; use the low one
+            highs = [value.high if value and value.high is not None else low
+                     for value, low in zip(column_values, lows)]
+            columns[column] = np.fromiter(lows, dtype=np.int32, count=count)
+            upper[column] = np.fromiter(highs, dtype=np.int32, count=count)
+            numeric[column] = np.fromiter((bool(value and value.is_numeric) for value in column_values),
+                                          dtype=bool, count=count)
+
+        return cls(characters, np.asarray(character_index, dtype=np.int16), np.asarray(move_ids, dtype=np.int32),
+                   names, columns, upper, numeric)
+
+    @classmethod
+    def from_directory(cls, data_dir: str) -> 'FrameStore':
+        """Load every *_frame_data_structured.json file in data_dir."""
+        roster = []
+        for json_file in sorted(glob.glob(os.path.join(data_dir, f"*{OUTPUT_SUFFIX}"))):
+            with open(json_file, 'r', encoding='utf-8') as f:
+                roster.append(json.load(f))
+        return cls.from_character_data(roster)
+
+    def __len__(self) -> int:
+        return len(self.move_id)
+
+    def compare(self, column: str, op: str, value: int, high: bool = False) -> np.ndarray:
+        """
+        Boolean mask of moves whose numeric column satisfies "column op value",
+        on the low reading of ranges (or the high one with high=True).
+        """
+        values = self.upper[column] if high else self.columns[column]
+        return COMPARISONS[op](values, value) & self.numeric[column]
+
+    def character_mask(self, characters: Sequence[str]) -> np.ndarray:
+        wanted = [self.characters.index(character) for character in characters if character in self.characters]
+        return np.isin(self.character_index, wanted)
+
+    def query(self, *conditions: Condition, characters: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Row indices of moves matching every condition, optionally limited to some characters."""
+        mask = np.ones(len(self), dtype=bool)
+        for column, op, value in conditions:
+            mask &= self.compare(column, op, value)
+        if characters:
+            mask &= self.character_mask(characters)
+        return np.flatnonzero(mask)
+
+    def rows(self, indices: Iterable[int]) -> List[Dict]:
+        """Materialise rows as dicts with the low reading; non-numeric cells come back as None."""
+        rows = []
+        for index in indices:
+            row = {
+                'character': self.characters[self.character_index[index]],
+                'id': int(self.move_id[index]),
+                'name': self.names[index],
+            }
+            for column in NUMERIC_COLUMNS:
+                row[column] = int(self.columns[column][index]) if self.numeric[column][index] else None
+            rows.append(row)
+        return rows
+
+
+def load_frame_store(data_dir: str) -> FrameStore:
+    return FrameStore.from_directory(data_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the roster frame data as NumPy columns')
+    parser.add_argument('data_dir', help='Directory containing *_frame_data_structured.json files')
+    parser.add_argument('--where', nargs='+', default=[], type=parse_condition,
+                        help='Conditions such as "on_block<=-6" (all must hold)')
+    parser.add_argument('--character', nargs='+',
+                        help='Only these characters')
+    args = parser.parse_args()
+
+    store = load_frame_store(args.data_dir)
+    indices = store.query(*args.where, characters=args.character)
+
+    for row in store.rows(indices):
+        frames = ' | '.join(f"{column}={row[column]}" for column in FRAME_COLUMNS)
+        print(f"{row['character']:<12} #{row['id']:<4} {row['name']}  {frames}")
+    print(f"\n{len(indices)} of {len(store)} moves")
+
+
+if __name__ == '__main__':
+    main()
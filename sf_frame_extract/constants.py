@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared lookup tables for the Street Fighter 6 frame data extractors.
+"""
+
+# Character name mappings (Japanese to English)
+CHARACTER_NAMES = {
+    'aki': {'japanese': 'A.K.I.', 'english': 'A.K.I.'},
+    'blanka': {'japanese': 'ブランカ', 'english': 'Blanka'},
+    'cammy': {'japanese': 'キャミィ', 'english': 'Cammy'},
+    'chunli': {'japanese': '春麗', 'english': 'Chun-Li'},
+    'deejay': {'japanese': 'ディージェイ', 'english': 'Dee Jay'},
+    'dhalsim': {'japanese': 'ダルシム', 'english': 'Dhalsim'},
+    'ed': {'japanese': 'エド', 'english': 'Ed'},
+    'ehonda': {'japanese': 'E.本田', 'english': 'E. Honda'},
+    'elena': {'japanese': 'エレナ', 'english': 'Elena'},
+    'gouki': {'japanese': '豪鬼', 'english': 'Akuma'},
+    'guile': {'japanese': 'ガイル', 'english': 'Guile'},
+    'jamie': {'japanese': 'ジェイミー', 'english': 'Jamie'},
+    'jp': {'japanese': 'JP', 'english': 'JP'},
+    'juri': {'japanese': 'ジュリ', 'english': 'Juri'},
+    'ken': {'japanese': 'ケン', 'english': 'Ken'},
+    'kimberly': {'japanese': 'キンバリー', 'english': 'Kimberly'},
+    'lily': {'japanese': 'リリー', 'english': 'Lily'},
+    'luke': {'japanese': 'ルーク', 'english': 'Luke'},
+    'mai': {'japanese': '不知火舞', 'english': 'Mai Shiranui'},
+    'manon': {'japanese': 'マノン', 'english': 'Manon'},
+    'marisa': {'japanese': 'マリーザ', 'english': 'Marisa'},
+    'rashid': {'japanese': 'ラシード', 'english': 'Rashid'},
+    'ryu': {'japanese': 'リュウ', 'english': 'Ryu'},
+    'sagat': {'japanese': 'サガット', 'english': 'Sagat'},
+    'terry': {'japanese': 'テリー・ボガード', 'english': 'Terry Bogard'},
+    'vega_mbison': {'japanese': 'ベガ', 'english': 'M. Bison'},
+    'zangief': {'japanese': 'ザンギエフ', 'english': 'Zangief'}
+}
+
+# Listed first in the frontend's character selects; the rest follow alphabetically
+FEATURED_CHARACTERS = ['ryu', 'ken', 'chunli', 'luke', 'cammy']
+
+# Category mappings
+CATEGORY_MAPPINGS = {
+    "通常技": {"japanese": "通常技", "english": "Normal Attacks"},
+    "特殊技": {"japanese": "特殊技", "english": "Special Normals"},
+    "必殺技": {"japanese": "必殺技", "english": "Special Moves"},
+    "スーパーアーツ": {"japanese": "スーパーアーツ", "english": "Super Arts"},
+    "通常投げ": {"japanese": "通常投げ", "english": "Throws"},
+    "共通システム": {"japanese": "共通システム", "english": "System Mechanics"}
+}
+
+# CSS class prefix -> row field. The site uses hashed CSS module classes
+# (e.g. "frame_startup_frame__a1B2c"), so cells are keyed on the class up to
+# and including the first "__".
+ROW_FIELD_CLASSES = {
+    'frame_skill__': 'name',
+    'frame_startup_frame__': 'startup',
+    'frame_active_frame__': 'active',
+    'frame_recovery_frame__': 'recovery',
+    'frame_hit_frame__': 'on_hit',
+    'frame_block_frame__': 'on_block',
+    'frame_damage__': 'damage',
+    'frame_cancel__': 'cancel',
+    'frame_combo_correct__': 'combo_scaling',
+    'frame_attribute__': 'attribute',
+    'frame_note__': 'notes',
+    'frame_special_correct__': 'special_correct',
+    'frame_knockdown__': 'knockdown',
+    'frame_drive_gauge_gain_hit__': 'gain_on_hit',
+    'frame_drive_gauge_lose_dguard__': 'loss_on_guard',
+    'frame_drive_gauge_lose_punish__': 'loss_on_punish',
+    'frame_sa_gauge_gain__': 'sa_gain',
+}
+
+# Column header texts that show up as the first "move" of every table
+HEADER_NAMES = ['技名', '発生', '持続', '硬直', 'ヒット', 'ガード']
+
+OUTPUT_SUFFIX = '_frame_data_structured.json'
+
+DEFAULT_HEALTH = 10000
+
+DEFAULT_INPUT_DIR = '/Users/yutayokota/Downloads/sf_frame_html/'
+DEFAULT_OUTPUT_DIR = '/Users/yutayokota/projects/sf-frame/src/data/'
+
+
+def character_names_for(character: str) -> dict:
+    """Localized names for a character id, falling back to the id itself."""
+    return CHARACTER_NAMES.get(character, {'japanese': character, 'english': character})
+
+
+def output_filename(character: str) -> str:
+    return f"{character}{OUTPUT_SUFFIX}"
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+SQLite export: the whole roster in one database file for ad-hoc queries.
+
+  characters  one row per character (id, names, health)
+  moves       one row per move. Every frame cell and the damage get a typed
+              INTEGER column with the low reading (see values.parse_typed_value;
+              NULL when the cell has no number), a <column>_high column for
+              ranges and the raw text as <column>_raw
+  move_names  FTS5 index over the Japanese and English move names (trigram
+              tokenizer where available, so Japanese substrings match)
+
+moves is indexed on (character, startup) and (character, on_block), the
+punish-check lookups. The file is built in a temp file, filled with one
+executemany per table inside a single transaction, and then renamed over
+the previous export.
+
+    python -m sf_frame_extract.database src/data frames.sqlite
+    sqlite3 frames.sqlite "SELECT character, name_japanese, on_block FROM moves
+                           WHERE character = 'ryu' AND on_block <= -6"
+    sqlite3 frames.sqlite "SELECT character, name_japanese FROM moves
+                           WHERE rowid IN (SELECT rowid FROM move_names WHERE move_names MATCH '波動拳')"
+"""
+
+import argparse
+import glob
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .constants import OUTPUT_SUFFIX
+from .model import is_structured
+from .values import FrameValue, move_numbers
+
+NUMERIC_COLUMNS = ('startup', 'active', 'recovery', 'on_hit', 'on_block', 'damage')
+
+# (column, SQL type) in table order, after the key columns
+MOVE_COLUMNS = [
+    ('name_japanese', 'TEXT'),
+    ('name_english', 'TEXT'),
+    ('category', 'TEXT'),
+    ('category_english', 'TEXT'),
+    ('type', 'TEXT'),
+    *((name, 'INTEGER') for column in NUMERIC_COLUMNS for name in (column, f'{column}_high')),
+    *((f'{column}_raw', 'TEXT') for column in NUMERIC_COLUMNS),
+    ('cancel', 'TEXT'),
+    ('combo_scaling', 'TEXT'),
+    ('attribute', 'TEXT'),
+    ('notes', 'TEXT'),
+    ('gain_on_hit', 'INTEGER'),
+    ('loss_on_guard', 'INTEGER'),
+    ('loss_on_punish', 'INTEGER'),
+    ('sa_gain', 'INTEGER'),
+]
+
+SCHEMA = f"""
+CREATE TABLE characters (
+    character TEXT PRIMARY KEY,
+    name_japanese TEXT,
+    name_english TEXT,
+    health INTEGER
+);
+CREATE TABLE moves (
+    character TEXT NOT NULL REFERENCES characters (character),
+    id INTEGER NOT NULL,
+    {', '.join(f'{name} {sql_type}' for name, sql_type in MOVE_COLUMNS)},
+    UNIQUE (character, id)
+);
+"""
+
+INDEXES = [
+    'CREATE INDEX moves_character_startup ON moves (character, startup)',
+    'CREATE INDEX moves_character_on_block ON moves (character, on_block)',
+]
+
+# External-content FTS table: the names are stored once, in moves
+FTS_TABLE = ("CREATE VIRTUAL TABLE move_names USING fts5("
+             "name_japanese, name_english, content='moves', content_rowid='rowid', tokenize='{tokenizer}')")
+
+
+def label(value, language: str = 'japanese') -> Optional[str]:
+    """One language of a {'japanese': ..., 'english': ...} label, or a plain string as is."""
+    if isinstance(value, dict):
+        return value.get(language)
+    return value
+
+
+def integer(value) -> Optional[int]:
+    return value if type(value) is int else None
+
+
+def text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def move_row(character: str, move: Dict) -> Tuple:
+    """One moves row, in schema order."""
+    properties = move.get('properties', move)
+    drive_system = move.get('drive_system', move)
+    numbers: Dict[str, Optional[FrameValue]] = move_numbers(move)
+    raw = {**move['frames'], 'damage': properties.get('damage')}
+
+    row = [
+        character,
+        move['id'],
+        label(move.get('name')),
+        label(move.get('name'), 'english'),
+        label(move.get('category')),
+        label(move.get('category'), 'english'),
+        move.get('type'),
+    ]
+    for column in NUMERIC_COLUMNS:
+        value = numbers.get(column)
+        low = value.low if value else None
+        # Open-ended readings ("8-着地まで") have no high end; use the low one
+        row += [low, value.high if value and value.high is not None else low]
+    row += [text(raw.get(column)) for column in NUMERIC_COLUMNS]
+    row += [properties.get(name) for name in ('cancel', 'combo_scaling', 'attribute', 'notes')]
+    row += [integer(drive_system.get(name)) for name in ('gain_on_hit', 'loss_on_guard', 'loss_on_punish')]
+    row.append(integer(move.get('sa_gain')))
+    return tuple(row)
+
+
+def move_rows(roster: Iterable[Dict]) -> Iterator[Tuple]:
+    for character_data in roster:
+        for move in character_data['moves']:
+            yield move_row(character_data['character'], move)
+
+
+def create_fts_table(connection: sqlite3.Connection) -> str:
+    """Create move_names with the trigram tokenizer, or unicode61 on SQLite < 3.34."""
+    for tokenizer in ('trigram', 'unicode61'):
+        try:
+            connection.execute(FTS_TABLE.format(tokenizer=tokenizer))
+            return tokenizer
+        except sqlite3.OperationalError:
+            continue
+    raise sqlite3.OperationalError('FTS5 is not available in this SQLite build')
+
+
+def build_database(roster: List[Dict], database_file: str) -> int:
+    """Write roster into a new SQLite file at database_file. Returns the number of moves."""
+    roster = sorted(filter(is_structured, roster), key=lambda character_data: character_data['character'])
+    temp_file = database_file + '.tmp'
+    if os.path.exists(temp_file):
+        os.remove(temp_file)
+
+    connection = sqlite3.connect(temp_file, isolation_level=None)
+    try:
+        # A fresh temp file that is renamed into place needs no journal
+        connection.execute('PRAGMA journal_mode = OFF')
+        connection.execute('PRAGMA synchronous = OFF')
+        connection.executescript(SCHEMA)
+        create_fts_table(connection)
+
+        connection.execute('BEGIN')
+        connection.executemany(
+            'INSERT INTO characters VALUES (?, ?, ?, ?)',
+            [(character_data['character'], label(character_data.get('character_name')),
+              label(character_data.get('character_name'), 'english'), integer(character_data.get('health')))
+             for character_data in roster])
+        placeholders = ', '.join('?' * (2 + len(MOVE_COLUMNS)))
+        connection.executemany(f'INSERT INTO moves VALUES ({placeholders})', move_rows(roster))
+        # Indexes are cheaper to build once over the loaded table than row by row
+        for statement in INDEXES:
+            connection.execute(statement)
+        connection.execute("INSERT INTO move_names (move_names) VALUES ('rebuild')")
+        connection.execute('COMMIT')
+
+        connection.execute('ANALYZE')
+        move_count = connection.execute('SELECT COUNT(*) FROM moves').fetchone()[0]
+    finally:
+        connection.close()
+
+    os.replace(temp_file, database_file)
+    return move_count
+
+
+def write_database(data_dir: str, database_file: str) -> str:
+    """Export every character file in data_dir to database_file."""
+    roster = []
+    for json_file in sorted(glob.glob(os.path.join(data_dir, f"*{OUTPUT_SUFFIX}"))):
+        with open(json_file, 'r', encoding='utf-8') as f:
+            roster.append(json.load(f))
+
+    directory = os.path.dirname(database_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    build_database(roster, database_file)
+    return database_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the roster frame data to SQLite')
+    parser.add_argument('data_dir', help='Directory containing *_frame_data_structured.json files')
+    parser.add_argument('database_file', help='SQLite file to write (replaced atomically)')
+    args = parser.parse_args()
+    print(f"SQLite export written to: {write_database(args.data_dir, args.database_file)}")
+
+
+if __name__ == '__main__':
+    main()
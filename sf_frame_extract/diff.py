@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Move-level diff between two extraction runs of a character.
+
+Move ids are positional, so a move inserted at the top of the page would
+renumber every move after it. Moves are matched instead by a stable key:
+their Japanese name and category, plus an occurrence number for names that
+repeat within a category. The result comes in two forms:
+
+  changelog   compact and human-readable: top-level fields that changed,
+              moves added and removed, and per changed move the fields
+              (dotted paths) with their old and new values. Derived data
+              (ids, typed values, category move lists) is left out.
+  patch       an RFC 6902 JSON Patch turning the old file into exactly the
+              new one. Matched moves get one operation per changed field,
+              and a move that changed position a single "move". Ids are
+              positional but part of the file, so an insert or removal
+              still costs one "replace" per later move for its new id (and
+              the category move lists are replaced whole); only the
+              changelog leaves those out.
+
+With --diff-dir both are written as <character>.changelog.json and
+<character>.patch.json whenever a character's output changes.
+"""
+
+import copy
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from .files import write_bytes_atomic
+from .model import is_structured
+
+# Per-move fields derived from the others (or from the move's position)
+DERIVED_MOVE_FIELDS = ('id', 'typed')
+
+MoveKey = Tuple[str, str, int]
+
+
+def label_text(value: Any) -> str:
+    """The Japanese text of a {'japanese': ..., 'english': ...} label or a plain string."""
+    if isinstance(value, dict):
+        return str(value.get('japanese', ''))
+    return '' if value is None else str(value)
+
+
+def move_keys(moves: List[Dict]) -> List[MoveKey]:
+    """(japanese name, category, occurrence) for each move, in order."""
+    seen: Dict[Tuple[str, str], int] = {}
+    keys = []
+    for move in moves:
+        base = (label_text(move.get('name')), label_text(move.get('category')))
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        keys.append((*base, occurrence))
+    return keys
+
+
+def describe_key(key: MoveKey) -> Dict:
+    name, category, occurrence = key
+    described = {'name': name, 'category': category}
+    if occurrence:
+        described['occurrence'] = occurrence
+    return described
+
+
+def same_value(old: Any, new: Any) -> bool:
+    # True == 1 in Python, but not in the JSON files
+    return type(old) is type(new) and old == new
+
+
+def changed_fields(old: Any, new: Any, prefix: str = '') -> Dict[str, List]:
+    """Dotted path -> [old, new] for every leaf that differs; lists compare whole."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        fields = {}
+        for name in list(old) + [name for name in new if name not in old]:
+            path = f"{prefix}.{name}" if prefix else name
+            if name not in new:
+                fields[path] = [old[name], None]
+            elif name not in old:
+                fields[path] = [None, new[name]]
+            else:
+                fields.update(changed_fields(old[name], new[name], path))
+        return fields
+    if same_value(old, new):
+        return {}
+    return {prefix: [old, new]}
+
+
+def without(data: Dict, names: Tuple[str, ...]) -> Dict:
+    return {name: value for name, value in data.items() if name not in names}
+
+
+def diff_character(old: Dict, new: Dict) -> Dict:
+    """Changelog for one character between two runs (see the module docstring)."""
+    changelog = {
+        'character': new.get('character', old.get('character')),
+        'fields': changed_fields(without(old, ('moves', 'categories')), without(new, ('moves', 'categories'))),
+        'added': [],
+        'removed': [],
+        'changed': [],
+    }
+    if not (is_structured(old) and is_structured(new)):
+        # Raw embedded JSON has no stable move identity to match on; only the counts are logged
+        if not same_value(old.get('moves'), new.get('moves')):
+            changelog['fields']['moves (raw)'] = [len(old.get('moves') or ()), len(new.get('moves') or ())]
+        return changelog
+
+    old_moves = dict(zip(move_keys(old['moves']), old['moves']))
+    new_moves = dict(zip(move_keys(new['moves']), new['moves']))
+    for key, move in new_moves.items():
+        if key not in old_moves:
+            changelog['added'].append(describe_key(key))
+            continue
+        fields = changed_fields(without(old_moves[key], DERIVED_MOVE_FIELDS), without(move, DERIVED_MOVE_FIELDS))
+        if fields:
+            changelog['changed'].append({**describe_key(key), 'fields': fields})
+    changelog['removed'] = [describe_key(key) for key in old_moves if key not in new_moves]
+    return changelog
+
+
+def has_changes(changelog: Dict) -> bool:
+    return any(changelog[name] for name in ('fields', 'added', 'removed', 'changed'))
+
+
+def summarize_changes(changelog: Dict) -> str:
+    parts = [f"{len(changelog['changed'])} changed", f"{len(changelog['added'])} added",
+             f"{len(changelog['removed'])} removed"]
+    if changelog['fields']:
+        parts.append(f"fields: {', '.join(changelog['fields'])}")
+    return ', '.join(parts)
+
+
+# --- JSON Patch -----------------------------------------------------------
+
+def pointer(*tokens: Any) -> str:
+    return ''.join('/' + str(token).replace('~', '~0').replace('/', '~1') for token in tokens)
+
+
+def value_patch(old: Any, new: Any, path: str, operations: List[Dict]) -> None:
+    """Operations turning old into new at path; dicts recurse, anything else is replaced whole."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for name in old:
+            if name not in new:
+                operations.append({'op': 'remove', 'path': path + pointer(name)})
+        for name, value in new.items():
+            if name not in old:
+                operations.append({'op': 'add', 'path': path + pointer(name), 'value': value})
+            else:
+                value_patch(old[name], value, path + pointer(name), operations)
+    elif not same_value(old, new):
+        operations.append({'op': 'replace', 'path': path, 'value': new})
+
+
+def moves_patch(old_moves: List[Dict], new_moves: List[Dict], operations: List[Dict]) -> None:
+    """
+    Removals (last first), then walk the new order: add new moves and move
+    matched ones into place, and finally patch the fields of each matched move.
+    """
+    old_keys = move_keys(old_moves)
+    new_keys = move_keys(new_moves)
+    new_key_set = set(new_keys)
+    old_by_key = dict(zip(old_keys, old_moves))
+
+    for index in reversed(range(len(old_keys))):
+        if old_keys[index] not in new_key_set:
+            operations.append({'op': 'remove', 'path': pointer('moves', index)})
+    current = [key for key in old_keys if key in new_key_set]
+
+    for index, key in enumerate(new_keys):
+        if key not in old_by_key:
+            operations.append({'op': 'add', 'path': pointer('moves', index), 'value': new_moves[index]})
+            current.insert(index, key)
+            continue
+        position = current.index(key, index)
+        if position != index:
+            operations.append({'op': 'move', 'from': pointer('moves', position), 'path': pointer('moves', index)})
+            current.insert(index, current.pop(position))
+
+    for index, key in enumerate(new_keys):
+        if key in old_by_key:
+            value_patch(old_by_key[key], new_moves[index], pointer('moves', index), operations)
+
+
+def json_patch(old: Dict, new: Dict) -> List[Dict]:
+    """RFC 6902 operations turning old into new, with moves matched by key."""
+    operations = []
+    value_patch(without(old, ('moves',)), without(new, ('moves',)), '', operations)
+    if 'moves' in old and 'moves' in new and is_structured(old) and is_structured(new):
+        moves_patch(old['moves'], new['moves'], operations)
+    elif 'moves' in new:
+        operations.append({'op': 'add', 'path': '/moves', 'value': new['moves']})
+    elif 'moves' in old:
+        operations.append({'op': 'remove', 'path': '/moves'})
+    return operations
+
+
+def resolve(document: Any, path: str) -> Tuple[Any, Any]:
+    """Parent container and last token of a JSON pointer."""
+    tokens = [token.replace('~1', '/').replace('~0', '~') for token in path.split('/')[1:]]
+    parent = document
+    for token in tokens[:-1]:
+        parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+    last = tokens[-1]
+    if isinstance(parent, list):
+        last = len(parent) if last == '-' else int(last)
+    return parent, last
+
+
+def apply_json_patch(document: Any, operations: List[Dict]) -> Any:
+    """Apply add/remove/replace/move operations to a copy of document."""
+    document = copy.deepcopy(document)
+    for operation in operations:
+        op = operation['op']
+        if op == 'move':
+            source, token = resolve(document, operation['from'])
+            value = source.pop(token)
+        else:
+            value = copy.deepcopy(operation.get('value'))
+        parent, token = resolve(document, operation['path'])
+        if op in ('add', 'move') and isinstance(parent, list):
+            parent.insert(token, value)
+        elif op == 'remove':
+            del parent[token]
+        elif op in ('add', 'move', 'replace'):
+            parent[token] = value
+        else:
+            raise ValueError(f"Unsupported JSON Patch operation: {op}")
+    return document
+
+
+def write_changes(changelog: Dict, patch: List[Dict], diff_dir: str) -> Tuple[str, str]:
+    """Write <character>.changelog.json and <character>.patch.json into diff_dir."""
+    os.makedirs(diff_dir, exist_ok=True)
+    character = changelog['character']
+    changelog_file = os.path.join(diff_dir, f"{character}.changelog.json")
+    patch_file = os.path.join(diff_dir, f"{character}.patch.json")
+    write_bytes_atomic(changelog_file, json.dumps(changelog, indent=2, ensure_ascii=False).encode('utf-8'))
+    write_bytes_atomic(patch_file, json.dumps(patch, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+    return changelog_file, patch_file
+
+
+def load_previous(output_file: str) -> Optional[Dict]:
+    """The character data from the previous run, or None when there is no readable file."""
+    try:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
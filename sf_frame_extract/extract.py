@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Per-file extraction: read a saved page, run the selected strategy and save
+the result as <character>_frame_data_structured.json.
+"""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import time
+import tracemalloc
+from typing import Dict, Optional, Tuple
+
+from .binary import binary_filename, check_round_trip, save_character_binary
+from .constants import output_filename
+from .diff import diff_character, has_changes, json_patch, load_previous, summarize_changes, write_changes
+from .files import write_if_changed
+from .html_parsing import DEFAULT_PARSER, HtmlDocument
+from .inspection import inspect_page, print_inspection
+from .rows import DEFAULT_PROFILE
+from .strategies import DEFAULT_STRATEGY, STRATEGIES, auto_strategies
+from .streaming import character_from_path, open_html_stream, stream_character_data
+from .timing import StageTimer, format_bytes, peak_rss_bytes, recording, run_profiled, stage
+
+# Characters handled by this process so far; tells the parent whether a
+# worker's peak RSS came from one page or built up over several
+_worker_characters = 0
+
+
+def extract_from_html_file(html_file_path: str, parser: str = DEFAULT_PARSER,
+                           strategy: str = DEFAULT_STRATEGY, profile: str = DEFAULT_PROFILE) -> Optional[Dict]:
+    """
+    Extract frame data from an HTML file with one strategy, or when strategy
+    is 'auto' with each of AUTO_STRATEGY_ORDER in turn that the page's byte
+    fingerprint does not rule out.
+    """
+    character = character_from_path(html_file_path)
+    print(f"Extracting data for {character}...")
+
+    try:
+        with stage('read'), open_html_stream(html_file_path) as f:
+            document = HtmlDocument(f.read(), parser)
+
+        # The page is parsed at most once, however many strategies are tried
+        strategy_names = auto_strategies(document.raw) if strategy == 'auto' else (strategy,)
+        for name in strategy_names:
+            character_data = STRATEGIES[name](document, character, profile)
+            if character_data:
+                return character_data
+
+        print(f"Warning: Could not extract frame data from {html_file_path}")
+        return None
+
+    except Exception as e:
+        print(f"Error processing {html_file_path}: {e}")
+        return None
+
+
+def extract_character_data(html_file_path: str, parser: str = DEFAULT_PARSER,
+                           profile: str = DEFAULT_PROFILE) -> Optional[Dict]:
+    """Extract complete character data from HTML file using CSS classes."""
+    return extract_from_html_file(html_file_path, parser, 'css', profile)
+
+
+def serialize_character_data(character_data: Dict, minify: bool = False) -> bytes:
+    if minify:
+        return json.dumps(character_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(character_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def save_character_data(character_data: Dict, output_dir: str, minify: bool = False) -> str:
+    """
+    Save character data to a JSON file (without whitespace when minify is
+    set), atomically so readers never see half a file. A file that already
+    holds the same data is left untouched.
+    """
+    output_file = os.path.join(output_dir, output_filename(character_data["character"]))
+    write_if_changed(output_file, serialize_character_data(character_data, minify))
+    return output_file
+
+
+def inspect_html_structure(html_file_path: str, parser: str = DEFAULT_PARSER) -> None:
+    """
+    Inspect HTML file structure to understand data organization. The page is
+    scanned without a DOM, so parser is unused; it is kept for existing callers.
+    """
+    print_inspection(inspect_page(html_file_path))
+
+
+def print_sample_move(character_data: Dict) -> None:
+    """Show the first move so a run can be eyeballed for structure."""
+    moves = character_data.get('moves')
+    if not moves or not isinstance(moves[0], dict) or 'frames' not in moves[0]:
+        return
+
+    sample_move = moves[0]
+    frames = sample_move['frames']
+    damage = sample_move.get('properties', sample_move).get('damage')
+    print(f"   Sample move: {sample_move['name']['japanese']}")
+    print(f"   Frames: S{frames['startup']} | A{frames['active']} | R{frames['recovery']}")
+    print(f"   Hit/Block: {frames['on_hit']}/{frames['on_block']} | Damage: {damage}")
+
+
+def extract_and_save(character: str, input_dir: str, output_dir: str, parser: str = DEFAULT_PARSER,
+                     strategy: str = DEFAULT_STRATEGY, profile: str = DEFAULT_PROFILE,
+                     streaming: bool = False, binary: bool = False, diff_dir: Optional[str] = None,
+                     minify: bool = False, max_rss: Optional[int] = None) -> Optional[str]:
+    """
+    Extract and save one character, printing progress. With binary, a
+    packed binary copy is written beside the JSON and checked against it; a
+    copy already there is kept in step with the JSON even without it. With
+    minify, the JSON is written without whitespace. With max_rss (bytes), a
+    page that takes a fresh worker over the limit fails before anything is
+    written, so its output and build manifest entry stay as they were.
+
+    Unchanged output is not rewritten. Changed output is diffed against the
+    previous file move by move, and with diff_dir the changelog and JSON
+    Patch are written there. Returns the output file, or None on failure.
+    """
+    html_file = os.path.join(input_dir, f"{character}.html")
+
+    if not os.path.exists(html_file):
+        print(f"Warning: {html_file} not found")
+        return None
+
+    try:
+        if streaming:
+            character_data = stream_character_data(html_file, profile)
+        else:
+            character_data = extract_from_html_file(html_file, parser, strategy, profile)
+        if character_data:
+            with stage('dump'):
+                output_file = os.path.join(output_dir, output_filename(character_data["character"]))
+                previous = load_previous(output_file)
+                serialized = serialize_character_data(character_data, minify)
+            rss = peak_rss_bytes()
+            if max_rss and _worker_characters == 1 and rss is not None and rss > max_rss:
+                # A fresh worker went over the limit, so this page alone needs more
+                print(f"❌ {character} needs {format_bytes(rss)} RSS, over --max-rss {format_bytes(max_rss)}")
+                return None
+            with stage('dump'):
+                written = write_if_changed(output_file, serialized)
+            if not written:
+                print(f"✅ {character} data unchanged: {os.path.basename(output_file)}")
+            else:
+                print(f"✅ Successfully saved {character} data to: {os.path.basename(output_file)}")
+            if written and previous is not None:
+                # Diff what was written, so both sides went through JSON
+                current = json.loads(serialized)
+                changelog = diff_character(previous, current)
+                if has_changes(changelog):
+                    print(f"   Changes: {summarize_changes(changelog)}")
+                    if diff_dir:
+                        write_changes(changelog, json_patch(previous, current), diff_dir)
+            print_sample_move(character_data)
+            if binary or os.path.exists(os.path.join(output_dir, binary_filename(character_data["character"]))):
+                with stage('dump'):
+                    binary_file = save_character_binary(character_data, output_dir)
+                if not check_round_trip(output_file, binary_file):
+                    print(f"❌ {os.path.basename(binary_file)} does not round-trip to the JSON data")
+                    return None
+                print(f"   Binary: {os.path.basename(binary_file)} ({os.path.getsize(binary_file):,} bytes)")
+            return output_file
+    except Exception as e:
+        # One bad page must not take down the rest of the batch
+        print(f"Error processing {character}: {e}")
+
+    print(f"❌ Failed to extract {character} data")
+    return None
+
+
+def process_character(character: str, input_dir: str, output_dir: str, parser: str = DEFAULT_PARSER,
+                      strategy: str = DEFAULT_STRATEGY, profile: str = DEFAULT_PROFILE,
+                      streaming: bool = False, binary: bool = False, timing: bool = False,
+                      cprofile_dir: Optional[str] = None, trace_memory: bool = False,
+                      diff_dir: Optional[str] = None, minify: bool = False,
+                      max_rss: Optional[int] = None) -> Tuple[str, Optional[str], str, Dict]:
+    """
+    Run extract_and_save for one character inside a worker process. Progress
+    output is captured and returned for the parent to print in input order.
+
+    stats always holds the worker's peak RSS and how many characters it has
+    processed. With timing it also holds the total and per-stage wall/CPU
+    seconds, and with trace_memory the tracemalloc peak/retained bytes (per
+    stage and overall) and the top allocation sites. With cprofile_dir, the
+    run is profiled into <cprofile_dir>/<character>.prof and .collapsed.
+    diff_dir, minify and max_rss are passed on to extract_and_save.
+    Returns (character, output file or None on failure, log, stats).
+    """
+    global _worker_characters
+    _worker_characters += 1
+
+    log = io.StringIO()
+    timer = StageTimer(trace_memory)
+    with contextlib.redirect_stdout(log), recording(timer) if timing or trace_memory else contextlib.nullcontext():
+        if trace_memory:
+            tracemalloc.start()
+        wall, cpu = time.perf_counter(), time.process_time()
+        args = (character, input_dir, output_dir, parser, strategy, profile, streaming, binary, diff_dir, minify,
+                max_rss)
+        try:
+            if cprofile_dir:
+                output_file = run_profiled(os.path.join(cprofile_dir, character), extract_and_save, *args)
+            else:
+                output_file = extract_and_save(*args)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            if trace_memory:
+                # Soups are full of reference cycles; only count what survives a collection
+                gc.collect()
+                memory = {
+                    'peak_bytes': timer.peak_bytes,
+                    'retained_bytes': tracemalloc.get_traced_memory()[0],
+                    'top_allocations': timer.top_allocations(),
+                }
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+
+    stats = {'max_rss': peak_rss_bytes(), 'worker_characters': _worker_characters}
+    if timing or trace_memory:
+        html_file = os.path.join(input_dir, f"{character}.html")
+        stats.update({
+            'input_bytes': os.path.getsize(html_file) if os.path.exists(html_file) else None,
+            'wall': wall,
+            'cpu': cpu,
+            'ok': output_file is not None,
+            'stages': timer.to_json(),
+        })
+    if trace_memory:
+        stats['memory'] = memory
+
+    return character, output_file, log.getvalue(), stats
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Asynchronous fetch stage: download the character pages into the input
+directory before extraction.
+
+Every page is requested concurrently on one asyncio loop over a small
+HTTP/1.1 keep-alive connection pool (standard library only), bounded by a
+concurrency limit and a requests-per-second rate limit, so a roster refresh
+takes about as long as the slowest single page. The ETag and Last-Modified
+of every saved page are kept in .fetch_state.json in the input directory and
+sent back as If-None-Match / If-Modified-Since; a 304 leaves the saved page
+untouched, so its build manifest entry still matches and it is not
+re-extracted. Pages are written atomically.
+
+    python -m sf_frame_extract --all --fetch
+    python -m sf_frame_extract --all --fetch --base-url http://localhost:8000/{character}.html
+
+The base URL is a template with a {character} placeholder; without one the
+character id is appended as a path segment.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import ssl
+import time
+import zlib
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_BASE_URL = 'https://www.streetfighter.com/6/ja-jp/character/{character}/frame'
+DEFAULT_CONCURRENCY = 32
+DEFAULT_RATE = 20.0  # request starts per second; 0 disables the limit
+DEFAULT_TIMEOUT = 30.0
+
+FETCH_STATE_FILENAME = '.fetch_state.json'
+FETCH_STATE_FORMAT = 1
+
+MAX_REDIRECTS = 5
+USER_AGENT = 'sf_frame_extract'
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]  # lower-case names
+    body: bytes
+
+
+class FetchResult(NamedTuple):
+    character: str
+    status: str  # 'updated', 'unchanged' or 'failed'
+    html_file: Optional[str]
+    size: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def page_url(base_url: str, character: str) -> str:
+    if '{character}' in base_url:
+        return base_url.format(character=character)
+    return f"{base_url.rstrip('/')}/{character}"
+
+
+def decode_body(body: bytes, encoding: str) -> bytes:
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        return zlib.decompress(body)
+    return body
+
+
+async def read_headers(reader: asyncio.StreamReader) -> Tuple[str, int, Dict[str, str]]:
+    status_line = (await reader.readuntil(b'\r\n')).decode('latin-1')
+    version, status, *_ = status_line.split(' ', 2)
+    headers = {}
+    while True:
+        line = await reader.readuntil(b'\r\n')
+        if line == b'\r\n':
+            return version, int(status), headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+async def read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+        if size == 0:
+            # Skip trailers up to the blank line
+            while await reader.readuntil(b'\r\n') != b'\r\n':
+                pass
+            return b''.join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+class ConnectionPool:
+    """
+    Minimal HTTP/1.1 client keeping idle keep-alive connections per
+    (scheme, host, port). Callers bound the number of requests in flight.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.idle: Dict[tuple, List[tuple]] = {}
+        self.ssl_context = ssl.create_default_context()
+        self.connections_opened = 0
+
+    async def open_connection(self, scheme: str, host: str, port: int) -> tuple:
+        self.connections_opened += 1
+        return await asyncio.open_connection(host, port, ssl=self.ssl_context if scheme == 'https' else None)
+
+    async def request(self, url: str, headers: Dict[str, str]) -> HttpResponse:
+        return await asyncio.wait_for(self._request(url, headers), self.timeout)
+
+    async def _request(self, url: str, headers: Dict[str, str]) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == 'https' else 80))
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        request = ''.join(
+            f"{name}: {value}\r\n" for name, value in {
+                'Host': parts.netloc,
+                'User-Agent': USER_AGENT,
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+                **headers,
+            }.items())
+        request = f"GET {target} HTTP/1.1\r\n{request}\r\n".encode('latin-1')
+
+        idle = self.idle.setdefault(key, [])
+        while True:
+            reused = bool(idle)
+            reader, writer = idle.pop() if reused else await self.open_connection(*key)
+            try:
+                writer.write(request)
+                await writer.drain()
+                version, status, response_headers = await read_headers(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:
+                    continue  # the server closed an idle connection; try the next one
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            break
+
+        try:
+            if status in (204, 304) or 100 <= status < 200:
+                body, delimited = b'', True
+            elif response_headers.get('transfer-encoding', '').lower() == 'chunked':
+                body, delimited = await read_chunked(reader), True
+            elif 'content-length' in response_headers:
+                body, delimited = await reader.readexactly(int(response_headers['content-length'])), True
+            else:
+                body, delimited = await reader.read(), False
+        except BaseException:
+            writer.close()
+            raise
+
+        keep_alive = (delimited and version == 'HTTP/1.1'
+                      and response_headers.get('connection', '').lower() != 'close')
+        if keep_alive:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+        body = decode_body(body, response_headers.get('content-encoding', '').lower())
+        return HttpResponse(status, response_headers, body)
+
+    def close(self) -> None:
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle.clear()
+
+
+class RateLimiter:
+    """Space request starts at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_start = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        start = max(now, self.next_start)
+        # Reserve the slot before sleeping; the loop is single-threaded
+        self.next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def load_fetch_state(input_dir: str) -> Dict:
+    """Load the saved validators from input_dir, or start an empty state."""
+    state_file = os.path.join(input_dir, FETCH_STATE_FILENAME)
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('format') == FETCH_STATE_FORMAT:
+            return state
+        print(f"Ignoring fetch state with unknown format: {state_file}")
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, AttributeError) as e:
+        print(f"Ignoring unreadable fetch state {state_file}: {e}")
+    return {'format': FETCH_STATE_FORMAT, 'pages': {}}
+
+
+def save_fetch_state(state: Dict, input_dir: str) -> str:
+    state_file = os.path.join(input_dir, FETCH_STATE_FILENAME)
+    temp_file = state_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(state, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(temp_file, state_file)
+    return state_file
+
+
+def conditional_headers(entry: Optional[Dict], url: str, html_file: str) -> Dict[str, str]:
+    """
+    If-None-Match / If-Modified-Since for a page saved by an earlier fetch.
+    The validators only apply while the saved file is the one they came with,
+    so a page replaced by hand (or fetched from another URL) is re-downloaded.
+    """
+    if not entry or entry.get('url') != url:
+        return {}
+    try:
+        saved = os.stat(html_file)
+    except FileNotFoundError:
+        return {}
+    if (saved.st_size, saved.st_mtime_ns) != (entry.get('size'), entry.get('mtime_ns')):
+        return {}
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def save_page(body: bytes, html_file: str) -> None:
+    temp_file = html_file + '.tmp'
+    with open(temp_file, 'wb') as f:
+        f.write(body)
+    os.replace(temp_file, html_file)
+
+
+def error_text(error: BaseException) -> str:
+    return str(error) or type(error).__name__
+
+
+async def fetch_page(pool: ConnectionPool, limiter: RateLimiter, semaphore: asyncio.Semaphore, state: Dict,
+                     character: str, url: str, input_dir: str) -> FetchResult:
+    html_file = os.path.join(input_dir, f"{character}.html")
+    headers = conditional_headers(state['pages'].get(character), url, html_file)
+
+    async with semaphore:
+        await limiter.wait()
+        started = time.perf_counter()
+        try:
+            response_url = url
+            for _ in range(MAX_REDIRECTS + 1):
+                response = await pool.request(response_url, headers)
+                if response.status not in (301, 302, 303, 307, 308) or 'location' not in response.headers:
+                    break
+                response_url = urljoin(response_url, response.headers['location'])
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                ValueError, zlib.error) as e:
+            return FetchResult(character, 'failed', None, error=error_text(e))
+        seconds = time.perf_counter() - started
+
+    if response.status == 304:
+        try:
+            return FetchResult(character, 'unchanged', html_file, os.path.getsize(html_file), seconds)
+        except FileNotFoundError:
+            # Deleted while the request was in flight; the next fetch downloads it again
+            state['pages'].pop(character, None)
+            return FetchResult(character, 'failed', None, seconds=seconds, error='saved page disappeared')
+    if response.status != 200:
+        return FetchResult(character, 'failed', None, seconds=seconds, error=f"HTTP {response.status}")
+
+    try:
+        save_page(response.body, html_file)
+        saved = os.stat(html_file)
+    except OSError as e:
+        return FetchResult(character, 'failed', None, seconds=seconds, error=error_text(e))
+    state['pages'][character] = {
+        'url': url,
+        'etag': response.headers.get('etag'),
+        'last_modified': response.headers.get('last-modified'),
+        'size': saved.st_size,
+        'mtime_ns': saved.st_mtime_ns,
+    }
+    return FetchResult(character, 'updated', html_file, saved.st_size, seconds)
+
+
+async def fetch_pages_async(characters: Sequence[str], input_dir: str, base_url: str = DEFAULT_BASE_URL,
+                            concurrency: int = DEFAULT_CONCURRENCY, rate: float = DEFAULT_RATE,
+                            timeout: float = DEFAULT_TIMEOUT) -> List[FetchResult]:
+    state = load_fetch_state(input_dir)
+    pool = ConnectionPool(timeout)
+    limiter = RateLimiter(rate)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    try:
+        # One page failing in an unexpected way must not lose the other results
+        results = await asyncio.gather(*(
+            fetch_page(pool, limiter, semaphore, state, character, page_url(base_url, character), input_dir)
+            for character in characters), return_exceptions=True)
+    finally:
+        pool.close()
+        save_fetch_state(state, input_dir)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    return [FetchResult(character, 'failed', None, error=error_text(result)) if isinstance(result, Exception)
+            else result for character, result in zip(characters, results)]
+
+
+def fetch_pages(characters: Sequence[str], input_dir: str, base_url: str = DEFAULT_BASE_URL,
+                concurrency: int = DEFAULT_CONCURRENCY, rate: float = DEFAULT_RATE,
+                timeout: float = DEFAULT_TIMEOUT) -> List[FetchResult]:
+    """Fetch every character's page into input_dir; results are in input order."""
+    os.makedirs(input_dir, exist_ok=True)
+    return asyncio.run(fetch_pages_async(characters, input_dir, base_url, concurrency, rate, timeout))
+
+
+def print_fetch_results(results: Sequence[FetchResult], wall: float) -> None:
+    for result in results:
+        if result.status == 'updated':
+            print(f"  {result.character}: updated ({result.size:,} bytes, {result.seconds:.2f}s)")
+        elif result.status == 'unchanged':
+            print(f"  {result.character}: not modified ({result.seconds:.2f}s)")
+        else:
+            print(f"  {result.character}: failed: {result.error}")
+
+    counts = {status: sum(result.status == status for result in results)
+              for status in ('updated', 'unchanged', 'failed')}
+    slowest = max((result.seconds for result in results), default=0.0)
+    print(f"Fetched {len(results)} page(s) in {wall:.2f}s (slowest {slowest:.2f}s): "
+          f"{counts['updated']} updated, {counts['unchanged']} not modified, {counts['failed']} failed")
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Output file helpers: atomic writes that leave identical files untouched, so
+file watchers, caches and the frontend bundle only see real changes.
+"""
+
+import os
+
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    """Write through a temp file and os.replace, so readers never see half a file."""
+    temp_file = path + '.tmp'
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+    os.replace(temp_file, path)
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Atomically write data unless path already holds exactly it. Returns whether it wrote."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    write_bytes_atomic(path, data)
+    return True
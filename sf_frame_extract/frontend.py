@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Generated frontend loader: characters.ts in the output directory.
+
+The loader is built from the data manifest (see sf_frame_extract.publish)
+so it always lists exactly the characters that were published. It exports:
+
+  CHARACTER_INDEX  id and names of every character, the only data the app
+                   loads up front (enough to fill the character selects)
+  loadCharacter    the full data of one character, behind a dynamic
+                   import() per JSON file, so the bundler splits every
+                   character into its own chunk and the app only fetches
+                   the attacker and defender actually selected
+
+Only characters in the structured layout are listed; raw embedded JSON
+saved by the next-data strategy does not match the Character type. The
+loader is only written when the output directory is a frontend's src/data,
+i.e. src/types/frameData.ts sits beside it, which it imports the types
+from; any other output directory gets no TypeScript.
+
+The file is rewritten only when its content changes, so the dev server does
+not reload for runs that published nothing new.
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+from .constants import FEATURED_CHARACTERS, character_names_for
+from .files import write_if_changed
+from .model import is_structured
+
+LOADER_FILENAME = 'characters.ts'
+
+# The frontend's types, relative to its src/data (without the extension, as TypeScript imports it)
+TYPES_IMPORT = '../types/frameData'
+
+IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*')
+
+
+def ts_string(text: str) -> str:
+    """Single-quoted TypeScript string literal."""
+    escaped = text.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
+    return f"'{escaped}'"
+
+
+def ts_key(text: str) -> str:
+    return text if IDENTIFIER_PATTERN.fullmatch(text) else ts_string(text)
+
+
+def roster_order(characters: List[str]) -> List[str]:
+    """FEATURED_CHARACTERS first (in that order), then the rest alphabetically."""
+    featured = [character for character in FEATURED_CHARACTERS if character in characters]
+    return featured + sorted(character for character in characters if character not in featured)
+
+
+def render_character_loader(manifest: Dict, types_import: str = TYPES_IMPORT) -> str:
+    """characters.ts for the characters in a data manifest, importing the types from types_import."""
+    characters = roster_order(list(manifest['characters']))
+
+    lines = [
+        "// Generated by python -m sf_frame_extract from data_manifest.json; do not edit.",
+        f"import {{ Character, CharacterSummary }} from {ts_string(types_import)};",
+        "",
+        "// Loaded up front: just enough to fill the character selects",
+        "export const CHARACTER_INDEX: CharacterSummary[] = [",
+    ]
+    for character in characters:
+        names = character_names_for(character)
+        lines.append(f"  {{ character: {ts_string(character)}, character_name: "
+                     f"{{ japanese: {ts_string(names['japanese'])}, english: {ts_string(names['english'])} }} }},")
+    lines += [
+        "];",
+        "",
+        "// One chunk per character, fetched the first time it is selected",
+        "const LOADERS: Record<string, () => Promise<{ default: unknown }>> = {",
+    ]
+    for character in characters:
+        json_file = manifest['characters'][character]['file']
+        lines.append(f"  {ts_key(character)}: () => import({ts_string('./' + json_file)}),")
+    lines += [
+        "};",
+        "",
+        "const loaded = new Map<string, Promise<Character>>();",
+        "",
+        "export const loadCharacter = (id: string): Promise<Character> => {",
+        "  let character = loaded.get(id);",
+        "  if (!character) {",
+        "    const loader = LOADERS[id];",
+        "    if (!loader) return Promise.reject(new Error(`Unknown character: ${id}`));",
+        "    character = loader().then(module => module.default as Character);",
+        "    // Forget failed loads so selecting the character again retries",
+        "    character.catch(() => loaded.delete(id));",
+        "    loaded.set(id, character);",
+        "  }",
+        "  return character;",
+        "};",
+        "",
+        "export const getCharacterSummaryById = (id: string): CharacterSummary | undefined => {",
+        "  return CHARACTER_INDEX.find(character => character.character === id);",
+        "};",
+        "",
+        "export const getCharacterSummaryByName = (name: string): CharacterSummary | undefined => {",
+        "  return CHARACTER_INDEX.find(character =>",
+        "    character.character_name.english.toLowerCase() === name.toLowerCase() ||",
+        "    character.character_name.japanese === name",
+        "  );",
+        "};",
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def structured_characters(data_dir: str, manifest: Dict) -> Dict[str, Dict]:
+    """The manifest's character entries whose files are in the structured layout."""
+    characters = {}
+    for character, entry in manifest['characters'].items():
+        try:
+            with open(os.path.join(data_dir, entry['file']), 'r', encoding='utf-8') as f:
+                if not is_structured(json.load(f)):
+                    continue
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        characters[character] = entry
+    return characters
+
+
+def has_frontend_types(data_dir: str) -> bool:
+    """Whether data_dir is a frontend's src/data, with the types the loader imports beside it."""
+    return os.path.isfile(os.path.join(data_dir, *TYPES_IMPORT.split('/')) + '.ts')
+
+
+def write_character_loader(data_dir: str, manifest: Dict) -> Optional[str]:
+    """Write characters.ts into data_dir; None when data_dir is not a frontend's src/data."""
+    if not has_frontend_types(data_dir):
+        return None
+    loader_file = os.path.join(data_dir, LOADER_FILENAME)
+    loader = render_character_loader({**manifest, 'characters': structured_characters(data_dir, manifest)})
+    write_if_changed(loader_file, loader.encode('utf-8'))
+    return loader_file
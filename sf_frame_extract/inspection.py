@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Inspect mode: count the INSPECT_PATTERNS and the <script> elements of saved
+pages, to triage an archive of snapshots when the site layout changes.
+
+Each page is scanned once by one case-insensitive alternation of every
+pattern plus the <script> open tag; no DOM is built. Script bodies are
+measured by jumping to their closing tag, and "<script" text inside a script
+body is not counted as another script, as in an HTML parser.
+
+Pages are inspected in parallel (--jobs) and the results can be written as
+a CSV/TSV table with one row per page:
+
+    python -m sf_frame_extract --all --inspect --inspect-report inspect.csv
+"""
+
+import csv
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from .streaming import character_from_path, open_html_stream
+
+# Patterns counted per page
+INSPECT_PATTERNS = [
+    r'__NEXT_DATA__',
+    r'frameData',
+    r'characterData',
+    r'moveData',
+    r'通常技',
+    r'必殺技',
+    r'startup',
+    r'active',
+    r'recovery'
+]
+
+INSPECT_SCAN_PATTERN = re.compile(
+    '|'.join(f'(?P<p{index}>{pattern})' for index, pattern in enumerate(INSPECT_PATTERNS))
+    # Only the tag name, so patterns in the attributes (id="__NEXT_DATA__") still count
+    + r'|(?P<script><script\b)',
+    re.IGNORECASE)
+SCRIPT_CLOSE_PATTERN = re.compile(r'</script', re.IGNORECASE)
+
+# Scripts at least this long are listed individually
+LARGE_SCRIPT_LENGTH = 1000
+
+
+class ScriptInfo(NamedTuple):
+    index: int
+    length: int
+    json_like: bool
+
+
+class PageInspection(NamedTuple):
+    """What inspect mode found in one page (error set when it could not be read)."""
+    character: str
+    size: int
+    pattern_counts: Dict[str, int]
+    script_count: int
+    large_scripts: List[ScriptInfo]
+    error: Optional[str] = None
+
+
+def scan_page(html_content: str, character: str = '') -> PageInspection:
+    """Count patterns and scripts in a single pass over the page text."""
+    counts = [0] * len(INSPECT_PATTERNS)
+    script_count = 0
+    large_scripts = []
+    script_end = -1
+
+    for match in INSPECT_SCAN_PATTERN.finditer(html_content):
+        if match.lastgroup != 'script':
+            counts[int(match.lastgroup[1:])] += 1
+        elif match.start() >= script_end:
+            body_start = html_content.find('>', match.end()) + 1 or len(html_content)
+            close = SCRIPT_CLOSE_PATTERN.search(html_content, body_start)
+            script_end = close.start() if close else len(html_content)
+            length = script_end - body_start
+            if length > LARGE_SCRIPT_LENGTH:
+                body = html_content[body_start:script_end]
+                large_scripts.append(ScriptInfo(script_count, length, '{' in body and '"' in body))
+            script_count += 1
+
+    pattern_counts = {pattern: count for pattern, count in zip(INSPECT_PATTERNS, counts)}
+    return PageInspection(character, len(html_content), pattern_counts, script_count, large_scripts)
+
+
+def inspect_page(html_file_path: str) -> PageInspection:
+    """Read and scan one saved page; read errors are returned, not raised."""
+    character = character_from_path(html_file_path)
+    try:
+        with open_html_stream(html_file_path) as f:
+            html_content = f.read().decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return PageInspection(character, 0, {}, 0, [], str(e))
+    return scan_page(html_content, character)
+
+
+def inspect_pages(html_files: Sequence[str], jobs: int = 1) -> List[PageInspection]:
+    """Inspect pages in parallel, returning results in input order."""
+    if jobs <= 1 or len(html_files) <= 1:
+        return list(map(inspect_page, html_files))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Pages are cheap to scan, so hand them out in batches
+        chunksize = max(1, len(html_files) // (jobs * 8))
+        return list(executor.map(inspect_page, html_files, chunksize=chunksize))
+
+
+def print_inspection(inspection: PageInspection) -> None:
+    if inspection.error:
+        print(f"Error inspecting {inspection.character}.html: {inspection.error}")
+        return
+
+    print(f"\nInspecting {inspection.character}.html:")
+    print(f"  File size: {inspection.size:,} characters")
+
+    for pattern, count in inspection.pattern_counts.items():
+        if count > 0:
+            print(f"  Found '{pattern}': {count} occurrences")
+
+    print(f"  Script tags: {inspection.script_count}")
+    for script in inspection.large_scripts:
+        print(f"    Script {script.index}: {script.length:,} chars")
+        if script.json_like:
+            print(f"    Script {script.index}: Contains JSON-like data")
+
+
+def write_inspection_report(inspections: Sequence[PageInspection], report_file: str) -> str:
+    """One row per page; tab-separated for .tsv files, CSV otherwise."""
+    directory = os.path.dirname(report_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    delimiter = '\t' if report_file.endswith('.tsv') else ','
+    temp_file = report_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, delimiter=delimiter, lineterminator='\n')
+        writer.writerow(['character', 'size', 'scripts', 'large_scripts', 'json_scripts', 'largest_script']
+                        + INSPECT_PATTERNS + ['error'])
+        for inspection in inspections:
+            writer.writerow([
+                inspection.character,
+                inspection.size,
+                inspection.script_count,
+                len(inspection.large_scripts),
+                sum(script.json_like for script in inspection.large_scripts),
+                max((script.length for script in inspection.large_scripts), default=0),
+                *(inspection.pattern_counts.get(pattern, 0) for pattern in INSPECT_PATTERNS),
+                inspection.error or '',
+            ])
+    os.replace(temp_file, report_file)
+    return report_file
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Content-hash build manifest for incremental frame data extraction.
+
+The manifest lives in the output directory and records, per character, the
+SHA-256 of the input HTML, the extractor version that produced the output, the
+options that shape it (strategy, profile, minify) and the SHA-256 of the
+output JSON. A character is re-extracted only when one of those no longer
+matches, so a hotfix that touches two pages rebuilds two files
+instead of the whole roster.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+MANIFEST_FILENAME = '.build_manifest.json'
+MANIFEST_FORMAT = 1
+
+def file_sha256(path: str) -> str:
+    """Hash a file in chunks so large pages are never held in memory twice."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def extractor_version(*source_files: str) -> str:
+    """
+    Fingerprint the extractor from its source files. Any edit to the code that
+    produces the output invalidates every entry built by the previous code.
+    """
+    digest = hashlib.sha256()
+    for path in source_files:
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def load_manifest(output_dir: str) -> Dict:
+    """Load the manifest from output_dir, or start an empty one."""
+    manifest_file = os.path.join(output_dir, MANIFEST_FILENAME)
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format') == MANIFEST_FORMAT:
+            return manifest
+        print(f"Ignoring manifest with unknown format: {manifest_file}")
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, AttributeError) as e:
+        print(f"Ignoring unreadable manifest {manifest_file}: {e}")
+    return {'format': MANIFEST_FORMAT, 'characters': {}}
+
+def save_manifest(manifest: Dict, output_dir: str) -> str:
+    """Write the manifest atomically so an interrupted run never leaves it half-written."""
+    manifest_file = os.path.join(output_dir, MANIFEST_FILENAME)
+    temp_file = manifest_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(temp_file, manifest_file)
+    return manifest_file
+
+def rebuild_reason(manifest: Dict, character: str, html_file: str, output_dir: str, version: str,
+                   options: str = '') -> Optional[str]:
+    """Return why a character must be re-extracted, or None when its output is up to date."""
+    entry = manifest['characters'].get(character)
+    if entry is None:
+        return 'not in manifest'
+    if entry.get('extractor') != version:
+        return 'extractor changed'
+    if entry.get('options', '') != options:
+        return 'options changed'
+    if entry.get('input') != file_sha256(html_file):
+        return 'input changed'
+    output_file = os.path.join(output_dir, entry.get('output_file', ''))
+    if not os.path.isfile(output_file):
+        return 'output missing'
+    if entry.get('output') != file_sha256(output_file):
+        return 'output modified'
+    return None
+
+def record_build(manifest: Dict, character: str, html_file: str, output_file: str, version: str,
+                 options: str = '') -> None:
+    """Record the hashes (and output options) of a freshly built character."""
+    manifest['characters'][character] = {
+        'input': file_sha256(html_file),
+        'extractor': version,
+        'options': options,
+        'output': file_sha256(output_file),
+        'output_file': os.path.basename(output_file),
+    }
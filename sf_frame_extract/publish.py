@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Publishing the output directory for static hosting.
+
+data_manifest.json maps every character (and the punish index) to its
+file, a content hash and its size:
+
+    {"format": 1,
+     "characters": {"ken": {"file": "ken_frame_data_structured.json",
+                            "hash": "3f0c9a1e5b7d2c48", "size": 83121,
+                            "gzip_size": 9012, "br_size": 7655}},
+     "files": {"punish_index.json": {...}}}
+
+The hash is the first 16 hex digits of the file's SHA-256, usable as its
+ETag or in a cache-busting file name (hashed_filename), so hosts can serve
+the data with long cache lifetimes.
+
+With --precompress each file gets .gz and .br siblings for hosts that
+serve precompressed files. Brotli needs the optional brotli package (pip
+install brotli); without it only .gz is written. Siblings are compressed
+once per content hash, and existing ones are kept in step with their file
+even without --precompress, so a stale copy is never served. Everything is
+written atomically, and files whose bytes did not change are left alone.
+"""
+
+import glob
+import gzip
+import hashlib
+import importlib.util
+import json
+import os
+from typing import Dict, Optional
+
+from .constants import OUTPUT_SUFFIX
+from .files import write_if_changed
+from .punish import PUNISH_INDEX_FILENAME
+
+PUBLISH_MANIFEST_FILENAME = 'data_manifest.json'
+PUBLISH_MANIFEST_FORMAT = 1
+HASH_LENGTH = 16
+
+# Sibling suffix -> manifest size field
+COMPRESSED_SUFFIXES = {'.gz': 'gzip_size', '.br': 'br_size'}
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_filename(entry: Dict) -> str:
+    """ken_frame_data_structured.json -> ken_frame_data_structured.<hash>.json"""
+    stem, extension = os.path.splitext(entry['file'])
+    return f"{stem}.{entry['hash']}{extension}"
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_available() -> bool:
+    return importlib.util.find_spec('brotli') is not None
+
+
+def brotli_bytes(data: bytes) -> Optional[bytes]:
+    """Brotli at maximum quality, or None without the optional brotli package."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+def compressed_siblings(path: str, data: bytes, precompress: bool) -> Dict[str, int]:
+    """Write (or refresh) the .gz/.br siblings of path; returns their manifest size fields."""
+    sizes = {}
+    for suffix, field in COMPRESSED_SUFFIXES.items():
+        sibling = path + suffix
+        if not precompress and not os.path.exists(sibling):
+            continue
+        compressed = gzip_bytes(data) if suffix == '.gz' else brotli_bytes(data)
+        if compressed is None:
+            if os.path.exists(sibling):
+                os.remove(sibling)  # cannot refresh it, and a stale copy must not be served
+            continue
+        write_if_changed(sibling, compressed)
+        sizes[field] = len(compressed)
+    return sizes
+
+
+def siblings_current(path: str, entry: Optional[Dict], file_hash: str, precompress: bool) -> bool:
+    """True when the previous manifest entry already describes this content and its siblings."""
+    if not entry or entry.get('hash') != file_hash:
+        return False
+    for suffix, field in COMPRESSED_SUFFIXES.items():
+        exists = os.path.exists(path + suffix)
+        if exists != (field in entry):
+            return False
+        if precompress and not exists and (suffix == '.gz' or brotli_available()):
+            return False
+    return True
+
+
+def publish_entry(path: str, previous: Optional[Dict], precompress: bool) -> Dict:
+    with open(path, 'rb') as f:
+        data = f.read()
+    file_hash = content_hash(data)
+    if siblings_current(path, previous, file_hash, precompress):
+        return previous
+    return {
+        'file': os.path.basename(path),
+        'hash': file_hash,
+        'size': len(data),
+        **compressed_siblings(path, data, precompress),
+    }
+
+
+def load_publish_manifest(data_dir: str) -> Dict:
+    try:
+        with open(os.path.join(data_dir, PUBLISH_MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format') == PUBLISH_MANIFEST_FORMAT:
+            return manifest
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        pass
+    return {'format': PUBLISH_MANIFEST_FORMAT, 'characters': {}, 'files': {}}
+
+
+def write_publish_manifest(data_dir: str, precompress: bool = False) -> str:
+    """Rebuild data_manifest.json (and the compressed siblings) for every output file in data_dir."""
+    previous = load_publish_manifest(data_dir)
+    if precompress and not brotli_available():
+        print("brotli is not installed (pip install brotli); writing .gz files only")
+
+    characters = {}
+    for json_file in sorted(glob.glob(os.path.join(data_dir, f"*{OUTPUT_SUFFIX}"))):
+        character = os.path.basename(json_file)[:-len(OUTPUT_SUFFIX)]
+        characters[character] = publish_entry(json_file, previous['characters'].get(character), precompress)
+
+    files = {}
+    index_file = os.path.join(data_dir, PUNISH_INDEX_FILENAME)
+    if os.path.exists(index_file):
+        files[PUNISH_INDEX_FILENAME] = publish_entry(index_file, previous['files'].get(PUNISH_INDEX_FILENAME),
+                                                     precompress)
+
+    manifest = {'format': PUBLISH_MANIFEST_FORMAT, 'characters': characters, 'files': files}
+    manifest_file = os.path.join(data_dir, PUBLISH_MANIFEST_FILENAME)
+    write_if_changed(manifest_file, json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
+    return manifest_file
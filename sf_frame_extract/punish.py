@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Punish index: which defender moves punish an attacker move on block.
+
+A move punishes when its startup is a plain number no greater than the
+attacker move's block disadvantage (the frontend's
+startup <= |on_block| rule). The index is written once per extraction run
+as punish_index.json beside the character files:
+
+  defenders  per character, move ids sorted by numeric startup together
+             with those startups, so the punishers for any disadvantage are
+             one bisect plus a prefix slice
+  attackers  per character, every move with a negative numeric on_block and,
+             for each defender (in "characters" order), how long that
+             prefix is
+
+    index = PunishIndex.load('src/data/punish_index.json')
+    index.punishers('ryu', 12, 'ken')      # Ken's move ids punishing Ryu move 12
+    index.punishers_for('ken', 6)          # Ken's move ids with startup <= 6
+"""
+
+import glob
+import json
+import os
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional
+
+from .constants import OUTPUT_SUFFIX
+from .files import write_if_changed
+from .model import is_structured
+
+PUNISH_INDEX_FILENAME = 'punish_index.json'
+PUNISH_INDEX_FORMAT = 1
+
+
+def build_punish_index(roster: Iterable[Dict]) -> Dict:
+    """Build the punish index for a set of character data dicts."""
+    roster = sorted(filter(is_structured, roster), key=lambda character_data: character_data['character'])
+    characters = [character_data['character'] for character_data in roster]
+
+    defenders = {}
+    for character_data in roster:
+        timed = sorted((move['frames']['startup'], move['id']) for move in character_data['moves']
+                       if type(move['frames'].get('startup')) is int)
+        defenders[character_data['character']] = {
+            'startup': [startup for startup, _ in timed],
+            'moves': [move_id for _, move_id in timed],
+        }
+
+    attackers = {}
+    for character_data in roster:
+        move_ids = []
+        on_blocks = []
+        prefixes = []
+        for move in character_data['moves']:
+            on_block = move['frames'].get('on_block')
+            if type(on_block) is not int or on_block >= 0:
+                continue
+            move_ids.append(move['id'])
+            on_blocks.append(on_block)
+            prefixes.append([bisect_right(defenders[defender]['startup'], -on_block) for defender in characters])
+        attackers[character_data['character']] = {
+            'moves': move_ids,
+            'on_block': on_blocks,
+            'punishers': prefixes,
+        }
+
+    return {
+        'format': PUNISH_INDEX_FORMAT,
+        'characters': characters,
+        'defenders': defenders,
+        'attackers': attackers,
+    }
+
+
+def write_punish_index(data_dir: str) -> str:
+    """Rebuild punish_index.json from every character file in data_dir."""
+    roster = []
+    for json_file in sorted(glob.glob(os.path.join(data_dir, f"*{OUTPUT_SUFFIX}"))):
+        with open(json_file, 'r', encoding='utf-8') as f:
+            roster.append(json.load(f))
+
+    index_file = os.path.join(data_dir, PUNISH_INDEX_FILENAME)
+    # Left untouched when no character's punish data changed
+    write_if_changed(index_file, json.dumps(build_punish_index(roster), separators=(',', ':'),
+                                            ensure_ascii=False).encode('utf-8'))
+    return index_file
+
+
+class PunishIndex:
+    """Query API over a loaded punish index."""
+
+    def __init__(self, index: Dict):
+        if index.get('format') != PUNISH_INDEX_FORMAT:
+            raise ValueError(f"Unsupported punish index format {index.get('format')!r}")
+        self.index = index
+        self.defender_order = {character: i for i, character in enumerate(index['characters'])}
+        # move id -> row in the attacker's lists
+        self.attacker_rows = {character: {move_id: row for row, move_id in enumerate(attacker['moves'])}
+                              for character, attacker in index['attackers'].items()}
+
+    @classmethod
+    def load(cls, index_file: str) -> 'PunishIndex':
+        with open(index_file, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @property
+    def characters(self) -> List[str]:
+        return self.index['characters']
+
+    def punishers_for(self, defender: str, disadvantage: int) -> List[int]:
+        """Defender move ids (fastest first) that punish a move at -disadvantage on block."""
+        moves = self.index['defenders'][defender]
+        return moves['moves'][:bisect_right(moves['startup'], abs(disadvantage))]
+
+    def on_block(self, attacker: str, move_id: int) -> Optional[int]:
+        """The attacker move's on_block, or None when it is not a punishable move."""
+        row = self.attacker_rows[attacker].get(move_id)
+        return None if row is None else self.index['attackers'][attacker]['on_block'][row]
+
+    def punishers(self, attacker: str, move_id: int, defender: str) -> List[int]:
+        """Defender move ids that punish the attacker's move on block (empty when safe)."""
+        row = self.attacker_rows[attacker].get(move_id)
+        if row is None:
+            return []
+        prefix = self.index['attackers'][attacker]['punishers'][row][self.defender_order[defender]]
+        return self.index['defenders'][defender]['moves'][:prefix]
+
+
+def load_punish_index(data_dir: str) -> PunishIndex:
+    return PunishIndex.load(os.path.join(data_dir, PUNISH_INDEX_FILENAME))
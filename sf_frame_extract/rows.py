@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+CSS-class row extraction: turn a frame data <tr> into a move dict.
+
+Each output schema is a "profile": a move builder plus the categoriser that
+fills in the per-character category lists.
+
+  roster  the structure used for most of src/data (drive/SA gauge columns included)
+  ryu     Ryu's structure as used for Ken and Chun-Li (category/type per move,
+          japanese_base stripped of input notation, gauge columns zeroed)
+  flat    the early flat Ken/Chun-Li structure (correction flags, knockdown)
+"""
+
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .classify import categorize_moves, classify_ryu_move, group_moves_by_category
+from .constants import HEADER_NAMES, ROW_FIELD_CLASSES
+from .values import clean_frame_value
+
+# Input notation in full-width parentheses and a trailing strength marker
+INPUT_NOTATION_PATTERN = re.compile(r'（[^）]*）')
+TRAILING_STRENGTH_PATTERN = re.compile(r'[弱中強]$')
+
+
+def extract_text_from_element(element):
+    """Extract text from an element, handling nested tags."""
+    if element is None:
+        return ""
+    return element.get_text(strip=True)
+
+
+def index_row_cells(row) -> Dict[str, Any]:
+    """Map each known field to its first matching element in a single walk over the row."""
+    cells = {}
+    for element in row.find_all(class_=True):
+        for css_class in element.get('class', []):
+            marker = css_class.find('__')
+            if marker < 0:
+                continue
+            field = ROW_FIELD_CLASSES.get(css_class[:marker + 2])
+            if field and field not in cells:
+                cells[field] = element
+    return cells
+
+
+def cell_text(cells: Dict[str, Any], field: str) -> str:
+    return extract_text_from_element(cells.get(field))
+
+
+def cell_value(cells: Dict[str, Any], field: str) -> Any:
+    return clean_frame_value(extract_text_from_element(cells.get(field)))
+
+
+def build_roster_move(cells: Dict[str, Any], move_id: int, move_name: str) -> Dict:
+    """Build a move in the roster structure; category and type are filled in by categorize_moves."""
+    return {
+        "id": move_id,
+        "name": {
+            "japanese": move_name,
+            "english": move_name,  # We'll use the same for now
+            "japanese_base": move_name
+        },
+        "category": {
+            "japanese": "通常技",  # Default, will be determined later
+            "english": "Normal Attacks"
+        },
+        "type": "normal",
+        "frames": {
+            "startup": cell_value(cells, 'startup'),
+            "active": cell_value(cells, 'active'),
+            "recovery": cell_value(cells, 'recovery'),
+            "on_hit": cell_value(cells, 'on_hit'),
+            "on_block": cell_value(cells, 'on_block')
+        },
+        "properties": {
+            "damage": cell_value(cells, 'damage'),
+            "cancel": cell_text(cells, 'cancel'),
+            "combo_scaling": cell_text(cells, 'combo_scaling'),
+            "attribute": cell_text(cells, 'attribute'),
+            "notes": cell_text(cells, 'notes')
+        },
+        "drive_system": {
+            "gain_on_hit": cell_value(cells, 'gain_on_hit'),
+            "loss_on_guard": cell_value(cells, 'loss_on_guard'),
+            "loss_on_punish": cell_value(cells, 'loss_on_punish')
+        },
+        "sa_gain": cell_value(cells, 'sa_gain')
+    }
+
+
+def build_ryu_move(cells: Dict[str, Any], move_id: int, move_name: str) -> Dict:
+    """Build a move in Ryu's structure, classifying it immediately."""
+    damage = cell_value(cells, 'damage')
+    category, move_type = classify_ryu_move(move_name)
+
+    # Extract Japanese base name (remove input notation and strength indicators)
+    japanese_base = INPUT_NOTATION_PATTERN.sub('', move_name)
+    japanese_base = TRAILING_STRENGTH_PATTERN.sub('', japanese_base).strip()
+
+    return {
+        "id": move_id,
+        "name": {
+            "japanese": move_name,
+            "english": move_name,  # Will need translation later
+            "japanese_base": japanese_base
+        },
+        "category": category,
+        "type": move_type,
+        "frames": {
+            "startup": cell_value(cells, 'startup'),
+            "active": cell_value(cells, 'active'),
+            "recovery": cell_value(cells, 'recovery'),
+            "on_hit": cell_value(cells, 'on_hit'),
+            "on_block": cell_value(cells, 'on_block')
+        },
+        "properties": {
+            "damage": damage if damage else 0,
+            "cancel": cell_text(cells, 'cancel') or None,
+            "combo_scaling": "",  # Not available in HTML
+            "attribute": cell_text(cells, 'attribute') or None,
+            "notes": ""  # Not available in HTML
+        },
+        "drive_system": {
+            "gain_on_hit": 0,  # Not available in HTML
+            "loss_on_guard": 0,  # Not available in HTML
+            "loss_on_punish": 0  # Not available in HTML
+        },
+        "sa_gain": 0  # Not available in HTML
+    }
+
+
+def build_flat_move(cells: Dict[str, Any], move_id: int, move_name: str) -> Dict:
+    """Build a move in the early flat Ken/Chun-Li structure."""
+    category, move_type = classify_ryu_move(move_name)
+
+    return {
+        "id": move_id,
+        "name": {
+            "japanese": move_name,
+            "english": move_name,
+            "japanese_base": move_name
+        },
+        "category": category,
+        "type": move_type,
+        "frames": {
+            "startup": cell_value(cells, 'startup'),
+            "active": cell_value(cells, 'active'),
+            "recovery": cell_value(cells, 'recovery'),
+            "on_hit": cell_value(cells, 'on_hit'),
+            "on_block": cell_value(cells, 'on_block')
+        },
+        "damage": cell_value(cells, 'damage'),
+        "cancel": cell_text(cells, 'cancel') or None,
+        "combo_correctable": cell_text(cells, 'combo_scaling') == '○',
+        "attribute": cell_text(cells, 'attribute') or None,
+        "special_correctable": cell_text(cells, 'special_correct') == '○',
+        "knockdown": cell_text(cells, 'knockdown') or None
+    }
+
+
+class MoveProfile(NamedTuple):
+    build_move: Callable[[Dict[str, Any], int, str], Dict]
+    categorize: Callable[[List[Dict]], Dict[str, List[int]]]
+
+
+MOVE_PROFILES = {
+    'roster': MoveProfile(build_roster_move, categorize_moves),
+    'ryu': MoveProfile(build_ryu_move, group_moves_by_category),
+    'flat': MoveProfile(build_flat_move, group_moves_by_category),
+}
+DEFAULT_PROFILE = 'roster'
+
+
+def extract_move_data_from_row(row, move_id: int, cells: Optional[Dict[str, Any]] = None,
+                               profile: str = DEFAULT_PROFILE) -> Optional[Dict]:
+    """Extract move data from a table row using CSS classes."""
+    if cells is None:
+        cells = index_row_cells(row)
+
+    move_name = extract_text_from_element(cells.get('name'))
+    if not move_name:
+        return None
+
+    return MOVE_PROFILES[profile].build_move(cells, move_id, move_name)
+
+
+def find_frame_rows(soup) -> List[Tuple[Any, Dict[str, Any]]]:
+    """Return (row, cells) for every <tr> that carries frame data classes."""
+    frame_rows = []
+    for row in soup.find_all('tr'):
+        cells = index_row_cells(row)
+        if 'startup' in cells or 'name' in cells:
+            frame_rows.append((row, cells))
+    return frame_rows
+
+
+def extract_moves_from_rows(frame_rows: List[Tuple[Any, Dict[str, Any]]], profile: str = DEFAULT_PROFILE) -> List[Dict]:
+    """Build moves from indexed rows, skipping header rows and numbering from 1."""
+    moves = []
+    move_id = 1
+
+    for row, cells in frame_rows:
+        move_data = extract_move_data_from_row(row, move_id, cells, profile)
+        if move_data:
+            # Skip header rows (技名, 発生, etc.)
+            if move_data['name']['japanese'] in HEADER_NAMES:
+                continue
+
+            moves.append(move_data)
+            move_id += 1
+
+    return moves
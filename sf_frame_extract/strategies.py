@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Extraction strategies, one per source format:
+
+  next-data  Next.js pages: the JSON in <script id="__NEXT_DATA__"> (or other
+             embedded JSON assignments)
+  css        frame data rows marked up with hashed frame_*__ CSS classes
+  table      any plain <table> whose first row holds column headers
+
+Each strategy takes an HtmlDocument (the page bytes, parsed at most once and
+shared by every strategy tried) and returns character data or None. Before
+any tree is built, page_fingerprint() checks the bytes for each strategy's
+markers, and the 'auto' strategy only tries the strategies that can match.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .classify import categorize_moves
+from .constants import CATEGORY_MAPPINGS, DEFAULT_HEALTH, ROW_FIELD_CLASSES, character_names_for
+from .html_parsing import DEFAULT_PARSER, HtmlDocument, parse_html
+from .rows import DEFAULT_PROFILE, MOVE_PROFILES, extract_moves_from_rows, find_frame_rows
+from .timing import stage
+from .values import add_typed_values, parse_frame_value
+
+
+# Attribute spellings for the Next.js data script, as str and as bytes
+NEXT_DATA_MARKERS = ('id="__NEXT_DATA__"', "id='__NEXT_DATA__'", 'id=__NEXT_DATA__')
+NEXT_DATA_BYTE_MARKERS = tuple(marker.encode('ascii') for marker in NEXT_DATA_MARKERS)
+
+# Bytes at least one of which every page the next-data strategy can read contains
+EMBEDDED_JSON_BYTE_MARKERS = (b'__NEXT_DATA__', b'frameData', b'characterData', b'moveData',
+                              b'__INITIAL_STATE__', b'"character"', b'"moves"')
+# find_frame_rows needs a name or startup cell
+FRAME_ROW_BYTE_MARKERS = tuple(prefix.encode('ascii') for prefix, field in ROW_FIELD_CLASSES.items()
+                               if field in ('name', 'startup'))
+TABLE_TAG_PATTERN = re.compile(rb'<table', re.IGNORECASE)
+
+SCRIPT_OPEN_PATTERN = re.compile(r'<script\b[^>]*>', re.IGNORECASE)
+SCRIPT_CLOSE_PATTERN = re.compile(r'</script', re.IGNORECASE)
+# Names whose value may be the frame data object, as JS assignments
+# (window.frameData = {...}) or object/JSON keys ("frameData": {...})
+EMBEDDED_JSON_ANCHORS = ('__NEXT_DATA__', '__INITIAL_STATE__', 'frameData', 'characterData', 'moveData', 'data')
+# What must follow an anchor name: optional closing quote, then = or :, then an object
+ANCHOR_VALUE_PATTERN = re.compile(r'''["']?\s*[:=]\s*(?=\{)''')
+# Text a decoded object must contain for an anchor nested in it to hold frame data
+NESTED_ANCHOR_KEYS = ('"character"', '"moves"', '__NEXT_DATA__')
+# Where an unnamed JSON object can start: a brace before a quoted key
+JSON_OBJECT_START_PATTERN = re.compile(r'\{\s*"')
+# Unnamed objects must be at least this long to be considered
+GENERIC_JSON_MIN_LENGTH = 1000
+JSON_DECODER = json.JSONDecoder()
+JSON_DECODE_WINDOW = 4 * 1024
+
+
+class PageFingerprint(NamedTuple):
+    """Which strategies can possibly match a page, from a plain byte scan."""
+    next_data: bool
+    css: bool
+    table: bool
+
+    def allows(self, strategy: str) -> bool:
+        return getattr(self, strategy.replace('-', '_'))
+
+
+def page_fingerprint(raw_html: bytes) -> PageFingerprint:
+    """
+    Look for each strategy's markers in the raw bytes without decoding or
+    parsing. A miss means the strategy cannot find anything; a hit only
+    means it may.
+    """
+    return PageFingerprint(
+        next_data=any(marker in raw_html for marker in EMBEDDED_JSON_BYTE_MARKERS),
+        css=any(marker in raw_html for marker in FRAME_ROW_BYTE_MARKERS),
+        table=b'<table' in raw_html or TABLE_TAG_PATTERN.search(raw_html) is not None,
+    )
+
+
+def select_frame_data(next_data: Dict) -> Dict:
+    """
+    Pick the character/frame data out of a decoded __NEXT_DATA__ object.
+    Falls back to the whole object when no known key is found.
+    """
+    print(f"Found __NEXT_DATA__ with keys: {list(next_data.keys())}")
+
+    # Extract character data from Next.js data structure
+    if 'props' in next_data and 'pageProps' in next_data['props']:
+        page_props = next_data['props']['pageProps']
+        print(f"PageProps keys: {list(page_props.keys())}")
+
+        # Look for frame data in various locations
+        possible_keys = ['frameData', 'characterData', 'data', 'moves', 'character']
+        for key in possible_keys:
+            if key in page_props:
+                data = page_props[key]
+                if isinstance(data, dict):
+                    return data
+
+        # Sometimes the data is nested deeper
+        for key, value in page_props.items():
+            if isinstance(value, dict):
+                if 'moves' in value or 'character' in value or 'frameData' in value:
+                    return value
+                # Check one level deeper
+                for subkey, subvalue in value.items():
+                    if isinstance(subvalue, dict) and ('moves' in subvalue or 'character' in subvalue):
+                        return subvalue
+
+    return next_data  # Return the whole thing if we can't find specific data
+
+
+def extract_next_data_fast(html: Union[str, bytes]) -> Optional[Dict]:
+    """
+    Fast path for Next.js pages: locate <script id="__NEXT_DATA__"> with a plain
+    substring search, slice out its body and decode it directly, without
+    building a DOM. Accepts raw bytes so the rest of the page is never decoded.
+    Returns None when the tag is missing or its body is not valid JSON.
+    """
+    is_bytes = isinstance(html, bytes)
+    markers = NEXT_DATA_BYTE_MARKERS if is_bytes else NEXT_DATA_MARKERS
+    tag_open, tag_close, script_end = (b'<', b'>', b'</script') if is_bytes else ('<', '>', '</script')
+
+    for marker in markers:
+        marker_pos = html.find(marker)
+        if marker_pos >= 0:
+            break
+    else:
+        return None
+
+    # The marker must sit inside a <script ...> opening tag
+    tag_start = html.rfind(tag_open, 0, marker_pos)
+    if tag_start < 0 or html[tag_start + 1:tag_start + 7].lower() not in ('script', b'script'):
+        return None
+
+    body_start = html.find(tag_close, marker_pos)
+    if body_start < 0:
+        return None
+    body_start += 1
+    body_end = html.find(script_end, body_start)
+    if body_end < 0:
+        return None
+
+    try:
+        next_data = json.loads(html[body_start:body_end])
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        print(f"JSON decode error for __NEXT_DATA__ script: {e}")
+        return None
+
+    if not isinstance(next_data, dict):
+        return None
+
+    return select_frame_data(next_data)
+
+
+def extract_json_from_html(html_content: str, parser: str = DEFAULT_PARSER) -> Optional[Dict]:
+    """
+    Extract JSON data from HTML content.
+    This looks for embedded JSON data in script tags. No tree is built, so
+    parser is unused; it is kept for existing callers.
+    """
+    # Next.js pages carry everything in <script id="__NEXT_DATA__">
+    next_data = extract_next_data_fast(html_content)
+    if next_data:
+        return next_data
+
+    # Fall back to scanning every script tag
+    return scan_scripts_for_json(html_content)
+
+
+def iter_script_bodies(html_content: str) -> Iterator[str]:
+    """The text of every <script> element, in document order, found without a DOM."""
+    position = 0
+    while True:
+        script_open = SCRIPT_OPEN_PATTERN.search(html_content, position)
+        if not script_open:
+            return
+        script_close = SCRIPT_CLOSE_PATTERN.search(html_content, script_open.end())
+        end = script_close.start() if script_close else len(html_content)
+        yield html_content[script_open.end():end]
+        position = end
+
+
+def decode_json_at(content: str, position: int) -> Tuple[Any, int]:
+    """
+    raw_decode the JSON value starting at position; returns (value, end).
+
+    JSONDecodeError counts the lines from the start of the string up to the
+    error, so a failed attempt deep into a large script would cost time
+    proportional to its offset. Decoding from a window starting at position
+    keeps each attempt proportional to the value instead; the window doubles
+    while the value may run past its end.
+    """
+    window = JSON_DECODE_WINDOW
+    while True:
+        chunk = content[position:position + window]
+        try:
+            value, end = JSON_DECODER.raw_decode(chunk)
+            return value, position + end
+        except json.JSONDecodeError as e:
+            truncated = e.pos >= len(chunk) - 16 or e.msg.startswith('Unterminated string')
+            if not truncated or position + window >= len(content):
+                raise
+            window *= 2
+
+
+def next_json_anchor(content: str, name: str, start: int) -> int:
+    """
+    Value start of the first anchor called name at or after start: the name
+    followed by = or : and an object. -1 when there is none. Each name is
+    found with str.find, which is much faster than one alternation regex
+    over the script.
+    """
+    position = content.find(name, start)
+    while position >= 0:
+        end = position + len(name)
+        # 'data' only as a whole word, not inside frameData or metadata
+        whole_word = name != 'data' or position == 0 or not (content[position - 1].isalnum()
+                                                             or content[position - 1] == '_')
+        value = ANCHOR_VALUE_PATTERN.match(content, end) if whole_word else None
+        if value:
+            return value.end()
+        position = content.find(name, end)
+    return -1
+
+
+def anchor_name(key: str) -> Optional[str]:
+    """The EMBEDDED_JSON_ANCHORS name an object key ends with, as next_json_anchor would match it."""
+    for name in EMBEDDED_JSON_ANCHORS:
+        if key.endswith(name):
+            if name == 'data' and len(key) > 4 and (key[-5].isalnum() or key[-5] == '_'):
+                continue
+            return name
+    return None
+
+
+def iter_anchored_values(value: Any) -> Iterator[Tuple[str, Dict]]:
+    """
+    (anchor name, object) for every object below value stored under an
+    anchor-named key, in document order: the anchors next_json_anchor would
+    find inside the text value was decoded from.
+    """
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if isinstance(child, dict):
+                name = anchor_name(key)
+                if name:
+                    yield name, child
+            if isinstance(child, (dict, list)):
+                yield from iter_anchored_values(child)
+    elif isinstance(value, list):
+        for child in value:
+            if isinstance(child, (dict, list)):
+                yield from iter_anchored_values(child)
+
+
+def is_frame_data(data: Any) -> bool:
+    return isinstance(data, dict) and ('character' in data or 'moves' in data)
+
+
+def find_frame_data(value: Any) -> Optional[Dict]:
+    """
+    The first object, in document order, at or below value that looks like
+    frame data and is large enough to be the real thing.
+    """
+    if isinstance(value, dict):
+        if is_frame_data(value) and len(json.dumps(value, ensure_ascii=False)) > GENERIC_JSON_MIN_LENGTH:
+            return value
+        children = value.values()
+    elif isinstance(value, list):
+        children = value
+    else:
+        return None
+    for child in children:
+        found = find_frame_data(child)
+        if found:
+            return found
+    return None
+
+
+def scan_embedded_json(content: str) -> Optional[Dict]:
+    """
+    Find frame data JSON in one script body. Two passes, each linear in the
+    script: first json raw_decode at every named anchor (__NEXT_DATA__ =,
+    frameData:, "characterData":, window.__INITIAL_STATE__ =, ...), then at
+    the start of every unnamed object ({"...), looking inside each decoded
+    object for frame data and then skipping it whole.
+    raw_decode reads complete objects of any depth and stops at their end,
+    so trailing script and braces inside strings are handled correctly.
+    Anchors are visited in script order, one cursor per name. Anchors nested
+    in a decoded object ("data": {"data": ...}) are checked on the decoded
+    value instead of being decoded again, and the cursors jump past it.
+    """
+    upcoming = {name: next_json_anchor(content, name, 0) for name in EMBEDDED_JSON_ANCHORS}
+    while True:
+        anchors = [(position, name) for name, position in upcoming.items() if position >= 0]
+        if not anchors:
+            break
+        position, name = min(anchors)
+        resume = position
+        try:
+            data, end = decode_json_at(content, position)
+        except json.JSONDecodeError as e:
+            if name == '__NEXT_DATA__':
+                print(f"JSON decode error for __NEXT_DATA__: {e}")
+                return None
+        else:
+            if name == '__NEXT_DATA__':
+                if isinstance(data, dict):
+                    return select_frame_data(data)
+            elif is_frame_data(data):
+                return data
+            # Walking the decoded object only pays off when its text has a key frame data could carry
+            elif any(content.find(key, position, end) >= 0 for key in NESTED_ANCHOR_KEYS):
+                for nested_name, nested in iter_anchored_values(data):
+                    if nested_name == '__NEXT_DATA__':
+                        return select_frame_data(nested)
+                    if is_frame_data(nested):
+                        return nested
+            resume = end
+        for other, next_position in upcoming.items():
+            if 0 <= next_position <= resume:
+                upcoming[other] = next_json_anchor(content, other, resume)
+
+    # Large objects assigned to other names; only worth decoding when a
+    # frame data key occurs at all
+    if '"character"' not in content and '"moves"' not in content:
+        return None
+    resume = 0
+    for candidate in JSON_OBJECT_START_PATTERN.finditer(content):
+        position = candidate.start()
+        if position < resume:
+            continue
+        try:
+            data, end = decode_json_at(content, position)
+        except json.JSONDecodeError:
+            continue
+        if end - position > GENERIC_JSON_MIN_LENGTH:
+            data = find_frame_data(data)
+            if data:
+                return data
+        # Objects inside a decoded one were just checked as part of it
+        resume = end
+
+    return None
+
+
+def scan_scripts_for_json(html_content: str) -> Optional[Dict]:
+    """Frame data JSON from the first script that holds any (see scan_embedded_json)."""
+    for content in iter_script_bodies(html_content):
+        data = scan_embedded_json(content)
+        if data:
+            return data
+    return None
+
+
+def extract_table_data(html_content: str, parser: str = DEFAULT_PARSER) -> List[Dict]:
+    """
+    Extract frame data from HTML tables if present.
+    """
+    return extract_table_rows(parse_html(html_content, parser))
+
+
+def extract_table_rows(soup) -> List[Dict]:
+    """
+    Read every table under soup as header -> cell text dicts.
+    """
+    moves = []
+
+    # Look for tables containing frame data
+    tables = soup.find_all('table')
+
+    for table in tables:
+        rows = table.find_all('tr')
+        headers = []
+
+        # Extract headers
+        if rows:
+            header_row = rows[0]
+            headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
+
+        # Extract data rows
+        for row in rows[1:]:
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 3:  # Minimum required columns
+                move_data = {}
+                for i, cell in enumerate(cells):
+                    if i < len(headers):
+                        move_data[headers[i]] = cell.get_text(strip=True)
+
+                if move_data:
+                    moves.append(move_data)
+
+    return moves
+
+
+def convert_table_to_moves(table_data: List[Dict], character: str) -> List[Dict]:
+    """
+    Convert extracted table data to the standardized move format.
+    """
+    moves = []
+    move_id = 1
+
+    for row in table_data:
+        move = {
+            "id": move_id,
+            "name": {
+                "japanese": row.get('技名', row.get('Move Name', f'技{move_id}')),
+                "english": row.get('技名', row.get('Move Name', f'技{move_id}')),
+                "japanese_base": row.get('技名', row.get('Move Name', f'技{move_id}'))
+            },
+            "category": {
+                "japanese": "通常技",  # Default, should be determined from context
+                "english": "Normal Attacks"
+            },
+            "type": "normal",  # Will be determined based on category
+            "frames": {
+                "startup": parse_frame_value(row.get('発生', row.get('Startup', ''))),
+                "active": parse_frame_value(row.get('持続', row.get('Active', ''))),
+                "recovery": parse_frame_value(row.get('硬直', row.get('Recovery', ''))),
+                "on_hit": parse_frame_value(row.get('ヒット', row.get('On Hit', ''))),
+                "on_block": parse_frame_value(row.get('ガード', row.get('On Block', '')))
+            },
+            "properties": {
+                "damage": parse_frame_value(row.get('ダメージ', row.get('Damage', ''))),
+                "cancel": row.get('キャンセル', row.get('Cancel', '')),
+                "combo_scaling": row.get('補正', row.get('Scaling', '')),
+                "attribute": row.get('属性', row.get('Attribute', '')),
+                "notes": row.get('備考', row.get('Notes', ''))
+            },
+            "drive_system": {
+                "gain_on_hit": parse_frame_value(row.get('DRVゲイン(ヒット)', row.get('Drive Gain Hit', ''))),
+                "loss_on_guard": parse_frame_value(row.get('DRVロス(ガード)', row.get('Drive Loss Guard', ''))),
+                "loss_on_punish": parse_frame_value(row.get('DRVロス(カウンター)', row.get('Drive Loss Counter', '')))
+            },
+            "sa_gain": parse_frame_value(row.get('SAゲイン', row.get('SA Gain', '')))
+        }
+
+        moves.append(move)
+        move_id += 1
+
+    return moves
+
+
+def build_character_data(character: str, moves: List[Dict],
+                         categorize: Callable[[List[Dict]], Dict[str, List[int]]] = categorize_moves) -> Dict:
+    """
+    Create the complete character data structure.
+    """
+    categories = categorize(moves)
+    add_typed_values(moves)
+
+    # Add formatted categories
+    formatted_categories = {}
+    for cat_key, move_ids in categories.items():
+        formatted_categories[cat_key] = {
+            **CATEGORY_MAPPINGS[cat_key],
+            "moves": move_ids
+        }
+
+    return {
+        "character": character,
+        "character_name": character_names_for(character),
+        "health": DEFAULT_HEALTH,  # Default, should be adjusted per character
+        "categories": formatted_categories,
+        "moves": moves
+    }
+
+
+def next_data_strategy(document: HtmlDocument, character: str,
+                       profile: str = DEFAULT_PROFILE) -> Optional[Dict]:
+    """Embedded JSON: __NEXT_DATA__ fast path on the raw bytes, then a script scan."""
+    with stage('json'):
+        json_data = extract_next_data_fast(document.raw)
+        if not json_data:
+            json_data = scan_scripts_for_json(document.text)
+    if not json_data:
+        return None
+    json_data.setdefault('character', character)
+    return json_data
+
+
+def css_strategy(document: HtmlDocument, character: str,
+                 profile: str = DEFAULT_PROFILE) -> Optional[Dict]:
+    """Rows marked up with frame_*__ CSS classes."""
+    soup = document.soup
+    with stage('scan'):
+        frame_rows = find_frame_rows(soup)
+    print(f"Found {len(frame_rows)} potential frame data rows")
+
+    with stage('extract'):
+        moves = extract_moves_from_rows(frame_rows, profile)
+    if not moves:
+        print(f"No moves found for {character}!")
+        return None
+
+    print(f"Successfully extracted {len(moves)} moves for {character}")
+    with stage('categorize'):
+        return build_character_data(character, moves, MOVE_PROFILES[profile].categorize)
+
+
+def table_strategy(document: HtmlDocument, character: str,
+                   profile: str = DEFAULT_PROFILE) -> Optional[Dict]:
+    """Generic header/data tables."""
+    soup = document.soup
+    with stage('scan'):
+        table_data = extract_table_rows(soup)
+    if not table_data:
+        return None
+    with stage('extract'):
+        moves = convert_table_to_moves(table_data, character)
+    with stage('categorize'):
+        return build_character_data(character, moves)
+
+
+STRATEGIES = {
+    'next-data': next_data_strategy,
+    'css': css_strategy,
+    'table': table_strategy,
+}
+DEFAULT_STRATEGY = 'css'
+
+
+# Order tried by the 'auto' strategy
+AUTO_STRATEGY_ORDER = ('next-data', 'table', 'css')
+
+
+def auto_strategies(raw_html: bytes) -> List[str]:
+    """AUTO_STRATEGY_ORDER minus the strategies the page's fingerprint rules out."""
+    fingerprint = page_fingerprint(raw_html)
+    return [name for name in AUTO_STRATEGY_ORDER if fingerprint.allows(name)]
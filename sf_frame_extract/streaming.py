@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Streaming Frame Data Extractor for Street Fighter 6
+
+Reads a page in fixed-size chunks and feeds it to html.parser.HTMLParser,
+tracking only the open <tr> and the frame_*__ cells inside it. Each move is
+yielded as soon as its row closes, so no DOM is built and peak memory stays
+flat regardless of page size. Produces the same moves as the css strategy.
+"""
+
+import codecs
+import gzip
+import os
+from collections import deque
+from html.parser import HTMLParser
+from typing import Dict, Iterator, List, Optional
+
+from .constants import HEADER_NAMES, ROW_FIELD_CLASSES
+from .rows import DEFAULT_PROFILE, MOVE_PROFILES, extract_move_data_from_row
+from .strategies import build_character_data
+from .timing import stage
+
+CHUNK_SIZE = 64 * 1024
+
+# Elements that never get an end tag, so they must not be pushed on the stack
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+}
+
+# Text inside these is not part of a cell's visible text
+SKIPPED_TEXT_ELEMENTS = {'script', 'style', 'template'}
+
+
+class StreamedCell:
+    """Text collected for one frame_*__ cell; quacks like a bs4 Tag for get_text()."""
+
+    __slots__ = ('parts',)
+
+    def __init__(self):
+        self.parts: List[str] = []
+
+    def get_text(self, strip: bool = False) -> str:
+        return ''.join(self.parts)
+
+
+class FrameRowParser(HTMLParser):
+    """Collect frame_*__ cell text per <tr> and queue each finished row."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = deque()
+        self.cells: Optional[Dict[str, StreamedCell]] = None
+        # Open elements inside the current row: (tag, cells that element opened)
+        self.stack: List[tuple] = []
+        self.active_cells: List[StreamedCell] = []
+        self.text: List[str] = []
+        self.skip_depth = 0
+
+    def flush_text(self):
+        """Hand the text run since the last tag to every cell that encloses it."""
+        if not self.text:
+            return
+        text = ''.join(self.text).strip()
+        self.text = []
+        if text and not self.skip_depth:
+            for cell in self.active_cells:
+                cell.parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self.flush_text()
+        if tag == 'tr':
+            if self.cells is not None:
+                self.finish_row()
+            self.cells = {}
+            return
+        if self.cells is None:
+            return
+
+        opened = []
+        css_classes = next((value for name, value in attrs if name == 'class'), None) or ''
+        for css_class in css_classes.split():
+            marker = css_class.find('__')
+            if marker < 0:
+                continue
+            field = ROW_FIELD_CLASSES.get(css_class[:marker + 2])
+            if field and field not in self.cells:
+                self.cells[field] = StreamedCell()
+                opened.append(self.cells[field])
+
+        if tag in VOID_ELEMENTS:
+            return
+        if tag in SKIPPED_TEXT_ELEMENTS:
+            self.skip_depth += 1
+        self.stack.append((tag, opened))
+        self.active_cells.extend(opened)
+
+    def handle_startendtag(self, tag, attrs):
+        self.flush_text()
+
+    def handle_comment(self, data):
+        self.flush_text()
+
+    def handle_endtag(self, tag):
+        self.flush_text()
+        if self.cells is None:
+            return
+        if tag == 'tr':
+            self.finish_row()
+            return
+        # Close up to the matching open element, tolerating unclosed children
+        if not any(open_tag == tag for open_tag, _ in self.stack):
+            return
+        while self.stack:
+            open_tag, opened = self.stack.pop()
+            if open_tag in SKIPPED_TEXT_ELEMENTS:
+                self.skip_depth -= 1
+            for cell in opened:
+                self.active_cells.remove(cell)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.cells is not None:
+            self.text.append(data)
+
+    def finish_row(self):
+        cells = self.cells
+        self.cells = None
+        self.stack = []
+        self.active_cells = []
+        self.skip_depth = 0
+        if 'startup' in cells or 'name' in cells:
+            self.rows.append(cells)
+
+
+def open_html_stream(path: str):
+    """Open a saved page, transparently decompressing .gz snapshots."""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def character_from_path(path: str) -> str:
+    """Character id from a saved page path (ken.html, ken.html.gz -> ken)."""
+    filename = os.path.basename(path)
+    character = filename[:-len('.gz')] if filename.endswith('.gz') else filename
+    return character.replace('.html', '')
+
+
+def iter_moves(path: str, chunk_size: int = CHUNK_SIZE, profile: str = DEFAULT_PROFILE) -> Iterator[Dict]:
+    """Yield move dicts from a saved page as each frame data row closes."""
+    parser = FrameRowParser()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    move_id = 1
+
+    def drain():
+        nonlocal move_id
+        while parser.rows:
+            move_data = extract_move_data_from_row(None, move_id, parser.rows.popleft(), profile)
+            if not move_data or move_data['name']['japanese'] in HEADER_NAMES:
+                continue
+            yield move_data
+            move_id += 1
+
+    with open_html_stream(path) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(decoder.decode(chunk))
+            yield from drain()
+
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    parser.flush_text()
+    if parser.cells is not None:
+        parser.finish_row()
+    yield from drain()
+
+
+def stream_character_data(html_file_path: str, profile: str = DEFAULT_PROFILE) -> Optional[Dict]:
+    """Extract complete character data from HTML file without building a DOM."""
+    character = character_from_path(html_file_path)
+    print(f"Extracting data for {character}...")
+
+    try:
+        with stage('stream'):
+            moves = list(iter_moves(html_file_path, profile=profile))
+    except Exception as e:
+        print(f"Error extracting data from {html_file_path}: {e}")
+        return None
+
+    if not moves:
+        print(f"No moves found for {character}!")
+        return None
+
+    print(f"Successfully extracted {len(moves)} moves for {character}")
+    with stage('categorize'):
+        return build_character_data(character, moves, MOVE_PROFILES[profile].categorize)
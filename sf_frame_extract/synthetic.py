@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Synthetic SF6-style frame data pages, for benchmarks and for trying the
+extractors without the saved site pages.
+
+A page can carry all three sources the strategies read:
+- a frame data table whose cells use hashed CSS module classes
+  (frame_startup_frame__Xy12z, ...), as on the official site
+- a <script id="__NEXT_DATA__"> holding the moves as JSON
+- a plain <table> with 技名/発生/... headers
+
+Cell values and move names are drawn from the shapes seen in the real data
+(ranges, 着地後N, 全体 N, D, ※ remarks, glued multi-hit spans), and the page
+is padded with navigation and script noise like the real pages.
+bundle_script builds a large script bundle with the frame data at its end,
+for the embedded JSON scan on its own.
+
+    python -m sf_frame_extract.synthetic /tmp/sf_pages --moves 80 --characters ryu ken
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+from html import escape
+from typing import Dict, List, Optional, Sequence
+
+from .constants import ROW_FIELD_CLASSES
+
+# CSS class prefix for each column of the frame table, in page order
+CSS_COLUMNS = [prefix for prefix in ROW_FIELD_CLASSES if prefix not in ('frame_special_correct__', 'frame_knockdown__')]
+
+HEADER_TEXT = {
+    'name': '技名', 'startup': '発生', 'active': '持続', 'recovery': '硬直', 'on_hit': 'ヒット',
+    'on_block': 'ガード', 'damage': 'ダメージ', 'cancel': 'キャンセル', 'combo_scaling': '補正',
+    'attribute': '属性', 'notes': '備考', 'gain_on_hit': 'DRVゲイン(ヒット)',
+    'loss_on_guard': 'DRVロス(ガード)', 'loss_on_punish': 'DRVロス(カウンター)', 'sa_gain': 'SAゲイン',
+}
+
+MOVE_NAMES = [
+    '立ち弱P', '立ち中K', '立ち強P', 'しゃがみ弱K', 'しゃがみ中P', 'しゃがみ強K', 'ジャンプ中K', 'ジャンプ強P',
+    '弱 波動拳', 'OD 波動拳', '強 昇龍拳', '中 竜巻旋風脚', '百裂脚', '鎖骨割り', '旋風脚', '前方転身',
+    'SA1 真空波動拳', 'SA2 真空竜巻旋風脚', 'SA3 真・昇龍拳', 'CA', '背負い投げ', '巴投げ',
+    'ドライブインパクト', 'ドライブパリィ', 'ドライブラッシュ', 'ドライブリバーサル',
+]
+STARTUP_VALUES = ['4', '5', '6', '7', '8', '9', '10', '11', '12', '14', '16', '20', '-', '']
+ACTIVE_VALUES = ['2-3', '4-6', '5-7', '8-10', '4-13', '6-366-11, 13-18, 20-25, 34-36', '13-着地まで', '※21', '-']
+RECOVERY_VALUES = ['10', '14', '17', '22', '31', '全体 45', '着地後3', '26+着地後4', '※21']
+ADVANTAGE_VALUES = ['+1', '+4', '0', '-1', '-2', '-4', '-6', '-9', '-13', '-22', 'D', '-7～1', '※-3', '-', '']
+DAMAGE_VALUES = ['300', '500', '600', '800', '1000', '1200', '2000', '4000', '2200※1850']
+GAUGE_VALUES = ['250', '500', '1000', '2000', '-5000', '-']
+TEXT_VALUES = {
+    'cancel': ['C', 'SA', 'SA3', '※', ''],
+    'combo_scaling': ['始動補正20%', '即時補正10%', ''],
+    'attribute': ['上', '中', '下', '投', '弾'],
+    'notes': ['', '', '空中ガード不能', 'パリィで受け止め可能'],
+}
+
+NAVIGATION_ITEMS = ['トップ', 'キャラクター', 'フレームデータ', 'コンボ', 'ニュース', 'サポート']
+
+
+def css_hash(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_letters + string.digits) for _ in range(5))
+
+
+def random_cell(field: str, rng: random.Random) -> str:
+    if field == 'startup':
+        return rng.choice(STARTUP_VALUES)
+    if field == 'active':
+        return rng.choice(ACTIVE_VALUES)
+    if field == 'recovery':
+        return rng.choice(RECOVERY_VALUES)
+    if field in ('on_hit', 'on_block'):
+        return rng.choice(ADVANTAGE_VALUES)
+    if field == 'damage':
+        return rng.choice(DAMAGE_VALUES)
+    if field in ('gain_on_hit', 'loss_on_guard', 'loss_on_punish', 'sa_gain'):
+        return rng.choice(GAUGE_VALUES)
+    return rng.choice(TEXT_VALUES[field])
+
+
+def random_moves(count: int, rng: random.Random) -> List[Dict[str, str]]:
+    """Raw cell text per field for count moves."""
+    moves = []
+    for index in range(count):
+        move = {'name': f"{rng.choice(MOVE_NAMES)}{'' if index < len(MOVE_NAMES) else f'（{index}）'}"}
+        for prefix in CSS_COLUMNS[1:]:
+            field = ROW_FIELD_CLASSES[prefix]
+            move[field] = random_cell(field, rng)
+        moves.append(move)
+    return moves
+
+
+def css_table(moves: Sequence[Dict[str, str]], rng: random.Random) -> str:
+    """Frame data table with hashed frame_*__ classes, one header row and nested cell markup."""
+    hashes = {prefix: css_hash(rng) for prefix in CSS_COLUMNS}
+    header = ''.join(f'<th class="{prefix}{hashes[prefix]}">{HEADER_TEXT[ROW_FIELD_CLASSES[prefix]]}</th>'
+                     for prefix in CSS_COLUMNS)
+    rows = [f'<tr class="frame_heading__{css_hash(rng)}">{header}</tr>']
+    for move in moves:
+        cells = []
+        for prefix in CSS_COLUMNS:
+            field = ROW_FIELD_CLASSES[prefix]
+            text = escape(move[field])
+            if field == 'name':
+                text = f'<span class="frame_arrow__{css_hash(rng)}"><img src="/key/{rng.randint(1, 9)}.png" alt=""></span>{text}'
+            cells.append(f'<td class="{prefix}{hashes[prefix]} frame_cell__{hashes[CSS_COLUMNS[0]]}"><span>{text}</span></td>')
+        rows.append(f'<tr>{"".join(cells)}</tr>')
+    return f'<table class="frame_table__{css_hash(rng)}"><tbody>{"".join(rows)}</tbody></table>'
+
+
+def plain_table(moves: Sequence[Dict[str, str]]) -> str:
+    """Header/data table without classes, as read by the table strategy."""
+    fields = [ROW_FIELD_CLASSES[prefix] for prefix in CSS_COLUMNS]
+    header = ''.join(f'<th>{HEADER_TEXT[field]}</th>' for field in fields)
+    rows = ''.join(f'<tr>{"".join(f"<td>{escape(move[field])}</td>" for field in fields)}</tr>' for move in moves)
+    return f'<table><tr>{header}</tr>{rows}</table>'
+
+
+def next_data_script(character: str, moves: Sequence[Dict[str, str]]) -> str:
+    next_data = {
+        'props': {'pageProps': {'frameData': {'character': character, 'moves': list(moves)}, 'locale': 'ja-jp'}},
+        'page': '/[lang]/character/[character]/frame',
+        'buildId': 'synthetic',
+    }
+    # "</" must not end the script early
+    payload = json.dumps(next_data, ensure_ascii=False).replace('</', '<\\/')
+    return f'<script id="__NEXT_DATA__" type="application/json">{payload}</script>'
+
+
+def bundle_script(character: str = 'synthetic', moves: int = 80, seed: int = 0, size_kb: int = 2400,
+                  depth: int = 4) -> str:
+    """
+    A minified script bundle of size_kb: modules holding JSON objects nested
+    depth levels deep under "data" keys, with the frame data assigned to
+    window.frameData at the very end. The worst case for the embedded JSON
+    scan, which meets every "data" anchor before the frame data.
+    """
+    rng = random.Random(f"{character}:{seed}")
+    modules = []
+    size = 0
+    while size < size_kb * 1024:
+        value = {'id': rng.randint(0, 9999), 'label': css_hash(rng)}
+        for _ in range(depth):
+            value = {'data': value, 'meta': {'k': css_hash(rng), 'v': [rng.randint(0, 99) for _ in range(8)]}}
+        module = f'var _{css_hash(rng)}={json.dumps(value)};'
+        modules.append(module)
+        size += len(module)
+    frame_data = {'character': character, 'moves': random_moves(moves, rng)}
+    modules.append(f'window.frameData={json.dumps(frame_data, ensure_ascii=False)};')
+    return ''.join(modules)
+
+
+def generate_page(character: str = 'synthetic', moves: int = 80, seed: int = 0, css: bool = True,
+                  next_data: bool = True, table: bool = True, noise_kb: int = 64) -> str:
+    """One page with the requested sources; the same arguments always give the same page."""
+    rng = random.Random(f"{character}:{seed}")
+    move_cells = random_moves(moves, rng)
+
+    head = [
+        '<meta charset="utf-8">',
+        f'<title>{character} | フレームデータ | STREET FIGHTER 6</title>',
+        f'<link rel="stylesheet" href="/_next/static/css/{css_hash(rng)}.css">',
+    ]
+    # Bundled script noise similar in size to the real pages
+    noise = ''.join(f'var _{css_hash(rng)}={{"k":"{css_hash(rng)}","v":[{rng.randint(0, 999)}]}};'
+                    for _ in range(noise_kb * 1024 // 40))
+    head.append(f'<script>{noise}</script>')
+
+    body = [f'<nav><ul>{"".join(f"<li><a href=/{i}>{item}</a></li>" for i, item in enumerate(NAVIGATION_ITEMS))}</ul></nav>']
+    if css:
+        body.append(css_table(move_cells, rng))
+    if table:
+        body.append(plain_table(move_cells))
+    if next_data:
+        body.append(next_data_script(character, move_cells))
+
+    return (f'<!DOCTYPE html><html lang="ja"><head>{"".join(head)}</head>'
+            f'<body><div id="__next"><main>{"".join(body)}</main></div></body></html>')
+
+
+def write_synthetic_pages(output_dir: str, characters: Sequence[str], moves: int = 80, seed: int = 0,
+                          **sources: Optional[bool]) -> List[str]:
+    """Write <character>.html for each character and return the paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for character in characters:
+        path = os.path.join(output_dir, f"{character}.html")
+        page = generate_page(character, moves, seed, **{key: value for key, value in sources.items() if value is not None})
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(page)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write synthetic SF6-style frame data pages')
+    parser.add_argument('output_dir', help='Directory to write <character>.html files to')
+    parser.add_argument('--characters', nargs='+', default=['ryu', 'ken', 'chunli'],
+                        help='Characters to generate pages for (default: ryu, ken, chunli)')
+    parser.add_argument('--moves', type=int, default=80,
+                        help='Moves per page (default: 80)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed (default: 0)')
+    parser.add_argument('--noise-kb', type=int, default=64,
+                        help='Kilobytes of script noise per page (default: 64)')
+    parser.add_argument('--no-css', dest='css', action='store_false',
+                        help='Leave out the frame_*__ CSS table')
+    parser.add_argument('--no-next-data', dest='next_data', action='store_false',
+                        help='Leave out the __NEXT_DATA__ script')
+    parser.add_argument('--no-table', dest='table', action='store_false',
+                        help='Leave out the plain table')
+    args = parser.parse_args()
+
+    paths = write_synthetic_pages(args.output_dir, args.characters, args.moves, args.seed, css=args.css,
+                                  next_data=args.next_data, table=args.table, noise_kb=args.noise_kb)
+    for path in paths:
+        print(f"Wrote {path} ({os.path.getsize(path):,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing and memory accounting for extraction runs.
+
+The extraction code marks its stages with stage('read'), stage('soup'), ...
+These are no-ops unless a StageTimer is recording, so normal runs pay one
+global lookup per stage. While one is recording, each stage adds its wall
+(perf_counter) and CPU (process_time) seconds to the timer. Stages do not
+nest, so the per-character stage times add up to at most its total.
+
+  read        reading the page bytes
+  soup        building the DOM
+  json        decoding embedded JSON (next-data strategy)
+  scan        finding frame rows / table rows in the DOM
+  extract     rows -> move dicts
+  stream      fused read + scan + extract of --streaming
+  categorize  categories and typed values
+  dump        writing the JSON (and packed binary) output
+
+With trace_memory (the CLI's --memory), tracemalloc runs as well. Each stage
+then also records its peak (bytes above the level at stage entry) and the
+bytes it leaves allocated. A snapshot is kept from the end of the stage
+where the most memory was live, which gives the top allocation sites.
+
+The CLI writes the collected timings as a JSON report with --timing, and
+with --cprofile writes a cProfile .prof file plus approximate collapsed
+stacks (for flamegraph.pl / speedscope) per character.
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Dict, Iterator, List, Optional
+
+TIMING_REPORT_FORMAT = 1
+
+_active_timer: Optional['StageTimer'] = None
+
+
+class StageTimer:
+    """Accumulated wall/CPU seconds and call counts (and memory) per stage."""
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.peak_bytes = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_bytes = -1
+
+    def add(self, name: str, wall: float, cpu: float) -> None:
+        totals = self.stages.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'calls': 0})
+        totals['wall'] += wall
+        totals['cpu'] += cpu
+        totals['calls'] += 1
+
+    def add_memory(self, name: str, start: int, current: int, peak: int) -> None:
+        """Record a stage's traced bytes: at entry, at exit and the peak in between."""
+        totals = self.stages[name]
+        totals['peak_bytes'] = max(totals.get('peak_bytes', 0), peak - start)
+        totals['retained_bytes'] = totals.get('retained_bytes', 0) + current - start
+        self.peak_bytes = max(self.peak_bytes, peak)
+        if current > self.snapshot_bytes:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_bytes = current
+
+    def top_allocations(self, limit: int = 10) -> List[Dict]:
+        """Largest allocation sites in the kept snapshot."""
+        if self.snapshot is None:
+            return []
+        snapshot = self.snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ))
+        return [{'site': allocation_site(stat.traceback[0]), 'bytes': stat.size, 'count': stat.count}
+                for stat in snapshot.statistics('lineno')[:limit]]
+
+    def to_json(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(totals) for name, totals in self.stages.items()}
+
+
+def allocation_site(frame: tracemalloc.Frame) -> str:
+    """file:line, with the file relative to the package or site-packages when possible."""
+    filename = frame.filename
+    for root in (os.path.dirname(os.path.dirname(os.path.abspath(__file__))), *sys.path):
+        if root and filename.startswith(root + os.sep):
+            filename = filename[len(root) + 1:]
+            break
+    return f"{filename}:{frame.lineno}"
+
+
+@contextlib.contextmanager
+def recording(timer: StageTimer) -> Iterator[StageTimer]:
+    """Record every stage() entered in this block into timer."""
+    global _active_timer
+    previous, _active_timer = _active_timer, timer
+    try:
+        yield timer
+    finally:
+        _active_timer = previous
+
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    timer = _active_timer
+    if timer is None:
+        yield
+        return
+    if timer.trace_memory:
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - wall, time.process_time() - cpu)
+        if timer.trace_memory:
+            timer.add_memory(name, start, *tracemalloc.get_traced_memory())
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None where the resource module is missing."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def build_timing_report(characters: Dict[str, Dict], wall: float, **run_info) -> Dict:
+    """
+    Combine per-character stats (as returned by process_character) into the
+    report: per character and per stage, plus totals per stage.
+    """
+    totals = {}
+    for stats in characters.values():
+        for name, stage_totals in stats.get('stages', {}).items():
+            total = totals.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'calls': 0})
+            for key in ('wall', 'cpu', 'calls'):
+                total[key] += stage_totals[key]
+            if 'peak_bytes' in stage_totals:
+                total['peak_bytes'] = max(total.get('peak_bytes', 0), stage_totals['peak_bytes'])
+                total['retained_bytes'] = total.get('retained_bytes', 0) + stage_totals['retained_bytes']
+
+    return {
+        'format': TIMING_REPORT_FORMAT,
+        'run': run_info,
+        'wall': wall,
+        'stages': totals,
+        'characters': characters,
+    }
+
+
+def write_timing_report(report: Dict, report_file: str) -> str:
+    directory = os.path.dirname(report_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_file = report_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(report, f, indent=2)
+    os.replace(temp_file, report_file)
+    return report_file
+
+
+def print_timing_summary(report: Dict, slowest: int = 5) -> None:
+    """Stage totals, then the characters with the most wall time."""
+    print(f"\nTiming ({report['wall']:.2f}s wall):")
+    for name, totals in sorted(report['stages'].items(), key=lambda item: -item[1]['wall']):
+        print(f"  {name:<12} {totals['wall']:8.3f}s wall {totals['cpu']:8.3f}s cpu  ({totals['calls']} calls)")
+
+    timed = [(stats['wall'], character) for character, stats in report['characters'].items() if 'wall' in stats]
+    if timed:
+        print("  Slowest characters: " + ', '.join(f"{character} {wall:.3f}s"
+                                               for wall, character in sorted(timed, reverse=True)[:slowest]))
+
+
+def format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def print_memory_summary(characters: Dict[str, Dict], top: int = 5) -> None:
+    """Peak/retained traced memory and peak RSS per character, then the heaviest character's top sites."""
+    traced = {character: stats['memory'] for character, stats in characters.items() if 'memory' in stats}
+    if not traced:
+        return
+    print("\nMemory (tracemalloc):")
+    for character, memory in sorted(traced.items(), key=lambda item: -item[1]['peak_bytes']):
+        rss = characters[character].get('max_rss')
+        print(f"  {character:<12} peak {format_bytes(memory['peak_bytes']):>9}  "
+              f"retained {format_bytes(memory['retained_bytes']):>9}"
+              + (f"  worker RSS {format_bytes(rss):>9}" if rss else ''))
+
+    heaviest = max(traced, key=lambda character: traced[character]['peak_bytes'])
+    print(f"  Top allocation sites for {heaviest}:")
+    for allocation in traced[heaviest]['top_allocations'][:top]:
+        print(f"    {format_bytes(allocation['bytes']):>9} in {allocation['count']:>7,} blocks  {allocation['site']}")
+
+
+def function_label(func) -> str:
+    filename, line, name = func
+    if filename == '~':
+        return name  # built-ins such as <built-in method ...>
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64) -> List[str]:
+    """
+    Approximate collapsed stacks ("root;child;leaf microseconds") from cProfile
+    data. cProfile only keeps caller -> callee edges, so a function's time is
+    split across the paths leading to it in proportion to each edge's share
+    of its cumulative time.
+    """
+    raw = stats.stats
+    callees: Dict[tuple, List[tuple]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(func)
+
+    lines = []
+
+    def walk(func, path, share):
+        # share: fraction of func's total time spent on this path
+        path = path + [func]
+        _, _, self_time, _, _ = raw[func]
+        micros = round(self_time * share * 1e6)
+        if micros > 0:
+            lines.append(f"{';'.join(map(function_label, path))} {micros}")
+        if len(path) >= max_depth:
+            return
+        for callee in callees.get(func, ()):
+            if callee in path:
+                continue  # recursion: its time is already under the outer frame
+            callee_cumulative = raw[callee][3]
+            edge_cumulative = raw[callee][4][func][3]
+            if callee_cumulative and share * edge_cumulative * 1e6 >= 1:
+                walk(callee, path, share * edge_cumulative / callee_cumulative)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, [], 1.0)
+    return lines
+
+
+def run_profiled(profile_prefix: str, func, *args, **kwargs):
+    """Call func under cProfile and write <prefix>.prof and <prefix>.collapsed."""
+    directory = os.path.dirname(profile_prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(f"{profile_prefix}.prof")
+        with open(f"{profile_prefix}.collapsed", 'w', encoding='utf-8', newline='\n') as f:
+            f.writelines(line + '\n' for line in collapsed_stacks(pstats.Stats(profiler)))
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Frame data cell value cleanup and the typed reading of each cell.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+def clean_frame_value(value: str) -> Any:
+    """
+    Clean and parse frame data values.
+    Returns None for empty cells, 'D' for knockdown, an int when the cell is a
+    plain number and the stripped text otherwise (ranges like "4-6", "着地後3",
+    "全体45", ...).
+    """
+    if not value or value == '-':
+        return None
+
+    value = value.strip()
+
+    # Handle special cases
+    if value.upper() == 'D':
+        return 'D'
+
+    # Try to convert to int
+    try:
+        return int(value)
+    except ValueError:
+        pass
+
+    return value
+
+
+# extract_frame_data.py used this name for the same parser
+parse_frame_value = clean_frame_value
+
+
+# Typed frame values
+#
+# parse_typed_value turns a cell (int, None or the text kept by
+# clean_frame_value) into a FrameValue:
+#
+#   kind       example cells             low / high               landing
+#   int        5, "※21"                  5 / 5
+#   interval   "4-6", "-7～1", "2-4, 8-9"  smallest / largest number
+#   knockdown  "D", "D+30"               advantage / advantage (None if not given)
+#   landing    "着地後3", "26+着地後4"    frames before landing    frames after landing
+#              "8-着地まで"              8 / None
+#   total      "全体 45"                 None / None              (total = 45)
+#   text       anything else             None / None
+#
+# note is set when the cell carries a ※ remark; only the primary reading is
+# kept (e.g. "2200※1850" -> 2200). Multi-hit active cells arrive as the
+# overall span glued to its breakdown ("6-36" + "6-11, 13-18, ..." ->
+# "6-366-11, 13-18, ..."); the span is recovered because the breakdown
+# starts with the same frame and ends inside the span. Numeric consumers use low/high and never look
+# at the text again. A total ("全体") is the whole move's duration, not the
+# cell's own frame count, so it is kept apart in total and stays out of the
+# low/high columns.
+
+INT_PATTERN = re.compile(r'[+-]?\d+')
+KNOCKDOWN_PATTERN = re.compile(r'D\s*(?:([+-]\d+))?', re.IGNORECASE)
+TOTAL_PATTERN = re.compile(r'全体\s*(\d+)')
+LANDING_PATTERN = re.compile(r'(?:(\d+)\s*\+\s*)?着地後?\s*(\d+)')
+UNTIL_LANDING_PATTERN = re.compile(r'(\d+)\s*-\s*着地まで')
+NUMBER_LIST_PATTERN = re.compile(r'[\d\s,、.\-～+]+')
+# A minus sign only when it does not follow a digit ("5-7" is a range, "-7" a number)
+SIGNED_NUMBER_PATTERN = re.compile(r'(?<!\d)-?\d+')
+BRACKET_NOTE_PATTERN = re.compile(r'^\[※[^\]]*\]\s*')
+# "<first>-<last><first>..." : shortest <last> after which the breakdown repeats <first>
+GLUED_SPAN_PATTERN = re.compile(r'(\d+)-\s*(\d+?)\1(?=[-,、\s])')
+
+# Cells that mean "no value"
+EMPTY_CELLS = {'', '-', '―', 'ー'}
+
+FRAME_VALUE_KINDS = ('int', 'interval', 'knockdown', 'landing', 'total', 'text')
+
+
+class FrameValue(NamedTuple):
+    kind: str
+    low: Optional[int] = None
+    high: Optional[int] = None
+    landing: Optional[int] = None
+    total: Optional[int] = None
+    note: bool = False
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.low is not None
+
+    def to_json(self) -> Dict[str, Any]:
+        data = {'kind': self.kind, 'low': self.low, 'high': self.high}
+        if self.landing is not None:
+            data['landing'] = self.landing
+        if self.total is not None:
+            data['total'] = self.total
+        if self.note:
+            data['note'] = True
+        return data
+
+
+def primary_reading(text: str) -> Tuple[str, bool]:
+    """Drop ※ remarks, returning the main reading and whether a remark was present."""
+    if '※' not in text:
+        return text, False
+    text = BRACKET_NOTE_PATTERN.sub('', text)
+    head, _, tail = text.partition('※')
+    head = head.strip()
+    # "2200※1850" keeps 2200; "※21" and "全体 ※13" just lose the marker
+    if head and head[-1].isdigit():
+        return head, True
+    return f"{head} {tail}".strip(), True
+
+
+def glued_span(text: str) -> Optional[Tuple[int, int]]:
+    """
+    (first, last) of an overall span glued to its breakdown, or None. The span
+    must cover the whole breakdown: "2-22, 24-30" is two ranges, not the span
+    2-2 followed by "2, 24-30".
+    """
+    match = GLUED_SPAN_PATTERN.match(text)
+    if not match:
+        return None
+    first, last = int(match.group(1)), int(match.group(2))
+    breakdown = [int(number) for number in SIGNED_NUMBER_PATTERN.findall(text, match.end(2))]
+    if last < first or any(number > last for number in breakdown):
+        return None
+    return first, last
+
+
+@lru_cache(maxsize=None)
+def parse_typed_value(value: Any) -> Optional[FrameValue]:
+    """
+    Parse a cleaned cell into a FrameValue (None for empty cells). Memoised:
+    the same cell strings repeat thousands of times across the roster.
+    """
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return FrameValue('int', value, value)
+
+    text = value.strip()
+    if text in EMPTY_CELLS:
+        return None
+
+    text, note = primary_reading(text)
+
+    if INT_PATTERN.fullmatch(text):
+        number = int(text)
+        return FrameValue('int', number, number, note=note)
+
+    match = KNOCKDOWN_PATTERN.fullmatch(text)
+    if match:
+        advantage = int(match.group(1)) if match.group(1) else None
+        return FrameValue('knockdown', advantage, advantage, note=note)
+
+    match = TOTAL_PATTERN.fullmatch(text)
+    if match:
+        return FrameValue('total', total=int(match.group(1)), note=note)
+
+    match = LANDING_PATTERN.fullmatch(text)
+    if match:
+        before = int(match.group(1)) if match.group(1) else None
+        return FrameValue('landing', before, before, int(match.group(2)), note=note)
+
+    match = UNTIL_LANDING_PATTERN.match(text)
+    if match:
+        return FrameValue('landing', int(match.group(1)), None, note=note)
+
+    if NUMBER_LIST_PATTERN.fullmatch(text):
+        span = glued_span(text)
+        if span:
+            return FrameValue('interval', *span, note=note)
+        numbers = [int(number) for number in SIGNED_NUMBER_PATTERN.findall(text)]
+        if numbers:
+            return FrameValue('interval', min(numbers), max(numbers), note=note)
+
+    return FrameValue('text', note=note)
+
+
+# Cells given a typed reading in each move's "typed" block
+TYPED_FRAME_FIELDS = ('startup', 'active', 'recovery', 'on_hit', 'on_block')
+
+
+def typed_move_values(move: Dict) -> Dict[str, Optional[FrameValue]]:
+    """Typed readings of a move's frame cells and damage (roster, ryu or flat structure)."""
+    frames = move['frames']
+    values = {field: parse_typed_value(frames.get(field)) for field in TYPED_FRAME_FIELDS}
+    values['damage'] = parse_typed_value(move.get('properties', move).get('damage'))
+    return values
+
+
+def move_numbers(move: Dict) -> Dict[str, Optional[FrameValue]]:
+    """Typed readings of one move, from its "typed" block or parsed from the raw cells."""
+    typed = move.get('typed')
+    if typed is None:
+        return typed_move_values(move)
+    return {field: FrameValue(**typed[field]) if typed.get(field) else None
+            for field in TYPED_FRAME_FIELDS + ('damage',)}
+
+
+def add_typed_values(moves: List[Dict]) -> None:
+    """Store each move's typed readings next to the raw cells, under "typed"."""
+    for move in moves:
+        move['typed'] = {field: value.to_json() if value else None
+                         for field, value in typed_move_values(move).items()}
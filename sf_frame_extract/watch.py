@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Watch mode: re-extract pages as they land in the input directory.
+
+On Linux the directory is watched with inotify (through ctypes, for files
+closed after writing and files renamed into place); elsewhere, or when
+inotify is unavailable, its listing is polled. A burst of writes is
+debounced: once a page changes, changes keep being collected until the
+directory has been quiet for the debounce interval, and the changed pages
+are then handed over as one batch.
+
+The extraction itself runs in the watching process, so imported parser
+backends, compiled patterns, the build manifest and the extractor version
+stay warm between batches.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_POLL_INTERVAL = 1.0
+
+# From <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def is_page(name: str) -> bool:
+    return name.endswith('.html')
+
+
+def list_pages(directory: str) -> Set[str]:
+    return {entry.name for entry in os.scandir(directory) if entry.is_file() and is_page(entry.name)}
+
+
+class InotifyWatcher:
+    """Report pages closed after writing or moved into the directory."""
+
+    name = 'inotify'
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f'inotify_add_watch failed for {directory}')
+
+    def changes(self, timeout: Optional[float]) -> Set[str]:
+        """Pages changed within timeout seconds (None waits for the first change)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        names = set()
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; treat every page as changed
+                names |= list_pages(self.directory)
+            elif is_page(name):
+                names.add(name)
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Report pages whose size or modification time changed since the last scan."""
+
+    name = 'polling'
+
+    def __init__(self, directory: str, interval: float = DEFAULT_POLL_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        self.seen = self.scan()
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        seen = {}
+        for name in list_pages(self.directory):
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            seen[name] = (stat.st_size, stat.st_mtime_ns)
+        return seen
+
+    def changes(self, timeout: Optional[float]) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+            seen = self.scan()
+            names = {name for name, signature in seen.items() if self.seen.get(name) != signature}
+            self.seen = seen
+            if names or (deadline is not None and time.monotonic() >= deadline):
+                return names
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(directory: str, polling: bool = False, poll_interval: float = DEFAULT_POLL_INTERVAL):
+    """inotify where available, otherwise polling."""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}); polling every {poll_interval:g}s instead")
+    return PollingWatcher(directory, poll_interval)
+
+
+def watch_directory(directory: str, on_change: Callable[[List[str]], None], debounce: float = DEFAULT_DEBOUNCE,
+                    polling: bool = False, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+    """
+    Call on_change with the character ids of each debounced batch of changed
+    pages, until interrupted with Ctrl+C.
+    """
+    watcher = open_watcher(directory, polling, poll_interval)
+    print(f"\nWatching {directory} for changed pages ({watcher.name}); press Ctrl+C to stop")
+    try:
+        while True:
+            changed = watcher.changes(None)
+            while changed:
+                more = watcher.changes(debounce)
+                if not more:
+                    break
+                changed |= more
+            if changed:
+                on_change(sorted(name[:-len('.html')] for name in changed))
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        watcher.close()
@@ -1,4 +1,4 @@
-import { CHARACTERS } from './data/characters';
+import { CHARACTER_INDEX } from './data/characters';
 import { useFrameChecker } from './hooks/useFrameChecker';
 import { HeaderSection } from './components/HeaderSection';
 import { CharacterSelectionSection } from './components/CharacterSelectionSection';
@@ -27,7 +27,7 @@ const App = () => {
 
         <div className="max-w-6xl mx-auto mb-8">
           <CharacterSelectionSection
-            characters={CHARACTERS}
+            characters={CHARACTER_INDEX}
             attackerCharacter={attackerCharacter}
             defenderCharacter={defenderCharacter}
             onAttackerChange={setAttackerCharacter}
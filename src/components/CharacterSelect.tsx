@@ -1,7 +1,7 @@
-import { Character } from '../types/frameData';
+import { CharacterSummary } from '../types/frameData';
 
 interface CharacterSelectProps {
-  characters: Character[];
+  characters: CharacterSummary[];
   selectedCharacter: string;
   onCharacterChange: (characterId: string) => void;
   label: string;
@@ -1,9 +1,9 @@
 import { Sword } from 'lucide-react';
-import { Character } from '../types/frameData';
+import { CharacterSummary } from '../types/frameData';
 import { CharacterSelect } from './CharacterSelect';
 
 interface CharacterSelectionSectionProps {
-  characters: Character[];
+  characters: CharacterSummary[];
   attackerCharacter: string;
   defenderCharacter: string;
   onAttackerChange: (characterId: string) => void;
@@ -1,97 +1,90 @@
-import { Character } from '../types/frameData';
-import ryuData from './ryu_frame_data_structured.json';
-import kenData from './ken_frame_data_structured.json';
-import chunliData from './chunli_frame_data_structured.json';
-import lukeData from './luke_frame_data_structured.json';
-import cammyData from './cammy_frame_data_structured.json';
-import akiData from './aki_frame_data_structured.json';
-import blankaData from './blanka_frame_data_structured.json';
-import deejayData from './deejay_frame_data_structured.json';
-import dhalsimData from './dhalsim_frame_data_structured.json';
-import edData from './ed_frame_data_structured.json';
-import ehondaData from './ehonda_frame_data_structured.json';
-import elenaData from './elena_frame_data_structured.json';
-import goukiData from './gouki_frame_data_structured.json';
-import guileData from './guile_frame_data_structured.json';
-import jamieData from './jamie_frame_data_structured.json';
-import jpData from './jp_frame_data_structured.json';
-import juriData from './juri_frame_data_structured.json';
-import kimberlyData from './kimberly_frame_data_structured.json';
-import lilyData from './lily_frame_data_structured.json';
-import maiData from './mai_frame_data_structured.json';
-import manonData from './manon_frame_data_structured.json';
-import marisaData from './marisa_frame_data_structured.json';
-import rashidData from './rashid_frame_data_structured.json';
-import sagatData from './sagat_frame_data_structured.json';
-import terryData from './terry_frame_data_structured.json';
-import vegaMbisonData from './vega_mbison_frame_data_structured.json';
-import zangiefData from './zangief_frame_data_structured.json';
+// Generated by python -m sf_frame_extract from data_manifest.json; do not edit.
+import { Character, CharacterSummary } from '../types/frameData';
 
-export const RYU_CHARACTER: Character = ryuData as Character;
-export const KEN_CHARACTER: Character = kenData as Character;
-export const CHUNLI_CHARACTER: Character = chunliData as Character;
-export const LUKE_CHARACTER: Character = lukeData as Character;
-export const CAMMY_CHARACTER: Character = cammyData as Character;
-export const AKI_CHARACTER: Character = akiData as Character;
-export const BLANKA_CHARACTER: Character = blankaData as Character;
-export const DEEJAY_CHARACTER: Character = deejayData as Character;
-export const DHALSIM_CHARACTER: Character = dhalsimData as Character;
-export const ED_CHARACTER: Character = edData as Character;
-export const EHONDA_CHARACTER: Character = ehondaData as Character;
-export const ELENA_CHARACTER: Character = elenaData as Character;
-export const GOUKI_CHARACTER: Character = goukiData as Character;
-export const GUILE_CHARACTER: Character = guileData as Character;
-export const JAMIE_CHARACTER: Character = jamieData as Character;
-export const JP_CHARACTER: Character = jpData as Character;
-export const JURI_CHARACTER: Character = juriData as Character;
-export const KIMBERLY_CHARACTER: Character = kimberlyData as Character;
-export const LILY_CHARACTER: Character = lilyData as Character;
-export const MAI_CHARACTER: Character = maiData as Character;
-export const MANON_CHARACTER: Character = manonData as Character;
-export const MARISA_CHARACTER: Character = marisaData as Character;
-export const RASHID_CHARACTER: Character = rashidData as Character;
-export const SAGAT_CHARACTER: Character = sagatData as Character;
-export const TERRY_CHARACTER: Character = terryData as Character;
-export const VEGA_MBISON_CHARACTER: Character = vegaMbisonData as Character;
-export const ZANGIEF_CHARACTER: Character = zangiefData as Character;
-
-export const CHARACTERS: Character[] = [
-  RYU_CHARACTER,
-  KEN_CHARACTER,
-  CHUNLI_CHARACTER,
-  LUKE_CHARACTER,
-  CAMMY_CHARACTER,
-  AKI_CHARACTER,
-  BLANKA_CHARACTER,
-  DEEJAY_CHARACTER,
-  DHALSIM_CHARACTER,
-  ED_CHARACTER,
-  EHONDA_CHARACTER,
-  ELENA_CHARACTER,
-  GOUKI_CHARACTER,
-  GUILE_CHARACTER,
-  JAMIE_CHARACTER,
-  JP_CHARACTER,
-  JURI_CHARACTER,
-  KIMBERLY_CHARACTER,
-  LILY_CHARACTER,
-  MAI_CHARACTER,
-  MANON_CHARACTER,
-  MARISA_CHARACTER,
-  RASHID_CHARACTER,
-  SAGAT_CHARACTER,
-  TERRY_CHARACTER,
-  VEGA_MBISON_CHARACTER,
-  ZANGIEF_CHARACTER
+// Loaded up front: just enough to fill the character selects
+export const CHARACTER_INDEX: CharacterSummary[] = [
+  { character: 'ryu', character_name: { japanese: 'リュウ', english: 'Ryu' } },
+  { character: 'ken', character_name: { japanese: 'ケン', english: 'Ken' } },
+  { character: 'chunli', character_name: { japanese: '春麗', english: 'Chun-Li' } },
+  { character: 'luke', character_name: { japanese: 'ルーク', english: 'Luke' } },
+  { character: 'cammy', character_name: { japanese: 'キャミィ', english: 'Cammy' } },
+  { character: 'aki', character_name: { japanese: 'A.K.I.', english: 'A.K.I.' } },
+  { character: 'blanka', character_name: { japanese: 'ブランカ', english: 'Blanka' } },
+  { character: 'deejay', character_name: { japanese: 'ディージェイ', english: 'Dee Jay' } },
+  { character: 'dhalsim', character_name: { japanese: 'ダルシム', english: 'Dhalsim' } },
+  { character: 'ed', character_name: { japanese: 'エド', english: 'Ed' } },
+  { character: 'ehonda', character_name: { japanese: 'E.本田', english: 'E. Honda' } },
+  { character: 'elena', character_name: { japanese: 'エレナ', english: 'Elena' } },
+  { character: 'gouki', character_name: { japanese: '豪鬼', english: 'Akuma' } },
+  { character: 'guile', character_name: { japanese: 'ガイル', english: 'Guile' } },
+  { character: 'jamie', character_name: { japanese: 'ジェイミー', english: 'Jamie' } },
+  { character: 'jp', character_name: { japanese: 'JP', english: 'JP' } },
+  { character: 'juri', character_name: { japanese: 'ジュリ', english: 'Juri' } },
+  { character: 'kimberly', character_name: { japanese: 'キンバリー', english: 'Kimberly' } },
+  { character: 'lily', character_name: { japanese: 'リリー', english: 'Lily' } },
+  { character: 'mai', character_name: { japanese: '不知火舞', english: 'Mai Shiranui' } },
+  { character: 'manon', character_name: { japanese: 'マノン', english: 'Manon' } },
+  { character: 'marisa', character_name: { japanese: 'マリーザ', english: 'Marisa' } },
+  { character: 'rashid', character_name: { japanese: 'ラシード', english: 'Rashid' } },
+  { character: 'sagat', character_name: { japanese: 'サガット', english: 'Sagat' } },
+  { character: 'terry', character_name: { japanese: 'テリー・ボガード', english: 'Terry Bogard' } },
+  { character: 'vega_mbison', character_name: { japanese: 'ベガ', english: 'M. Bison' } },
+  { character: 'zangief', character_name: { japanese: 'ザンギエフ', english: 'Zangief' } },
 ];
 
-export const getCharacterById = (id: string): Character | undefined => {
-  return CHARACTERS.find(character => character.character === id);
+// One chunk per character, fetched the first time it is selected
+const LOADERS: Record<string, () => Promise<{ default: unknown }>> = {
+  ryu: () => import('./ryu_frame_data_structured.json'),
+  ken: () => import('./ken_frame_data_structured.json'),
+  chunli: () => import('./chunli_frame_data_structured.json'),
+  luke: () => import('./luke_frame_data_structured.json'),
+  cammy: () => import('./cammy_frame_data_structured.json'),
+  aki: () => import('./aki_frame_data_structured.json'),
+  blanka: () => import('./blanka_frame_data_structured.json'),
+  deejay: () => import('./deejay_frame_data_structured.json'),
+  dhalsim: () => import('./dhalsim_frame_data_structured.json'),
+  ed: () => import('./ed_frame_data_structured.json'),
+  ehonda: () => import('./ehonda_frame_data_structured.json'),
+  elena: () => import('./elena_frame_data_structured.json'),
+  gouki: () => import('./gouki_frame_data_structured.json'),
+  guile: () => import('./guile_frame_data_structured.json'),
+  jamie: () => import('./jamie_frame_data_structured.json'),
+  jp: () => import('./jp_frame_data_structured.json'),
+  juri: () => import('./juri_frame_data_structured.json'),
+  kimberly: () => import('./kimberly_frame_data_structured.json'),
+  lily: () => import('./lily_frame_data_structured.json'),
+  mai: () => import('./mai_frame_data_structured.json'),
+  manon: () => import('./manon_frame_data_structured.json'),
+  marisa: () => import('./marisa_frame_data_structured.json'),
+  rashid: () => import('./rashid_frame_data_structured.json'),
+  sagat: () => import('./sagat_frame_data_structured.json'),
+  terry: () => import('./terry_frame_data_structured.json'),
+  vega_mbison: () => import('./vega_mbison_frame_data_structured.json'),
+  zangief: () => import('./zangief_frame_data_structured.json'),
+};
+
+const loaded = new Map<string, Promise<Character>>();
+
+export const loadCharacter = (id: string): Promise<Character> => {
+  let character = loaded.get(id);
+  if (!character) {
+    const loader = LOADERS[id];
+    if (!loader) return Promise.reject(new Error(`Unknown character: ${id}`));
+    character = loader().then(module => module.default as Character);
+    // Forget failed loads so selecting the character again retries
+    character.catch(() => loaded.delete(id));
+    loaded.set(id, character);
+  }
+  return character;
 };
 
-export const getCharacterByName = (name: string): Character | undefined => {
-  return CHARACTERS.find(character => 
+export const getCharacterSummaryById = (id: string): CharacterSummary | undefined => {
+  return CHARACTER_INDEX.find(character => character.character === id);
+};
+
+export const getCharacterSummaryByName = (name: string): CharacterSummary | undefined => {
+  return CHARACTER_INDEX.find(character =>
     character.character_name.english.toLowerCase() === name.toLowerCase() ||
     character.character_name.japanese === name
   );
-};
\ No newline at end of file
+};
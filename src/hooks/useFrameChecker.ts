@@ -1,20 +1,34 @@
-import { useState, useMemo } from 'react';
-import { CHARACTERS } from '../data/characters';
+import { useState, useMemo, useEffect } from 'react';
+import { loadCharacter } from '../data/characters';
+import { Character } from '../types/frameData';
+
+// Data for the selected character, undefined until its chunk has loaded
+const useCharacterData = (characterId: string): Character | undefined => {
+  const [data, setData] = useState<Character>();
+
+  useEffect(() => {
+    if (!characterId) return;
+    let current = true;
+    loadCharacter(characterId)
+      .then(character => {
+        if (current) setData(character);
+      })
+      .catch(error => console.error(error));
+    return () => {
+      current = false;
+    };
+  }, [characterId]);
+
+  return data?.character === characterId ? data : undefined;
+};
 
 export const useFrameChecker = () => {
   const [attackerCharacter, setAttackerCharacter] = useState('');
   const [defenderCharacter, setDefenderCharacter] = useState('');
   const [selectedMove, setSelectedMove] = useState('');
 
-  const attackerData = useMemo(() =>
-    CHARACTERS.find(char => char.character === attackerCharacter),
-    [attackerCharacter]
-  );
-
-  const defenderData = useMemo(() =>
-    CHARACTERS.find(char => char.character === defenderCharacter),
-    [defenderCharacter]
-  );
+  const attackerData = useCharacterData(attackerCharacter);
+  const defenderData = useCharacterData(defenderCharacter);
 
   const selectedMoveData = useMemo(() => {
     if (!attackerData || selectedMove === '') return null;
@@ -11,6 +11,21 @@ export interface FrameData {
   on_block: number | null;
 }
 
+// Typed reading of a raw frame cell, written by the extractor next to the raw
+// text. low/high are the numeric bounds (equal for plain numbers, null when
+// the cell has no number); landing is frames after landing and total the
+// whole move's duration ("全体 45"), which is not a bound of the cell itself.
+export interface TypedFrameValue {
+  kind: 'int' | 'interval' | 'knockdown' | 'landing' | 'total' | 'text';
+  low: number | null;
+  high: number | null;
+  landing?: number;
+  total?: number;
+  note?: boolean;
+}
+
+export type TypedMoveValues = Record<keyof FrameData | 'damage', TypedFrameValue | null>;
+
 export interface MoveProperties {
   damage: number | null;
   cancel: string;
@@ -41,12 +56,19 @@ export interface Move {
   properties: MoveProperties;
   drive_system: DriveSystemData;
   sa_gain: number | null;
+  typed?: TypedMoveValues;
 }
 
 export interface CategoryData extends LocalizedName {
   moves: number[];
 }
 
+// What the character selects need, loaded before any character data
+export interface CharacterSummary {
+  character: string;
+  character_name: LocalizedName;
+}
+
 export interface Character {
   character: string;
   character_name: LocalizedName;